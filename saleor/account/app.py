@@ -1,16 +1,54 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save
 
 
 class AccountAppConfig(AppConfig):
     name = "saleor.account"
 
     def ready(self):
-        from .models import User
-        from .signals import delete_avatar
+        from ..channel.models import Channel
+        from .models import Group, User
+        from .signals import (
+            delete_avatar,
+            invalidate_jwt_user_cache_on_change,
+            invalidate_jwt_user_cache_on_relation_change,
+            invalidate_jwt_user_cache_on_user_change,
+        )
 
         post_delete.connect(
             delete_avatar,
             sender=User,
             dispatch_uid="delete_user_avatar",
         )
+        post_save.connect(
+            invalidate_jwt_user_cache_on_user_change,
+            sender=User,
+            dispatch_uid="invalidate_jwt_user_cache_on_user_save",
+        )
+        post_delete.connect(
+            invalidate_jwt_user_cache_on_user_change,
+            sender=User,
+            dispatch_uid="invalidate_jwt_user_cache_on_user_delete",
+        )
+        for model in (Group, Channel):
+            post_save.connect(
+                invalidate_jwt_user_cache_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_jwt_user_cache_on_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_jwt_user_cache_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_jwt_user_cache_on_{model.__name__}_delete",
+            )
+        for through in (
+            User.groups.through,
+            User.user_permissions.through,
+            Group.permissions.through,
+            Group.channels.through,
+        ):
+            m2m_changed.connect(
+                invalidate_jwt_user_cache_on_relation_change,
+                sender=through,
+                dispatch_uid=f"invalidate_jwt_user_cache_on_{through.__name__}_change",
+            )
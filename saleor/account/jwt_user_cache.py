@@ -0,0 +1,86 @@
+"""Cache of users authenticated with access tokens.
+
+Authenticating a request with an access token loads the user by the email from the
+token, and permission checks then query the user's effective permissions. The
+user, the names of their effective permissions and, for staff users, the channels
+they can access are kept in the shared cache under the identity of the token: the
+user's ID and a keyed digest of their `jwt_token_key`.
+
+Entries are versioned with a counter per user, bumped when the user is saved or
+deleted, and with a global counter, bumped on changes of groups, permissions and
+channels. Bulk updates of users bump the counters of updated users explicitly;
+entries also expire after `JWT_USER_CACHE_TIMEOUT`.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+import graphene
+from django.conf import settings
+from django.core.cache import cache
+
+from ..app.token_cache import get_token_digest
+from ..core.utils.cache import bump_cache_version_on_commit
+from .models import User
+
+if TYPE_CHECKING:
+    from ..channel.models import Channel
+
+JWT_USER_CACHE_KEY = "jwt_user:{version}:{user_version}:{user_id}:{digest}"
+JWT_USER_CACHE_VERSION_KEY = "jwt_user_cache_version"
+JWT_USER_CACHE_USER_VERSION_KEY = "jwt_user_cache_version:{user_id}"
+
+
+@dataclass
+class CachedJWTUser:
+    user: User
+    # Effective permissions in the `app_label.codename` format.
+    permissions: set[str]
+    # Channels accessible by a staff user, `None` for customers.
+    accessible_channels: Optional[list["Channel"]] = None
+
+
+def get_jwt_user_cache_key(payload: dict[str, Any]) -> Optional[str]:
+    """Return the cache key of the user authenticated with the token's payload."""
+    try:
+        _, user_id = graphene.Node.from_global_id(payload["user_id"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    user_version_key = JWT_USER_CACHE_USER_VERSION_KEY.format(user_id=user_id)
+    versions = cache.get_many([JWT_USER_CACHE_VERSION_KEY, user_version_key])
+    return JWT_USER_CACHE_KEY.format(
+        version=versions.get(JWT_USER_CACHE_VERSION_KEY, 0),
+        user_version=versions.get(user_version_key, 0),
+        user_id=user_id,
+        digest=get_token_digest(payload["token"]),
+    )
+
+
+def get_cached_jwt_user(key: str, payload: dict[str, Any]) -> Optional[CachedJWTUser]:
+    cached = cache.get(key)
+    if cached is None or cached.user.email != payload["email"]:
+        return None
+    return cached
+
+
+def cache_jwt_user(key: str, cached_user: CachedJWTUser):
+    cache.set(key, cached_user, timeout=settings.JWT_USER_CACHE_TIMEOUT.total_seconds())
+
+
+def invalidate_jwt_user_cache():
+    """Invalidate cached users in every process."""
+    bump_cache_version_on_commit(JWT_USER_CACHE_VERSION_KEY)
+
+
+def invalidate_jwt_user_cache_for_user(user_id: int):
+    """Invalidate the cached user in every process."""
+    bump_cache_version_on_commit(
+        JWT_USER_CACHE_USER_VERSION_KEY.format(user_id=user_id)
+    )
+
+
+def invalidate_jwt_user_cache_for_users(user_ids: Iterable[int]):
+    """Invalidate cached users updated in bulk, which doesn't send signals."""
+    for user_id in user_ids:
+        invalidate_jwt_user_cache_for_user(user_id)
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
 from django.db.models import Q, Value, prefetch_related_objects
 
 from ..core.postgres import NoValidationSearchVector
@@ -19,6 +21,8 @@ ADDRESS_SEARCH_FIELDS = [
     "country",
     "phone",
 ]
+# Trigram index can't narrow down the search by terms shorter than a trigram.
+TRIGRAM_LENGTH = 3
 
 
 def prepare_user_search_document_value(
@@ -108,8 +112,40 @@ def generate_address_search_vector_value(
 
 def search_users(qs, value):
     if value:
+        if settings.USER_SEARCH_RANKED:
+            return search_users_ranked(qs, value, settings.USER_SEARCH_MAX_RESULTS)
         lookup = Q()
         for val in value.split():
             lookup &= Q(search_document__ilike=val.lower())
         qs = qs.filter(lookup)
     return qs
+
+
+def search_users_ranked(qs, value, limit):
+    """Return at most `limit` users matching all words of the value.
+
+    The users are picked by the trigram similarity of their `search_document` to
+    the value, which is served by the trigram index on `search_document`, and are
+    returned annotated with `search_rank` and ordered by it. The similarity is
+    computed for the picked users only. When all words are shorter than a trigram,
+    the index can't be used and the first matches are returned without ranking, so
+    the scan stops after `limit` rows.
+    """
+    words = [val.lower() for val in value.split()]
+    lookup = Q()
+    for word in words:
+        lookup &= Q(search_document__ilike=word)
+    matches = qs.filter(lookup)
+    if not any(len(word) >= TRIGRAM_LENGTH for word in words):
+        return qs.filter(pk__in=matches.order_by().values("pk")[:limit])
+    search_rank = TrigramSimilarity("search_document", " ".join(words))
+    ranked_pks = (
+        matches.annotate(search_rank=search_rank)
+        .order_by("-search_rank", "pk")
+        .values("pk")[:limit]
+    )
+    return (
+        qs.filter(pk__in=ranked_pks)
+        .annotate(search_rank=search_rank)
+        .order_by("-search_rank", "pk")
+    )
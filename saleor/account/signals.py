@@ -1,6 +1,23 @@
 from ..core.tasks import delete_from_storage_task
+from .jwt_user_cache import (
+    invalidate_jwt_user_cache,
+    invalidate_jwt_user_cache_for_user,
+)
 
 
 def delete_avatar(sender, instance, **kwargs):
     if avatar := instance.avatar:
         delete_from_storage_task.delay(avatar.name)
+
+
+def invalidate_jwt_user_cache_on_user_change(sender, instance, **kwargs):
+    invalidate_jwt_user_cache_for_user(instance.pk)
+
+
+def invalidate_jwt_user_cache_on_change(sender, instance, **kwargs):
+    invalidate_jwt_user_cache()
+
+
+def invalidate_jwt_user_cache_on_relation_change(sender, instance, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_jwt_user_cache()
@@ -0,0 +1,147 @@
+import pytest
+from jwt import InvalidTokenError
+
+from ...core.auth_backend import JSONWebTokenBackend
+from ...core.jwt import create_access_token, jwt_decode
+from ...graphql.account.bulk_mutations.user_bulk_set_active import (
+    UserBulkSetActive,
+)
+from ...graphql.account.dataloaders import AccessibleChannelsByUserIdLoader
+from ..jwt_user_cache import get_jwt_user_cache_key
+from ..models import User
+
+
+@pytest.fixture
+def jwt_user_cache_enabled(settings, _clear_jwt_user_cache):
+    settings.JWT_USER_CACHE_ENABLED = True
+    return settings
+
+
+def _authenticate(rf, token):
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {token}")
+    return request, JSONWebTokenBackend().authenticate(request)
+
+
+def _get_permission_name(permission):
+    return f"{permission.content_type.app_label}.{permission.codename}"
+
+
+def test_authenticate_user_from_cache(
+    jwt_user_cache_enabled,
+    rf,
+    permission_group_manage_users,
+    permission_manage_users,
+    channel_USD,
+    django_assert_num_queries,
+):
+    # given
+    staff_user = permission_group_manage_users.user_set.get()
+    token = create_access_token(staff_user)
+    _authenticate(rf, token)
+
+    # when
+    with django_assert_num_queries(0):
+        request, user = _authenticate(rf, token)
+        has_perm = user.has_perm(_get_permission_name(permission_manage_users))
+        channels = AccessibleChannelsByUserIdLoader(request).load(user.pk).get()
+
+    # then
+    assert user == staff_user
+    assert has_perm is True
+    assert channels == [channel_USD]
+
+
+def test_authenticate_user_cache_disabled(
+    rf, staff_user, settings, django_assert_num_queries
+):
+    # given
+    settings.JWT_USER_CACHE_ENABLED = False
+    token = create_access_token(staff_user)
+    _authenticate(rf, token)
+
+    # when
+    with django_assert_num_queries(1):
+        _, user = _authenticate(rf, token)
+
+    # then
+    assert user == staff_user
+
+
+def test_cached_user_invalidated_on_group_permissions_change(
+    jwt_user_cache_enabled,
+    rf,
+    permission_group_manage_users,
+    permission_manage_users,
+):
+    # given
+    staff_user = permission_group_manage_users.user_set.get()
+    token = create_access_token(staff_user)
+    _, user = _authenticate(rf, token)
+    assert user.has_perm(_get_permission_name(permission_manage_users))
+
+    # when
+    permission_group_manage_users.permissions.remove(permission_manage_users)
+
+    # then
+    _, user = _authenticate(rf, token)
+    assert not user.has_perm(_get_permission_name(permission_manage_users))
+
+
+def test_cached_user_invalidated_on_user_deactivation(
+    jwt_user_cache_enabled, rf, customer_user
+):
+    # given
+    token = create_access_token(customer_user)
+    _authenticate(rf, token)
+
+    # when
+    customer_user.is_active = False
+    customer_user.save(update_fields=["is_active"])
+
+    # then
+    with pytest.raises(InvalidTokenError):
+        _authenticate(rf, token)
+
+
+def test_cached_user_invalidated_on_token_key_change(
+    jwt_user_cache_enabled, rf, customer_user
+):
+    # given
+    token = create_access_token(customer_user)
+    _authenticate(rf, token)
+
+    # when
+    customer_user.jwt_token_key = "new-key"
+    customer_user.save(update_fields=["jwt_token_key"])
+
+    # then
+    with pytest.raises(InvalidTokenError):
+        _authenticate(rf, token)
+
+
+def test_cached_user_invalidated_on_bulk_deactivation(
+    jwt_user_cache_enabled, rf, customer_user
+):
+    # given
+    token = create_access_token(customer_user)
+    _authenticate(rf, token)
+
+    # when
+    UserBulkSetActive.bulk_action(
+        None, User.objects.filter(pk=customer_user.pk), is_active=False
+    )
+
+    # then
+    with pytest.raises(InvalidTokenError):
+        _authenticate(rf, token)
+
+
+def test_jwt_user_cache_key_does_not_contain_token_key(customer_user):
+    # given
+    payload = jwt_decode(create_access_token(customer_user))
+
+    # when
+    cache_key = get_jwt_user_cache_key(payload)
+
+    # then
+    assert customer_user.jwt_token_key not in cache_key
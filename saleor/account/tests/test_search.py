@@ -1,4 +1,11 @@
-from ..search import prepare_user_search_document_value
+import pytest
+
+from ..models import User
+from ..search import (
+    prepare_user_search_document_value,
+    search_users,
+    search_users_ranked,
+)
 
 
 def test_prepare_user_search_document_value(customer_user, address, address_usa):
@@ -63,3 +70,92 @@ def test_prepare_user_search_document_value_do_not_attach_addresses_data(
 
     # then
     assert search_document_value == expected_search_value
+
+
+@pytest.fixture
+def users_for_search():
+    users = User.objects.bulk_create(
+        [
+            User(email="john.doe@example.com", first_name="John", last_name="Doe"),
+            User(email="johnny.smith@example.com", first_name="Johnny"),
+            User(email="jane.doe@example.com", first_name="Jane", last_name="Doe"),
+        ]
+    )
+    for user in users:
+        user.search_document = prepare_user_search_document_value(
+            user, attach_addresses_data=False
+        )
+    User.objects.bulk_update(users, ["search_document"])
+    return users
+
+
+def test_search_users_ranked(users_for_search):
+    # given
+    john, johnny, _jane = users_for_search
+    qs = User.objects.filter(pk__in=[user.pk for user in users_for_search])
+
+    # when
+    results = search_users_ranked(qs, "John Doe", limit=10)
+
+    # then
+    assert list(results) == [john]
+
+
+def test_search_users_ranked_ordered_by_rank():
+    # given
+    johnny, john = User.objects.bulk_create(
+        [
+            User(email="johnny.smith@example.com", first_name="Johnny"),
+            User(email="john.doe@example.com", first_name="John", last_name="Doe"),
+        ]
+    )
+    for user in (johnny, john):
+        user.search_document = prepare_user_search_document_value(
+            user, attach_addresses_data=False
+        )
+    User.objects.bulk_update([johnny, john], ["search_document"])
+    qs = User.objects.filter(pk__in=[johnny.pk, john.pk])
+
+    # when
+    results = search_users_ranked(qs, "john", limit=10)
+
+    # then
+    assert list(results) == [john, johnny]
+    assert results[0].search_rank > results[1].search_rank
+
+
+def test_search_users_ranked_limit(users_for_search):
+    # given
+    john, _johnny, jane = users_for_search
+    qs = User.objects.filter(pk__in=[user.pk for user in users_for_search])
+
+    # when
+    results = search_users_ranked(qs, "doe", limit=1)
+
+    # then
+    assert len(results) == 1
+    assert results[0] in [john, jane]
+
+
+def test_search_users_ranked_short_words(users_for_search):
+    # given
+    qs = User.objects.filter(pk__in=[user.pk for user in users_for_search])
+
+    # when
+    results = search_users_ranked(qs, "jo", limit=1)
+
+    # then
+    assert results.count() == 1
+
+
+def test_search_users_ranked_enabled_in_settings(users_for_search, settings):
+    # given
+    settings.USER_SEARCH_RANKED = True
+    settings.USER_SEARCH_MAX_RESULTS = 1
+    qs = User.objects.filter(pk__in=[user.pk for user in users_for_search])
+
+    # when
+    results = search_users(qs, "doe")
+
+    # then
+    assert results.count() == 1
@@ -31,6 +31,13 @@ class AppQueryset(models.QuerySet["App"]):
             **permissions,
         )
 
+    def update(self, **kwargs):
+        from ..webhook.utils import invalidate_webhook_routing_table
+
+        result = super().update(**kwargs)
+        invalidate_webhook_routing_table()
+        return result
+
 
 AppManager = models.Manager.from_queryset(AppQueryset)
 
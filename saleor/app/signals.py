@@ -1,6 +1,16 @@
 from ..core.tasks import delete_from_storage_task
+from .token_cache import invalidate_app_token_cache
 
 
 def delete_brand_images(sender, instance, **kwargs):
     if img := instance.brand_logo_default:
         delete_from_storage_task.delay(img.name)
+
+
+def invalidate_app_token_cache_on_token_delete(sender, instance, **kwargs):
+    invalidate_app_token_cache()
+
+
+def invalidate_app_token_cache_on_app_change(sender, instance, **kwargs):
+    if not instance.is_active or instance.removed_at:
+        invalidate_app_token_cache()
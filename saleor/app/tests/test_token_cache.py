@@ -0,0 +1,154 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from ...graphql.app.dataloaders import AppByTokenLoader
+from ...graphql.context import get_context_value
+from ..models import AppToken
+from ..token_cache import (
+    cache_app_ids_for_tokens,
+    clear_app_token_mem_cache,
+    get_app_token_cache_stats,
+    get_app_token_cache_version,
+    get_cached_app_ids_for_tokens,
+    invalidate_app_token_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    cache.clear()
+    clear_app_token_mem_cache()
+    yield
+    clear_app_token_mem_cache()
+
+
+def test_get_cached_app_ids_for_tokens_miss():
+    # when
+    result = get_cached_app_ids_for_tokens(["token"])
+
+    # then
+    assert result == {}
+    assert get_app_token_cache_stats() == {"hits": 0, "misses": 1}
+
+
+def test_get_cached_app_ids_for_tokens_hit():
+    # given
+    cache_app_ids_for_tokens({"token": 1}, get_app_token_cache_version())
+
+    # when
+    result = get_cached_app_ids_for_tokens(["token", "other-token"])
+
+    # then
+    assert result == {"token": 1}
+    assert get_app_token_cache_stats() == {"hits": 1, "misses": 1}
+
+
+def test_get_cached_app_ids_for_tokens_from_shared_cache():
+    # given
+    cache_app_ids_for_tokens({"token": 1}, get_app_token_cache_version())
+    clear_app_token_mem_cache()
+
+    # when
+    result = get_cached_app_ids_for_tokens(["token"])
+
+    # then
+    assert result == {"token": 1}
+
+
+def test_invalidate_app_token_cache():
+    # given
+    cache_app_ids_for_tokens({"token": 1}, get_app_token_cache_version())
+
+    # when
+    invalidate_app_token_cache()
+
+    # then
+    assert get_cached_app_ids_for_tokens(["token"]) == {}
+
+
+@patch("saleor.graphql.app.dataloaders.check_password")
+def test_app_by_token_loader_uses_cache(mocked_check_password, app, rf):
+    # given
+    _, raw_token = AppToken.objects.create_with_token(app=app)
+    mocked_check_password.return_value = True
+    context = get_context_value(rf.request())
+
+    # when
+    first = AppByTokenLoader(context).batch_load([raw_token])
+    second = AppByTokenLoader(context).batch_load([raw_token])
+
+    # then
+    assert first == [app]
+    assert second == [app]
+    assert mocked_check_password.call_count == 1
+
+
+def test_app_by_token_loader_token_deleted(app, rf):
+    # given
+    app_token, raw_token = AppToken.objects.create_with_token(app=app)
+    context = get_context_value(rf.request())
+    assert AppByTokenLoader(context).batch_load([raw_token]) == [app]
+
+    # when
+    app_token.delete()
+
+    # then
+    assert AppByTokenLoader(context).batch_load([raw_token]) == [None]
+
+
+def test_app_by_token_loader_token_deleted_during_verification(
+    app, rf, django_capture_on_commit_callbacks
+):
+    # given
+    app_token, raw_token = AppToken.objects.create_with_token(app=app)
+    context = get_context_value(rf.request())
+    verify_tokens = AppByTokenLoader._verify_tokens
+
+    def verify_tokens_and_delete(loader, raw_tokens):
+        verified_apps = verify_tokens(loader, raw_tokens)
+        with django_capture_on_commit_callbacks(execute=True):
+            app_token.delete()
+        return verified_apps
+
+    # when
+    with patch.object(AppByTokenLoader, "_verify_tokens", verify_tokens_and_delete):
+        AppByTokenLoader(context).batch_load([raw_token])
+
+    # then
+    assert AppByTokenLoader(context).batch_load([raw_token]) == [None]
+
+
+def test_app_by_token_loader_token_verified_before_deletion_commit(
+    app, rf, django_capture_on_commit_callbacks
+):
+    # given
+    app_token, raw_token = AppToken.objects.create_with_token(app=app)
+    context = get_context_value(rf.request())
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        app_token.delete()
+        # A concurrent request still sees the token until the deletion is committed.
+        with patch.object(
+            AppByTokenLoader, "_verify_tokens", return_value={raw_token: app.pk}
+        ):
+            assert AppByTokenLoader(context).batch_load([raw_token]) == [app]
+
+    # then
+    assert AppByTokenLoader(context).batch_load([raw_token]) == [None]
+
+
+def test_app_by_token_loader_app_deactivated(app, rf):
+    # given
+    _, raw_token = AppToken.objects.create_with_token(app=app)
+    context = get_context_value(rf.request())
+    assert AppByTokenLoader(context).batch_load([raw_token]) == [app]
+
+    # when
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # then
+    assert AppByTokenLoader(context).batch_load([raw_token]) == [None]
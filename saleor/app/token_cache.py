@@ -0,0 +1,129 @@
+"""Cache of verified app tokens.
+
+Verifying a raw app token requires running `check_password` against every
+`AppToken` sharing the last 4 characters, which is expensive by design. Verified
+tokens are cached per process and in the shared cache under a keyed digest of the
+raw token, so the key stretching is only paid once per token and TTL.
+
+Entries are versioned with a global counter stored in the shared cache. Bumping
+the counter (on token deletion, app deactivation or removal) invalidates all
+cached tokens in every process.
+"""
+
+import hashlib
+import hmac
+from collections.abc import Iterable
+from time import monotonic
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..core.utils.cache import bump_cache_version_on_commit, get_cache_version
+
+APP_TOKEN_CACHE_KEY = "app_token:{version}:{digest}"
+APP_TOKEN_CACHE_VERSION_KEY = "app_token_cache_version"
+APP_TOKEN_MEM_CACHE_MAX_SIZE = 10000
+
+# digest -> (app_id, cache version, time of caching)
+_app_token_mem_cache: dict[str, tuple[int, int, float]] = {}
+_app_token_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_token_digest(raw_token: str) -> str:
+    return hmac.new(
+        settings.SECRET_KEY.encode(), raw_token.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def get_app_token_cache_version() -> int:
+    return get_cache_version(APP_TOKEN_CACHE_VERSION_KEY)
+
+
+def get_app_token_cache_stats() -> dict[str, int]:
+    return dict(_app_token_cache_stats)
+
+
+def clear_app_token_mem_cache():
+    _app_token_mem_cache.clear()
+    _app_token_cache_stats.update(hits=0, misses=0)
+
+
+def get_cached_app_ids_for_tokens(raw_tokens: Iterable[str]) -> dict[str, int]:
+    """Return app ids of already verified tokens.
+
+    Tokens missing from both the process-local and the shared cache are skipped,
+    the caller has to verify them with `check_password`.
+    """
+    timeout = settings.APP_TOKEN_CACHE_TIMEOUT.total_seconds()
+    version = get_app_token_cache_version()
+    now = monotonic()
+
+    unique_tokens = set(raw_tokens)
+    result = {}
+    shared_keys = {}
+    for raw_token in unique_tokens:
+        digest = get_token_digest(raw_token)
+        if cached := _app_token_mem_cache.get(digest):
+            app_id, cached_version, cached_at = cached
+            if cached_version == version and now - cached_at <= timeout:
+                result[raw_token] = app_id
+                continue
+            del _app_token_mem_cache[digest]
+        key = APP_TOKEN_CACHE_KEY.format(version=version, digest=digest)
+        shared_keys[key] = (raw_token, digest)
+
+    if shared_keys:
+        for key, app_id in cache.get_many(shared_keys.keys()).items():
+            raw_token, digest = shared_keys[key]
+            result[raw_token] = app_id
+            _set_mem_cache(digest, app_id, version, now)
+
+    _app_token_cache_stats["hits"] += len(result)
+    _app_token_cache_stats["misses"] += len(unique_tokens) - len(result)
+    return result
+
+
+def cache_app_ids_for_tokens(app_ids_by_token: dict[str, int], version: int):
+    """Store app ids of tokens that passed `check_password`.
+
+    The version has to be read before the tokens are verified, so tokens deleted
+    while they were verified are cached under an already invalidated version.
+    """
+    if not app_ids_by_token:
+        return
+    now = monotonic()
+    to_cache = {}
+    for raw_token, app_id in app_ids_by_token.items():
+        digest = get_token_digest(raw_token)
+        to_cache[APP_TOKEN_CACHE_KEY.format(version=version, digest=digest)] = app_id
+        _set_mem_cache(digest, app_id, version, now)
+    timeout = settings.APP_TOKEN_CACHE_TIMEOUT.total_seconds()
+    cache.set_many(to_cache, timeout=timeout)
+
+
+def discard_cached_tokens(raw_tokens: Iterable[str]):
+    """Drop tokens which turned out to be stale, e.g. their app is inactive."""
+    version = get_app_token_cache_version()
+    keys = []
+    for raw_token in raw_tokens:
+        digest = get_token_digest(raw_token)
+        _app_token_mem_cache.pop(digest, None)
+        keys.append(APP_TOKEN_CACHE_KEY.format(version=version, digest=digest))
+    if keys:
+        cache.delete_many(keys)
+
+
+def invalidate_app_token_cache():
+    """Invalidate all verified tokens in every process."""
+    bump_cache_version_on_commit(APP_TOKEN_CACHE_VERSION_KEY)
+    _app_token_mem_cache.clear()
+
+
+def _set_mem_cache(digest: str, app_id: int, version: int, now: float):
+    if (
+        digest not in _app_token_mem_cache
+        and len(_app_token_mem_cache) >= APP_TOKEN_MEM_CACHE_MAX_SIZE
+    ):
+        # Dicts keep insertion order, so the first key is the oldest entry.
+        del _app_token_mem_cache[next(iter(_app_token_mem_cache))]
+    _app_token_mem_cache[digest] = (app_id, version, now)
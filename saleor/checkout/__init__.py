@@ -2,6 +2,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+default_app_config = "saleor.checkout.app.CheckoutAppConfig"
+
 
 class AddressType:
     BILLING = "billing"
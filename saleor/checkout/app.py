@@ -0,0 +1,80 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class CheckoutAppConfig(AppConfig):
+    name = "saleor.checkout"
+
+    def ready(self):
+        from ..channel.models import Channel
+        from ..discount.models import (
+            Promotion,
+            PromotionRule,
+            PromotionRuleTranslation,
+            PromotionTranslation,
+        )
+        from ..product.models import (
+            Collection,
+            CollectionProduct,
+            Product,
+            ProductChannelListing,
+            ProductType,
+            ProductVariant,
+            ProductVariantChannelListing,
+            VariantChannelListingPromotionRule,
+        )
+        from ..tax.models import TaxClass, TaxClassCountryRate
+        from .signals import (
+            invalidate_catalogue_line_snapshots_on_change,
+            invalidate_catalogue_line_snapshots_on_relation_change,
+            invalidate_promotion_line_snapshots_on_change,
+        )
+
+        # Deletions of listings, rates and rule assignments are covered by the
+        # invalidation when prices are marked as dirty and recalculated, and by the
+        # snapshots timeout, as `post_delete` receivers would disable fast deletes.
+        catalogue_models = {
+            Channel: True,
+            Collection: True,
+            CollectionProduct: False,
+            Product: True,
+            ProductChannelListing: False,
+            ProductType: True,
+            ProductVariant: True,
+            ProductVariantChannelListing: False,
+            TaxClass: True,
+            TaxClassCountryRate: False,
+        }
+        promotion_models = {
+            Promotion: True,
+            PromotionRule: True,
+            PromotionRuleTranslation: False,
+            PromotionTranslation: False,
+            VariantChannelListingPromotionRule: False,
+        }
+        for handler, models in (
+            (invalidate_catalogue_line_snapshots_on_change, catalogue_models),
+            (invalidate_promotion_line_snapshots_on_change, promotion_models),
+        ):
+            for model, on_delete in models.items():
+                post_save.connect(
+                    handler,
+                    sender=model,
+                    dispatch_uid=(
+                        f"invalidate_checkout_line_snapshots_on_{model.__name__}_save"
+                    ),
+                )
+                if on_delete:
+                    post_delete.connect(
+                        handler,
+                        sender=model,
+                        dispatch_uid=(
+                            "invalidate_checkout_line_snapshots_on_"
+                            f"{model.__name__}_delete"
+                        ),
+                    )
+        m2m_changed.connect(
+            invalidate_catalogue_line_snapshots_on_relation_change,
+            sender=Collection.products.through,
+            dispatch_uid="invalidate_checkout_line_snapshots_on_collection_products",
+        )
@@ -12,6 +12,7 @@ from typing import (
 from uuid import UUID
 
 from django.conf import settings
+from django.db.models import prefetch_related_objects
 
 from ..core.pricing.interface import LineInfo
 from ..discount import VoucherType
@@ -298,27 +299,12 @@ def fetch_checkout_lines(
     from ..discount.utils import apply_voucher_to_line
     from .utils import get_voucher_for_checkout
 
-    select_related_fields = ["variant__product__product_type__tax_class"]
-    prefetch_related_fields = [
-        "variant__product__collections",
-        "variant__product__channel_listings__channel",
-        "variant__product__product_type__tax_class__country_rates",
-        "variant__product__tax_class__country_rates",
-        "variant__channel_listings__channel",
-        "variant__channel_listings__variantlistingpromotionrule__promotion_rule__promotion__translations",
-        "variant__channel_listings__variantlistingpromotionrule__promotion_rule__translations",
-        "discounts__promotion_rule__promotion",
-    ]
-    if prefetch_variant_attributes:
-        prefetch_related_fields.extend(
-            [
-                "variant__attributes__assignment__attribute",
-                "variant__attributes__values",
-            ]
+    if settings.CHECKOUT_LINE_SNAPSHOT_CACHE_ENABLED:
+        lines = _fetch_lines_with_variant_snapshots(
+            checkout, prefetch_variant_attributes
         )
-    lines = checkout.lines.select_related(*select_related_fields).prefetch_related(
-        *prefetch_related_fields
-    )
+    else:
+        lines = _fetch_lines_with_variants(checkout, prefetch_variant_attributes)
     lines_info = []
     unavailable_variant_pks = []
     product_channel_listing_mapping: dict[int, Optional[ProductChannelListing]] = {}
@@ -399,6 +385,58 @@ def fetch_checkout_lines(
     return lines_info, unavailable_variant_pks
 
 
+VARIANT_ATTRIBUTES_PREFETCH_FIELDS = [
+    "attributes__assignment__attribute",
+    "attributes__values",
+]
+
+
+def _fetch_lines_with_variants(
+    checkout: "Checkout", prefetch_variant_attributes: bool
+) -> Iterable["CheckoutLine"]:
+    select_related_fields = ["variant__product__product_type__tax_class"]
+    prefetch_related_fields = [
+        "variant__product__collections",
+        "variant__product__channel_listings__channel",
+        "variant__product__product_type__tax_class__country_rates",
+        "variant__product__tax_class__country_rates",
+        "variant__channel_listings__channel",
+        "variant__channel_listings__variantlistingpromotionrule__promotion_rule__promotion__translations",
+        "variant__channel_listings__variantlistingpromotionrule__promotion_rule__translations",
+        "discounts__promotion_rule__promotion",
+    ]
+    if prefetch_variant_attributes:
+        prefetch_related_fields.extend(
+            f"variant__{field}" for field in VARIANT_ATTRIBUTES_PREFETCH_FIELDS
+        )
+    return checkout.lines.select_related(*select_related_fields).prefetch_related(
+        *prefetch_related_fields
+    )
+
+
+def _fetch_lines_with_variant_snapshots(
+    checkout: "Checkout", prefetch_variant_attributes: bool
+) -> Iterable["CheckoutLine"]:
+    """Fetch checkout lines with variants taken from the catalogue snapshots cache."""
+    from .line_snapshot_cache import get_variant_line_snapshots
+
+    lines = list(
+        checkout.lines.prefetch_related("discounts__promotion_rule__promotion")
+    )
+    variants = get_variant_line_snapshots(
+        {line.variant_id for line in lines}, checkout.channel_id
+    )
+    if prefetch_variant_attributes:
+        prefetch_related_objects(
+            list(variants.values()), *VARIANT_ATTRIBUTES_PREFETCH_FIELDS
+        )
+    for line in lines:
+        # A variant deleted in the meantime is loaded as usual.
+        if line.variant_id in variants:
+            line.variant = variants[line.variant_id]
+    return lines
+
+
 def get_variant_channel_listing(variant: "ProductVariant", channel_id: int):
     variant_channel_listing = None
     for channel_listing in variant.channel_listings.all():
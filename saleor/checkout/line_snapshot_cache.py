@@ -0,0 +1,115 @@
+"""Cache of catalogue snapshots of variants in checkout lines.
+
+Fetching checkout lines prefetches the variant's product, product type, tax classes
+with their country rates, collections, channel listings and the promotion rules
+applied to the listing, which is about ten queries repeated by every checkout
+mutation. The variants with all of it prefetched for a single channel are kept in
+the shared cache, so fetching checkout lines only queries the lines and their
+discounts.
+
+Snapshots are versioned with two global counters stored in the shared cache: one
+bumped on changes of the catalogue and one bumped on changes of promotions and of
+the discounted prices computed from them. Bulk updates don't send signals, so
+snapshots also expire after `CHECKOUT_LINE_SNAPSHOT_CACHE_TIMEOUT`.
+"""
+
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from ..core.db.connection import allow_writer
+from ..core.utils.cache import bump_cache_version_on_commit, get_cache_version
+from ..product.models import (
+    ProductChannelListing,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+
+CHECKOUT_LINE_SNAPSHOT_KEY = (
+    "checkout_line_snapshot:{catalogue_version}:{promotion_version}:"
+    "{channel_id}:{variant_id}"
+)
+CATALOGUE_SNAPSHOT_VERSION_KEY = "checkout_line_snapshot_catalogue_version"
+PROMOTION_SNAPSHOT_VERSION_KEY = "checkout_line_snapshot_promotion_version"
+
+
+def invalidate_catalogue_line_snapshots():
+    """Invalidate snapshots after a change of products, variants or their listings."""
+    bump_cache_version_on_commit(CATALOGUE_SNAPSHOT_VERSION_KEY)
+
+
+def invalidate_promotion_line_snapshots():
+    """Invalidate snapshots after a change of promotions or discounted prices."""
+    bump_cache_version_on_commit(PROMOTION_SNAPSHOT_VERSION_KEY)
+
+
+def get_variant_line_snapshots(
+    variant_ids: Iterable[int], channel_id: int
+) -> dict[int, ProductVariant]:
+    """Return variants with the catalogue data needed by checkout lines.
+
+    Only the channel listings of the given channel are prefetched.
+    """
+    catalogue_version = get_cache_version(CATALOGUE_SNAPSHOT_VERSION_KEY)
+    promotion_version = get_cache_version(PROMOTION_SNAPSHOT_VERSION_KEY)
+    keys = {
+        variant_id: CHECKOUT_LINE_SNAPSHOT_KEY.format(
+            catalogue_version=catalogue_version,
+            promotion_version=promotion_version,
+            channel_id=channel_id,
+            variant_id=variant_id,
+        )
+        for variant_id in variant_ids
+    }
+    cached = cache.get_many(keys.values())
+    variants = {
+        variant_id: cached[key] for variant_id, key in keys.items() if key in cached
+    }
+    missing_variant_ids = [
+        variant_id for variant_id in keys if variant_id not in variants
+    ]
+    if missing_variant_ids:
+        fetched = fetch_variant_line_snapshots(missing_variant_ids, channel_id)
+        cache.set_many(
+            {keys[variant.pk]: variant for variant in fetched},
+            timeout=settings.CHECKOUT_LINE_SNAPSHOT_CACHE_TIMEOUT.total_seconds(),
+        )
+        variants.update({variant.pk: variant for variant in fetched})
+    return variants
+
+
+def fetch_variant_line_snapshots(
+    variant_ids: Iterable[int], channel_id: int
+) -> list[ProductVariant]:
+    database_connection_name = settings.DATABASE_CONNECTION_DEFAULT_NAME
+    variant_listings = (
+        ProductVariantChannelListing.objects.using(database_connection_name)
+        .filter(channel_id=channel_id)
+        .select_related("channel")
+        .prefetch_related(
+            "variantlistingpromotionrule__promotion_rule__promotion__translations",
+            "variantlistingpromotionrule__promotion_rule__translations",
+        )
+    )
+    product_listings = (
+        ProductChannelListing.objects.using(database_connection_name)
+        .filter(channel_id=channel_id)
+        .select_related("channel")
+    )
+    # Snapshots are kept until the next change of the catalogue, so they are read
+    # from the writer to not cache a state that the replica has not caught up with.
+    with allow_writer():
+        return list(
+            ProductVariant.objects.using(database_connection_name)
+            .filter(pk__in=variant_ids)
+            .select_related("product__product_type__tax_class")
+            .prefetch_related(
+                "product__collections",
+                "product__product_type__tax_class__country_rates",
+                "product__tax_class__country_rates",
+                Prefetch("product__channel_listings", queryset=product_listings),
+                Prefetch("channel_listings", queryset=variant_listings),
+            )
+        )
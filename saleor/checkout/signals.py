@@ -0,0 +1,19 @@
+from .line_snapshot_cache import (
+    invalidate_catalogue_line_snapshots,
+    invalidate_promotion_line_snapshots,
+)
+
+
+def invalidate_catalogue_line_snapshots_on_change(sender, instance, **kwargs):
+    invalidate_catalogue_line_snapshots()
+
+
+def invalidate_catalogue_line_snapshots_on_relation_change(
+    sender, instance, action, **kwargs
+):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_catalogue_line_snapshots()
+
+
+def invalidate_promotion_line_snapshots_on_change(sender, instance, **kwargs):
+    invalidate_promotion_line_snapshots()
@@ -0,0 +1,136 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ...product.models import ProductVariant
+from ..fetch import fetch_checkout_lines
+
+
+@pytest.fixture
+def line_snapshot_cache_enabled(settings, _clear_checkout_line_snapshots):
+    settings.CHECKOUT_LINE_SNAPSHOT_CACHE_ENABLED = True
+    return settings
+
+
+def _fetch_line_info(checkout, **kwargs):
+    lines, _ = fetch_checkout_lines(checkout, **kwargs)
+    assert len(lines) == 1
+    return lines[0]
+
+
+def test_fetch_checkout_lines_with_snapshots_matches_queries(
+    checkout_with_item_on_promotion,
+    collection,
+    settings,
+    _clear_checkout_line_snapshots,
+):
+    # given
+    checkout = checkout_with_item_on_promotion
+    product = checkout.lines.get().variant.product
+    collection.products.add(product)
+    settings.CHECKOUT_LINE_SNAPSHOT_CACHE_ENABLED = False
+    expected = _fetch_line_info(checkout)
+
+    # when
+    settings.CHECKOUT_LINE_SNAPSHOT_CACHE_ENABLED = True
+    _fetch_line_info(checkout)
+    line_info = _fetch_line_info(checkout)
+
+    # then
+    assert line_info.line == expected.line
+    assert line_info.variant == expected.variant
+    assert line_info.product == expected.product
+    assert line_info.product_type == expected.product_type
+    assert line_info.tax_class == expected.tax_class
+    assert line_info.collections == expected.collections == [collection]
+    assert line_info.channel_listing == expected.channel_listing
+    assert line_info.channel_listing.discounted_price == (
+        expected.channel_listing.discounted_price
+    )
+    assert line_info.discounts == expected.discounts
+    assert line_info.rules_info
+    assert [rule_info.rule for rule_info in line_info.rules_info] == [
+        rule_info.rule for rule_info in expected.rules_info
+    ]
+
+
+def test_fetch_checkout_lines_with_snapshots_skips_catalogue_queries(
+    line_snapshot_cache_enabled, checkout_with_item_on_promotion
+):
+    # given
+    checkout = checkout_with_item_on_promotion
+    _fetch_line_info(checkout)
+
+    # when
+    with CaptureQueriesContext(connection) as queries_context:
+        line_info = _fetch_line_info(checkout)
+        line_info.product.product_type
+        line_info.channel_listing.channel
+
+    # then
+    variant_table = ProductVariant._meta.db_table
+    assert queries_context.captured_queries
+    assert not any(
+        variant_table in query["sql"] for query in queries_context.captured_queries
+    )
+
+
+def test_fetch_checkout_lines_with_snapshots_prefetch_variant_attributes(
+    line_snapshot_cache_enabled, checkout_with_item
+):
+    # given
+    _fetch_line_info(checkout_with_item)
+
+    # when
+    line_info = _fetch_line_info(checkout_with_item, prefetch_variant_attributes=True)
+
+    # then
+    assert "attributes" in line_info.variant._prefetched_objects_cache
+
+
+def test_snapshots_invalidated_on_variant_listing_change(
+    line_snapshot_cache_enabled, checkout_with_item
+):
+    # given
+    line_info = _fetch_line_info(checkout_with_item)
+    channel_listing = line_info.variant.channel_listings.get(
+        channel_id=checkout_with_item.channel_id
+    )
+
+    # when
+    channel_listing.price_amount += 1
+    channel_listing.save(update_fields=["price_amount"])
+
+    # then
+    line_info = _fetch_line_info(checkout_with_item)
+    assert line_info.channel_listing.price_amount == channel_listing.price_amount
+
+
+def test_snapshots_invalidated_on_promotion_rule_delete(
+    line_snapshot_cache_enabled, checkout_with_item_on_promotion
+):
+    # given
+    line_info = _fetch_line_info(checkout_with_item_on_promotion)
+    assert line_info.rules_info
+
+    # when
+    line_info.rules_info[0].rule.delete()
+
+    # then
+    line_info = _fetch_line_info(checkout_with_item_on_promotion)
+    assert line_info.rules_info == []
+
+
+def test_snapshots_invalidated_on_collection_products_change(
+    line_snapshot_cache_enabled, checkout_with_item, collection
+):
+    # given
+    line_info = _fetch_line_info(checkout_with_item)
+    assert line_info.collections == []
+
+    # when
+    collection.products.add(line_info.product)
+
+    # then
+    line_info = _fetch_line_info(checkout_with_item)
+    assert line_info.collections == [collection]
@@ -48,6 +48,7 @@ from ..plugins.manager import PluginsManager
 from ..product import models as product_models
 from ..shipping.interface import ShippingMethodData
 from ..shipping.models import ShippingMethod, ShippingMethodChannelListing
+from ..shipping.rate_table import get_applicable_shipping_methods
 from ..shipping.utils import convert_to_shipping_method_data
 from ..warehouse.availability import check_stock_and_preorder_quantity
 from ..warehouse.models import Warehouse
@@ -877,16 +878,27 @@ def get_valid_internal_shipping_methods_for_checkout(
     if not checkout_info.shipping_address:
         return []
 
-    shipping_methods = ShippingMethod.objects.using(
-        database_connection_name
-    ).applicable_shipping_methods_for_instance(
-        checkout_info.checkout,
-        channel_id=checkout_info.checkout.channel_id,
-        price=subtotal,
-        shipping_address=checkout_info.shipping_address,
-        country_code=country_code,
-        lines=lines,
-    )
+    shipping_methods: Iterable[ShippingMethod]
+    if settings.SHIPPING_RATE_TABLE_ENABLED:
+        shipping_methods = get_applicable_shipping_methods(
+            checkout_info.checkout.channel_id,
+            price=subtotal,
+            weight=calculate_checkout_weight(lines),
+            shipping_address=checkout_info.shipping_address,
+            country_code=country_code,
+            product_ids={line.variant.product_id for line in lines if line.variant},
+        )
+    else:
+        shipping_methods = ShippingMethod.objects.using(
+            database_connection_name
+        ).applicable_shipping_methods_for_instance(
+            checkout_info.checkout,
+            channel_id=checkout_info.checkout.channel_id,
+            price=subtotal,
+            shipping_address=checkout_info.shipping_address,
+            country_code=country_code,
+            lines=lines,
+        )
 
     channel_listings_map = {
         listing.shipping_method_id: listing for listing in shipping_channel_listings
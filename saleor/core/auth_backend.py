@@ -1,8 +1,17 @@
 import jwt
 from django.conf import settings
 
+from ..account.jwt_user_cache import (
+    CachedJWTUser,
+    cache_jwt_user,
+    get_cached_jwt_user,
+    get_jwt_user_cache_key,
+)
 from ..account.models import User
-from ..graphql.account.dataloaders import UserByEmailLoader
+from ..graphql.account.dataloaders import (
+    AccessibleChannelsByUserIdLoader,
+    UserByEmailLoader,
+)
 from ..graphql.plugins.dataloaders import AnonymousPluginManagerLoader
 from ..permission.enums import (
     get_permissions_from_codenames,
@@ -18,6 +27,9 @@ from .jwt import (
     jwt_decode,
 )
 
+# Attribute of the user storing names of the effective permissions.
+PERMISSIONS_CACHE_NAME = "_effective_permissions_cache"
+
 
 # Moved from `django.contrib.auth.backends.ModelBackend`
 class BaseBackend:
@@ -70,13 +82,10 @@ class JSONWebTokenBackend(BaseBackend):
         if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
             return set()
 
-        perm_cache_name = "_effective_permissions_cache"
-        if not getattr(user_obj, perm_cache_name, None):
+        if getattr(user_obj, PERMISSIONS_CACHE_NAME, None) is None:
             perms = getattr(self, f"_get_{from_name}_permissions")(user_obj)
-            perms = perms.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-            perms = perms.values_list("content_type__app_label", "codename").order_by()
-            setattr(user_obj, perm_cache_name, {f"{ct}.{name}" for ct, name in perms})
-        return getattr(user_obj, perm_cache_name)
+            setattr(user_obj, PERMISSIONS_CACHE_NAME, get_permission_names(perms))
+        return getattr(user_obj, PERMISSIONS_CACHE_NAME)
 
     # Moved from `django.contrib.auth.backends.ModelBackend`
     def get_user_permissions(self, user_obj, obj=None):  # noqa: D205, D212, D400, D415
@@ -119,13 +128,23 @@ class PluginBackend(JSONWebTokenBackend):
         return manager.authenticate_user(request)
 
 
+def get_permission_names(permissions) -> set[str]:
+    """Return names of permissions in the `app_label.codename` format."""
+    permissions = permissions.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+    permissions = permissions.values_list(
+        "content_type__app_label", "codename"
+    ).order_by()
+    return {f"{ct}.{name}" for ct, name in permissions}
+
+
 def load_user_from_request(request):
     if request is None:
         return None
     jwt_token = get_token_from_request(request)
     if not jwt_token or not is_saleor_token(jwt_token):
         return None
-    payload = jwt_decode(jwt_token)
+    # Reuse the payload if the token was already decoded for the request.
+    payload = getattr(request, "decoded_auth_token", None) or jwt_decode(jwt_token)
 
     jwt_type = payload.get("type")
     if jwt_type not in [JWT_ACCESS_TYPE, JWT_THIRDPARTY_ACCESS_TYPE]:
@@ -134,8 +153,15 @@ def load_user_from_request(request):
         )
     permissions = payload.get(PERMISSIONS_FIELD, None)
 
-    user = UserByEmailLoader(request).load(payload["email"]).get()
     user_jwt_token = payload.get("token")
+    cache_key = None
+    if settings.JWT_USER_CACHE_ENABLED and user_jwt_token:
+        cache_key = get_jwt_user_cache_key(payload)
+    cached_user = get_cached_jwt_user(cache_key, payload) if cache_key else None
+    if cached_user:
+        user = _load_user_from_cache(request, cached_user)
+    else:
+        user = UserByEmailLoader(request).load(payload["email"]).get()
     if not user_jwt_token:
         raise jwt.InvalidTokenError(
             "Invalid token. Create new one by using tokenCreate mutation."
@@ -148,6 +174,8 @@ def load_user_from_request(request):
         raise jwt.InvalidTokenError(
             "Invalid token. Create new one by using tokenCreate mutation."
         )
+    if cache_key and not cached_user:
+        _cache_user(request, cache_key, user)
 
     if permissions is not None:
         token_permissions = get_permissions_from_names(permissions)
@@ -158,3 +186,36 @@ def load_user_from_request(request):
     if payload.get("is_staff"):
         user.is_staff = True
     return user
+
+
+def _load_user_from_cache(request, cached_user: CachedJWTUser) -> User:
+    user = cached_user.user
+    setattr(user, PERMISSIONS_CACHE_NAME, cached_user.permissions)
+    UserByEmailLoader(request).prime(user.email, user)
+    if cached_user.accessible_channels is not None:
+        AccessibleChannelsByUserIdLoader(request).prime(
+            user.pk, cached_user.accessible_channels
+        )
+    return user
+
+
+def _cache_user(request, cache_key: str, user: User):
+    permissions = get_permission_names(user.effective_permissions)
+    # Drop the queryset, so it's not evaluated when the user is pickled.
+    user.effective_permissions = None  # type: ignore[assignment]
+    accessible_channels = None
+    if user.is_staff:
+        accessible_channels = (
+            AccessibleChannelsByUserIdLoader(request).load(user.pk).get()
+        )
+    cache_jwt_user(
+        cache_key,
+        CachedJWTUser(
+            user=user,
+            permissions=permissions,
+            accessible_channels=accessible_channels,
+        ),
+    )
+    # The permissions are already fetched, so they are not queried again by the
+    # authentication backend.
+    setattr(user, PERMISSIONS_CACHE_NAME, permissions)
@@ -1,5 +1,7 @@
+import hashlib
+from calendar import timegm
 from collections.abc import Iterable
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 import graphene
@@ -15,6 +17,7 @@ from ..permission.enums import (
 )
 from ..permission.models import Permission
 from .jwt_manager import get_jwt_manager
+from .utils.cache import CacheDict
 
 JWT_ACCESS_TYPE = "access"
 JWT_REFRESH_TYPE = "refresh"
@@ -27,6 +30,13 @@ USER_PERMISSION_FIELD = "user_permissions"
 JWT_SALEOR_OWNER_NAME = "saleor"
 JWT_OWNER_FIELD = "owner"
 
+JWT_DECODE_CACHE_MAX_SIZE = 10000
+
+# Payloads of tokens with verified signatures, keyed by the digest of the token and
+# the `verify_aud` flag. Verifying RS256 signatures is expensive, and clients reuse
+# access tokens for many requests.
+_decoded_tokens_cache: CacheDict = CacheDict(JWT_DECODE_CACHE_MAX_SIZE)
+
 
 def jwt_base_payload(
     exp_delta: Optional[timedelta], token_owner: str
@@ -82,8 +92,33 @@ def jwt_decode_with_exception_handler(
 def jwt_decode(
     token: str, verify_expiration=settings.JWT_EXPIRE, verify_aud: bool = False
 ) -> dict[str, Any]:
-    jwt_manager = get_jwt_manager()
-    return jwt_manager.decode(token, verify_expiration, verify_aud=verify_aud)
+    key = (hashlib.sha256(token.encode()).hexdigest(), verify_aud)
+    try:
+        payload = _decoded_tokens_cache[key]
+    except KeyError:
+        jwt_manager = get_jwt_manager()
+        # The expiration is verified below for cached payloads, so the payload can
+        # be cached regardless of `verify_expiration`.
+        payload = jwt_manager.decode(token, verify_expiration, verify_aud=verify_aud)
+        _decoded_tokens_cache[key] = payload
+    else:
+        if verify_expiration:
+            _verify_expiration(payload)
+    return dict(payload)
+
+
+def _verify_expiration(payload: dict[str, Any]):
+    # Matches the expiration check of `jwt.decode`.
+    exp = payload.get("exp")
+    if exp is None:
+        return
+    now = timegm(datetime.now(tz=timezone.utc).utctimetuple())
+    if int(exp) <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+
+def clear_jwt_decode_cache():
+    _decoded_tokens_cache.clear()
 
 
 def create_token(payload: dict[str, Any], exp_delta: timedelta) -> str:
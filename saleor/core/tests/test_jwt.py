@@ -1,11 +1,18 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
 import graphene
 import jwt
+import pytest
 from cryptography.hazmat.primitives import serialization
 from django.urls import reverse
+from freezegun import freeze_time
 
+from ...graphql.tests.utils import get_graphql_content
 from ..jwt import (
     create_access_token_for_app,
     create_access_token_for_app_extension,
+    get_jwt_manager,
     jwt_decode,
     jwt_encode,
 )
@@ -187,3 +194,71 @@ def test_jwt_encode_creates_token_signed_with_rs256(settings):
     # then
     headers = jwt.get_unverified_header(token)
     assert headers.get("alg") == "RS256"
+
+
+def test_jwt_decode_returns_cached_payload():
+    # given
+    payload = {"1": "A", "exp": datetime.utcnow() + timedelta(minutes=5)}
+    token = jwt_encode(payload)
+    expected_payload = jwt_decode(token)
+
+    # when
+    with patch("saleor.core.jwt.get_jwt_manager") as get_jwt_manager_mock:
+        decoded_token = jwt_decode(token)
+
+    # then
+    get_jwt_manager_mock.assert_not_called()
+    assert decoded_token == expected_payload
+
+
+@freeze_time("2024-05-31 12:00:00")
+def test_jwt_decode_verifies_expiration_of_cached_payload():
+    # given
+    payload = {"1": "A", "exp": datetime.utcnow() + timedelta(minutes=5)}
+    token = jwt_encode(payload)
+    jwt_decode(token)
+
+    # when
+    with freeze_time("2024-05-31 12:06:00"):
+        # then
+        with pytest.raises(jwt.ExpiredSignatureError):
+            jwt_decode(token)
+        assert jwt_decode(token, verify_expiration=False)["1"] == "A"
+
+
+def test_jwt_decode_verifies_expiration_of_payload_cached_without_verification():
+    # given
+    payload = {"1": "A", "exp": datetime.utcnow() - timedelta(minutes=5)}
+    token = jwt_encode(payload)
+    jwt_decode(token, verify_expiration=False)
+
+    # when & then
+    with pytest.raises(jwt.ExpiredSignatureError):
+        jwt_decode(token)
+
+
+def test_jwt_decode_does_not_cache_invalid_token():
+    # given
+    token = jwt.encode({"1": "A"}, "invalid-key", algorithm="HS256")
+    with pytest.raises(jwt.InvalidSignatureError):
+        jwt_decode(token)
+
+    # when & then
+    with pytest.raises(jwt.InvalidSignatureError):
+        jwt_decode(token)
+
+
+def test_access_token_decoded_once_per_request(staff_api_client):
+    # given
+    query = "{ me { email } }"
+
+    # when
+    with patch(
+        "saleor.core.jwt.get_jwt_manager", wraps=get_jwt_manager
+    ) as get_jwt_manager_mock:
+        response = staff_api_client.post_graphql(query)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["me"]["email"] == staff_api_client.user.email
+    get_jwt_manager_mock.assert_called_once()
@@ -1,5 +1,8 @@
 import collections
 
+from django.core.cache import cache
+from django.db import transaction
+
 
 class CacheDict(collections.OrderedDict):
     def __init__(self, capacity: int):
@@ -18,3 +21,81 @@ class CacheDict(collections.OrderedDict):
         while len(self) > self.capacity:
             surplus = next(iter(self))
             super().__delitem__(surplus)
+
+
+class SizedCacheDict(collections.OrderedDict):
+    """LRU cache bounded by the total size of stored values instead of their count.
+
+    Values are stored as `(size, value)` pairs internally; `size` is provided by
+    the caller with `set(key, value, size)`.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.total_size = 0
+        super().__init__()
+
+    def __getitem__(self, key):
+        _size, value = super().__getitem__(key)
+        super().move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def set(self, key, value, size: int):
+        if key in self:
+            self.pop(key)
+        if size > self.capacity:
+            return
+        super().__setitem__(key, (size, value))
+        self.total_size += size
+
+        while self.total_size > self.capacity:
+            surplus = next(iter(self))
+            self.pop(surplus)
+
+    def pop(self, key, *args):
+        if key not in self:
+            if args:
+                return args[0]
+            raise KeyError(key)
+        size, value = super().pop(key)
+        self.total_size -= size
+        return value
+
+    def clear(self):
+        super().clear()
+        self.total_size = 0
+
+
+def get_cache_version(key: str) -> int:
+    """Return the version counter stored in the shared cache under the given key."""
+    version = cache.get(key)
+    return version if isinstance(version, int) else 0
+
+
+def bump_cache_version(key: str) -> None:
+    """Increment the version counter stored in the shared cache.
+
+    Bumping the version invalidates all the data cached with the previous version
+    in every process.
+    """
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key expired or was evicted between `add` and `incr`.
+        cache.add(key, 1, timeout=None)
+
+
+def bump_cache_version_on_commit(key: str) -> None:
+    """Increment the version counter now and again after the transaction commits.
+
+    The second bump makes sure other processes don't keep data cached from reads
+    made before the change became visible to them.
+    """
+    bump_cache_version(key)
+    transaction.on_commit(lambda: bump_cache_version(key))
@@ -1,4 +1,4 @@
-from ..cache import CacheDict
+from ..cache import CacheDict, SizedCacheDict
 
 
 def test_capacity():
@@ -42,3 +42,60 @@ def test_eviction_order():
     assert 1 in cache
     assert 2 not in cache
     assert 3 in cache
+
+
+def test_sized_cache_capacity():
+    # given
+    cache = SizedCacheDict(10)
+    cache.set(1, "a", size=4)
+    cache.set(2, "b", size=4)
+
+    # when
+    cache.set(3, "c", size=4)
+
+    # then
+    assert 1 not in cache
+    assert cache[2] == "b"
+    assert cache[3] == "c"
+    assert cache.total_size == 8
+
+
+def test_sized_cache_eviction_order():
+    # given
+    cache = SizedCacheDict(10)
+    cache.set(1, "a", size=4)
+    cache.set(2, "b", size=4)
+
+    # when
+    cache[1]
+    cache.set(3, "c", size=4)
+
+    # then
+    assert 1 in cache
+    assert 2 not in cache
+    assert 3 in cache
+
+
+def test_sized_cache_skips_values_bigger_than_capacity():
+    # given
+    cache = SizedCacheDict(10)
+
+    # when
+    cache.set(1, "a", size=11)
+
+    # then
+    assert 1 not in cache
+    assert cache.total_size == 0
+
+
+def test_sized_cache_replace_value():
+    # given
+    cache = SizedCacheDict(10)
+    cache.set(1, "a", size=4)
+
+    # when
+    cache.set(1, "b", size=6)
+
+    # then
+    assert cache[1] == "b"
+    assert cache.total_size == 6
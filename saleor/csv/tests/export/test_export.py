@@ -898,6 +898,50 @@ def test_export_gift_cards_in_batches_to_xlsx(
     shutil.rmtree(tmpdir)
 
 
+@patch("saleor.csv.utils.export.BATCH_SIZE", 1)
+def test_export_gift_cards_in_batches_to_xlsx_saves_workbook_once(
+    gift_card,
+    gift_card_expiry_date,
+    tmpdir,
+):
+    # given
+    gift_cards = GiftCard.objects.order_by("pk")
+
+    table = etl.wrap([["code"]])
+    temp_file = NamedTemporaryFile(suffix=".xlsx")
+    etl.io.xlsx.toxlsx(table, temp_file.name)
+
+    # when
+    with patch(
+        "openpyxl.load_workbook",
+        wraps=openpyxl.load_workbook,
+    ) as mocked_load_workbook:
+        with patch(
+            "openpyxl.Workbook.save",
+            autospec=True,
+            side_effect=openpyxl.Workbook.save,
+        ) as mocked_save:
+            export_gift_cards_in_batches(
+                gift_cards,
+                ["code"],
+                ",",
+                temp_file,
+                "xlsx",
+            )
+
+    # then
+    assert gift_cards.count() > 1
+    mocked_load_workbook.assert_called_once()
+    mocked_save.assert_called_once()
+    sheet = openpyxl.load_workbook(temp_file).active
+    assert [row[0] for row in sheet.iter_rows(values_only=True)] == [
+        "code",
+        *[card.code for card in gift_cards],
+    ]
+
+    shutil.rmtree(tmpdir)
+
+
 def test_parse_input():
     data = {
         "collections": None,
@@ -1,4 +1,8 @@
+import csv
+import os
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date, datetime
 from tempfile import NamedTemporaryFile
 from typing import IO, TYPE_CHECKING, Any, Optional, Union
@@ -202,25 +206,26 @@ def export_products_in_batches(
     attributes = export_info.get("attributes")
     channels = export_info.get("channels")
 
-    for batch_pks in queryset_in_batches(queryset):
-        product_batch = (
-            Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-            .filter(pk__in=batch_pks)
-            .prefetch_related(
-                "attributevalues",
-                "variants",
-                "collections",
-                "media",
-                "product_type",
-                "category",
+    with open_export_file_writer(temporary_file, file_type, delimiter) as writer:
+        for batch_pks in queryset_in_batches(queryset):
+            product_batch = (
+                Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+                .filter(pk__in=batch_pks)
+                .prefetch_related(
+                    "attributevalues",
+                    "variants",
+                    "collections",
+                    "media",
+                    "product_type",
+                    "category",
+                )
             )
-        )
 
-        export_data = get_products_data(
-            product_batch, export_fields, attributes, warehouses, channels
-        )
+            export_data = get_products_data(
+                product_batch, export_fields, attributes, warehouses, channels
+            )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
+            writer.write(export_data, headers)
 
 
 def export_gift_cards_in_batches(
@@ -230,14 +235,15 @@ def export_gift_cards_in_batches(
     temporary_file: Any,
     file_type: str,
 ):
-    for batch_pks in queryset_in_batches(queryset):
-        gift_card_batch = GiftCard.objects.using(
-            settings.DATABASE_CONNECTION_REPLICA_NAME
-        ).filter(pk__in=batch_pks)
+    with open_export_file_writer(temporary_file, file_type, delimiter) as writer:
+        for batch_pks in queryset_in_batches(queryset):
+            gift_card_batch = GiftCard.objects.using(
+                settings.DATABASE_CONNECTION_REPLICA_NAME
+            ).filter(pk__in=batch_pks)
 
-        export_data = list(gift_card_batch.values(*export_fields))
+            export_data = list(gift_card_batch.values(*export_fields))
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+            writer.write(export_data, export_fields)
 
 
 def export_voucher_codes_in_batches(
@@ -247,14 +253,15 @@ def export_voucher_codes_in_batches(
     temporary_file: Any,
     file_type: str,
 ):
-    for batch_pks in queryset_in_batches(queryset):
-        voucher_codes_batch = VoucherCode.objects.using(
-            settings.DATABASE_CONNECTION_REPLICA_NAME
-        ).filter(pk__in=batch_pks)
+    with open_export_file_writer(temporary_file, file_type, delimiter) as writer:
+        for batch_pks in queryset_in_batches(queryset):
+            voucher_codes_batch = VoucherCode.objects.using(
+                settings.DATABASE_CONNECTION_REPLICA_NAME
+            ).filter(pk__in=batch_pks)
 
-        export_data = list(voucher_codes_batch.values(*export_fields))
+            export_data = list(voucher_codes_batch.values(*export_fields))
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+            writer.write(export_data, export_fields)
 
 
 def queryset_in_batches(queryset):
@@ -276,6 +283,69 @@ def queryset_in_batches(queryset):
         start_pk = pks[-1]
 
 
+class CSVFileWriter:
+    """Append rows to the CSV file through a single open file handle."""
+
+    def __init__(self, temporary_file: Any, delimiter: str):
+        self.file = open(temporary_file.name, "a", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file, delimiter=delimiter)
+
+    def write(self, export_data: list[dict[str, Union[str, bool]]], headers: list[str]):
+        self.writer.writerows(
+            [data.get(header, "") for header in headers] for data in export_data
+        )
+
+    def close(self):
+        self.file.close()
+
+
+class XLSXFileWriter:
+    """Stream rows to the XLSX file with a write-only workbook.
+
+    Rows of a write-only workbook are flushed to disk as they are appended, so
+    the memory usage doesn't grow with the number of exported rows. As write-only
+    workbooks can't be opened from an existing file, rows already saved in the
+    file, like the headers, are copied to the new workbook first; the file is
+    written when the writer is closed.
+    """
+
+    def __init__(self, temporary_file: Any):
+        # Imported here as openpyxl is needed only for XLSX exports, like in petl.
+        import openpyxl
+
+        self.file_name = temporary_file.name
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet()
+        if os.path.getsize(self.file_name):
+            existing_workbook = openpyxl.load_workbook(self.file_name, read_only=True)
+            for row in existing_workbook.active.iter_rows(values_only=True):
+                self.worksheet.append(row)
+            existing_workbook.close()
+
+    def write(self, export_data: list[dict[str, Union[str, bool]]], headers: list[str]):
+        for data in export_data:
+            self.worksheet.append([data.get(header, "") for header in headers])
+
+    def close(self):
+        self.workbook.save(self.file_name)
+
+
+@contextmanager
+def open_export_file_writer(
+    temporary_file: Any, file_type: str, delimiter: str
+) -> Iterator[Union[CSVFileWriter, XLSXFileWriter]]:
+    """Open a writer appending rows to the export file for the whole export."""
+    writer: Union[CSVFileWriter, XLSXFileWriter]
+    if file_type == FileTypes.CSV:
+        writer = CSVFileWriter(temporary_file, delimiter)
+    else:
+        writer = XLSXFileWriter(temporary_file)
+    try:
+        yield writer
+    finally:
+        writer.close()
+
+
 def append_to_file(
     export_data: list[dict[str, Union[str, bool]]],
     headers: list[str],
@@ -283,12 +353,8 @@ def append_to_file(
     file_type: str,
     delimiter: str,
 ):
-    table = etl.fromdicts(export_data, header=headers, missing="")
-
-    if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
-    else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
+    with open_export_file_writer(temporary_file, file_type, delimiter) as writer:
+        writer.write(export_data, headers)
 
 
 def save_csv_file_in_export_file(
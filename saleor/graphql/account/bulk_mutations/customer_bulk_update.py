@@ -8,6 +8,7 @@ from graphene.utils.str_converters import to_camel_case
 
 from ....account import models
 from ....account.events import CustomerEvents
+from ....account.jwt_user_cache import invalidate_jwt_user_cache_for_users
 from ....account.search import prepare_user_search_document_value
 from ....checkout import AddressType
 from ....core.tracing import traced_atomic_transaction
@@ -552,6 +553,9 @@ class CustomerBulkUpdate(BaseMutation, I18nMixin):
                 "search_document",
             ],
         )
+        invalidate_jwt_user_cache_for_users(
+            customer.pk for customer in customers_to_update
+        )
 
         return customers_to_update, old_instances
 
@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 
 from ....account import models
 from ....account.error_codes import AccountErrorCode
+from ....account.jwt_user_cache import invalidate_jwt_user_cache_for_users
 from ....permission.enums import AccountPermissions
 from ...core import ResolveInfo
 from ...core.doc_category import DOC_CATEGORY_USERS
@@ -56,4 +57,6 @@ class UserBulkSetActive(BaseBulkMutation):
     def bulk_action(  # type: ignore[override]
         cls, _info: ResolveInfo, queryset, /, *, is_active
     ):
+        user_ids = list(queryset.values_list("pk", flat=True))
         queryset.update(is_active=is_active)
+        invalidate_jwt_user_cache_for_users(user_ids)
@@ -18,6 +18,7 @@ from .bulk_mutations import (
     StaffBulkDelete,
     UserBulkSetActive,
 )
+from .dataloaders import UserByUserIdLoader
 from .enums import CountryCodeEnum
 from .filters import CustomerFilter, PermissionGroupFilter, StaffUserFilter
 from .mutations.account import (
@@ -216,7 +217,9 @@ class AccountQueries(graphene.ObjectType):
         qs = filter_connection_queryset(
             qs, kwargs, allow_replica=info.context.allow_replica
         )
-        return create_connection_slice(qs, info, kwargs, UserCountableConnection)
+        return create_connection_slice(
+            qs, info, kwargs, UserCountableConnection, node_loader=UserByUserIdLoader
+        )
 
     @staticmethod
     def resolve_permission_groups(_root, info: ResolveInfo, **kwargs):
@@ -1,10 +1,10 @@
 from functools import partial
 
 import graphql
+from django.conf import settings
 from django.urls import reverse
 from django.utils.functional import SimpleLazyObject
 from graphql import (
-    GraphQLCachedBackend,
     GraphQLCoreBackend,
     GraphQLScalarType,
     GraphQLSchema,
@@ -15,13 +15,13 @@ from graphql import (
 from graphql.backend.base import GraphQLDocument
 from graphql.execution import ExecutionResult
 
-from ..core.utils.cache import CacheDict
 from ..graphql.notifications.schema import ExternalNotificationMutations
 from .account.schema import AccountMutations, AccountQueries
 from .app.schema import AppMutations, AppQueries
 from .attribute.schema import AttributeMutations, AttributeQueries
 from .channel.schema import ChannelMutations, ChannelQueries
 from .checkout.schema import CheckoutMutations, CheckoutQueries
+from .core.document_cache import DocumentCacheBackend
 from .core.enums import unit_enums
 from .core.federation.schema import build_federated_schema
 from .core.schema import CoreMutations, CoreQueries
@@ -194,8 +194,25 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         document_string: str,  # type: ignore[override]
     ) -> GraphQLDocument:
         # validate eagerly so we can cache the result
+        document_ast, validation_errors = self.parse_and_validate(
+            schema, document_string
+        )
+        return self.document_from_ast(
+            schema, document_string, document_ast, validation_errors
+        )
+
+    @staticmethod
+    def parse_and_validate(schema: GraphQLSchema, document_string: str):
         document_ast = parse(document_string)
-        validation_errors = validate(schema, document_ast)
+        return document_ast, validate(schema, document_ast)
+
+    def document_from_ast(
+        self,
+        schema: GraphQLSchema,
+        document_string: str,
+        document_ast,
+        validation_errors=None,
+    ) -> GraphQLDocument:
         if validation_errors:
             return GraphQLDocument(
                 schema=schema,
@@ -212,4 +229,8 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         )
 
 
-backend = GraphQLCachedBackend(SaleorGraphQLBackend(), cache_map=CacheDict(1000))
+backend = DocumentCacheBackend(
+    SaleorGraphQLBackend(),
+    capacity_bytes=settings.GRAPHQL_DOCUMENT_CACHE_MAX_BYTES,
+    use_shared_cache=settings.GRAPHQL_DOCUMENT_SHARED_CACHE_ENABLED,
+)
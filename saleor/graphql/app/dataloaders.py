@@ -7,6 +7,12 @@ from django.utils.functional import LazyObject
 from promise import Promise
 
 from ...app.models import App, AppExtension, AppToken
+from ...app.token_cache import (
+    cache_app_ids_for_tokens,
+    discard_cached_tokens,
+    get_app_token_cache_version,
+    get_cached_app_ids_for_tokens,
+)
 from ...core.auth import get_token_from_request
 from ...core.utils.lazyobjects import unwrap_lazy
 from ..core import SaleorContext
@@ -80,8 +86,32 @@ class AppByTokenLoader(DataLoader):
     context_key = "app_by_token"
 
     def batch_load(self, keys):
+        version = get_app_token_cache_version()
+        authed_apps = get_cached_app_ids_for_tokens(keys)
+        apps = self._get_active_apps(authed_apps.values())
+
+        # Cached tokens of apps which are no longer active are verified again, as
+        # the cached entry may be stale.
+        stale_tokens = [
+            raw_token for raw_token, app_id in authed_apps.items() if app_id not in apps
+        ]
+        if stale_tokens:
+            discard_cached_tokens(stale_tokens)
+            for raw_token in stale_tokens:
+                del authed_apps[raw_token]
+
+        tokens_to_verify = [key for key in keys if key not in authed_apps]
+        if tokens_to_verify:
+            verified_apps = self._verify_tokens(tokens_to_verify)
+            cache_app_ids_for_tokens(verified_apps, version)
+            authed_apps.update(verified_apps)
+            apps.update(self._get_active_apps(verified_apps.values()))
+
+        return [apps.get(authed_apps.get(key)) for key in keys]
+
+    def _verify_tokens(self, raw_tokens):
         last_4s_to_raw_token_map = defaultdict(list)
-        for raw_token in keys:
+        for raw_token in raw_tokens:
             last_4s_to_raw_token_map[raw_token[-4:]].append(raw_token)
 
         tokens = (
@@ -94,17 +124,17 @@ class AppByTokenLoader(DataLoader):
             for raw_token in last_4s_to_raw_token_map[token_last_4]:
                 if check_password(raw_token, auth_token):
                     authed_apps[raw_token] = app_id
+        return authed_apps
 
-        apps = (
+    def _get_active_apps(self, app_ids):
+        if not app_ids:
+            return {}
+        return (
             App.objects.using(self.database_connection_name)
-            .filter(
-                id__in=authed_apps.values(), is_active=True, removed_at__isnull=True
-            )
+            .filter(id__in=app_ids, is_active=True, removed_at__isnull=True)
             .in_bulk()
         )
 
-        return [apps.get(authed_apps.get(key)) for key in keys]
-
 
 class ThumbnailByAppIdSizeAndFormatLoader(BaseThumbnailBySizeAndFormatLoader):
     context_key = "thumbnail_by_app_size_and_format"
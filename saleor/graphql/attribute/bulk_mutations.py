@@ -44,9 +44,9 @@ class AttributeBulkDelete(ModelBulkDeleteMutation):
         _, attribute_pks = resolve_global_ids_to_primary_keys(ids, "Attribute")
         product_ids = cls.get_product_ids_to_update(attribute_pks)
         response = super().perform_mutation(root, info, ids=ids)
-        product_models.Product.objects.filter(id__in=product_ids).update(
-            search_index_dirty=True
-        )
+        product_models.Product.objects.filter(
+            id__in=product_ids
+        ).mark_search_index_dirty()
         return response
 
     @classmethod
@@ -118,9 +118,9 @@ class AttributeValueBulkDelete(ModelBulkDeleteMutation):
         _, attribute_pks = resolve_global_ids_to_primary_keys(ids, "AttributeValue")
         product_ids = cls.get_product_ids_to_update(attribute_pks)
         response = super().perform_mutation(root, info, ids=ids)
-        product_models.Product.objects.filter(id__in=product_ids).update(
-            search_index_dirty=True
-        )
+        product_models.Product.objects.filter(
+            id__in=product_ids
+        ).mark_search_index_dirty()
         return response
 
     @classmethod
@@ -51,9 +51,9 @@ class AttributeValueDelete(ModelDeleteMutation, ModelWithExtRefMutation):
         response = super().perform_mutation(
             _root, info, external_reference=external_reference, id=id
         )
-        product_models.Product.objects.filter(id__in=product_ids).update(
-            search_index_dirty=True
-        )
+        product_models.Product.objects.filter(
+            id__in=product_ids
+        ).mark_search_index_dirty()
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.attribute_value_deleted, instance)
         cls.call_event(manager.attribute_updated, instance.attribute)
@@ -5,6 +5,7 @@ from django.db.models import Exists, OuterRef, Q
 from ....attribute import models as models
 from ....permission.enums import ProductTypePermissions
 from ....product import models as product_models
+from ....product.search import ATTRIBUTE_VALUE_SEARCH_FIELDS
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
 from ...core.descriptions import ADDED_IN_310
@@ -79,6 +80,11 @@ class AttributeValueUpdate(AttributeValueCreate, ModelWithExtRefMutation):
             cleaned_input["content_type"] = ""
         elif cleaned_input.get("file_url"):
             cleaned_input["value"] = ""
+        # Products have to be reindexed only when the value's searchable data changes.
+        cleaned_input["search_index_dirty"] = any(
+            field in cleaned_input and cleaned_input[field] != getattr(instance, field)
+            for field in ATTRIBUTE_VALUE_SEARCH_FIELDS
+        )
         return cleaned_input
 
     @classmethod
@@ -93,6 +99,15 @@ class AttributeValueUpdate(AttributeValueCreate, ModelWithExtRefMutation):
 
     @classmethod
     def post_save_action(cls, info: ResolveInfo, instance, cleaned_input):
+        if cleaned_input["search_index_dirty"]:
+            cls.mark_products_search_index_dirty(instance)
+
+        manager = get_plugin_manager_promise(info.context).get()
+        cls.call_event(manager.attribute_value_updated, instance)
+        cls.call_event(manager.attribute_updated, instance.attribute)
+
+    @classmethod
+    def mark_products_search_index_dirty(cls, instance):
         with transaction.atomic():
             variants = product_models.ProductVariant.objects.filter(
                 Exists(instance.variantassignments.filter(variant_id=OuterRef("id")))
@@ -118,10 +133,6 @@ class AttributeValueUpdate(AttributeValueCreate, ModelWithExtRefMutation):
                 .order_by("pk")
             )
             for batch_pks in queryset_in_batches(qs):
-                product_models.Product.objects.filter(pk__in=batch_pks).update(
-                    search_index_dirty=True
-                )
-
-        manager = get_plugin_manager_promise(info.context).get()
-        cls.call_event(manager.attribute_value_updated, instance)
-        cls.call_event(manager.attribute_updated, instance.attribute)
+                product_models.Product.objects.filter(
+                    pk__in=batch_pks
+                ).mark_search_index_dirty()
@@ -118,6 +118,37 @@ def test_update_attribute_value_update_search_index_dirty_in_product(
 @freeze_time("2022-05-12 12:00:00")
 @mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
 @mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async")
+def test_update_attribute_value_not_searchable_field_search_index_not_dirty(
+    staff_api_client,
+    product,
+    permission_manage_product_types_and_attributes,
+):
+    # given
+    query = UPDATE_ATTRIBUTE_VALUE_MUTATION
+
+    first_attribute = get_product_attributes(product).first()
+    value = get_product_attribute_values(product, first_attribute).first()
+    product.search_index_dirty = False
+    product.save(update_fields=["search_index_dirty"])
+
+    node_id = graphene.Node.to_global_id("AttributeValue", value.id)
+    variables = {
+        "input": {"name": value.name, "externalReference": "test-ext-ref"},
+        "id": node_id,
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        query, variables, permissions=[permission_manage_product_types_and_attributes]
+    )
+    product.refresh_from_db(fields=["search_index_dirty"])
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["attributeValueUpdate"]["errors"]
+    assert product.search_index_dirty is False
+
+
 def test_update_attribute_value_trigger_webhooks(
     mocked_webhook_trigger,
     mocked_get_webhooks_for_event,
@@ -15,6 +15,7 @@ from .....plugins.manager import get_plugins_manager
 from .....product.models import Product, ProductVariant, ProductVariantChannelListing
 from .....product.utils.variant_prices import update_discounted_prices_for_promotion
 from .....product.utils.variants import fetch_variants_for_promotion_rules
+from .....shipping.rate_table import get_shipping_rate_table
 from .....warehouse.models import Stock
 from ....core.utils import to_global_id_or_none
 from ....tests.utils import get_graphql_content
@@ -1307,36 +1308,63 @@ def test_add_checkout_lines_gift_discount_applies(
     assert not data["errors"]
 
 
+MUTATION_CHECKOUT_SHIPPING_ADDRESS_UPDATE = (
+    FRAGMENT_CHECKOUT
+    + """
+        mutation UpdateCheckoutShippingAddress(
+          $id: ID, $shippingAddress: AddressInput!
+        ) {
+          checkoutShippingAddressUpdate(
+            id: $id, shippingAddress: $shippingAddress
+          ) {
+            errors {
+              field
+              message
+            }
+            checkout {
+              ...Checkout
+            }
+          }
+        }
+    """
+)
+
+
 @pytest.mark.django_db
 @pytest.mark.count_queries(autouse=False)
 def test_checkout_shipping_address_update(
     api_client, graphql_address_data, checkout_with_variants, count_queries
 ):
-    query = (
-        FRAGMENT_CHECKOUT
-        + """
-            mutation UpdateCheckoutShippingAddress(
-              $id: ID, $shippingAddress: AddressInput!
-            ) {
-              checkoutShippingAddressUpdate(
-                id: $id, shippingAddress: $shippingAddress
-              ) {
-                errors {
-                  field
-                  message
-                }
-                checkout {
-                  ...Checkout
-                }
-              }
-            }
-        """
+    variables = {
+        "id": to_global_id_or_none(checkout_with_variants),
+        "shippingAddress": graphql_address_data,
+    }
+    response = get_graphql_content(
+        api_client.post_graphql(MUTATION_CHECKOUT_SHIPPING_ADDRESS_UPDATE, variables)
     )
+    assert not response["data"]["checkoutShippingAddressUpdate"]["errors"]
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_checkout_shipping_address_update_with_shipping_rate_table(
+    api_client,
+    graphql_address_data,
+    checkout_with_variants,
+    shipping_zone,
+    settings,
+    count_queries,
+    _clear_shipping_rate_tables,
+):
+    settings.SHIPPING_RATE_TABLE_ENABLED = True
+    get_shipping_rate_table(checkout_with_variants.channel_id)
     variables = {
         "id": to_global_id_or_none(checkout_with_variants),
         "shippingAddress": graphql_address_data,
     }
-    response = get_graphql_content(api_client.post_graphql(query, variables))
+    response = get_graphql_content(
+        api_client.post_graphql(MUTATION_CHECKOUT_SHIPPING_ADDRESS_UPDATE, variables)
+    )
     assert not response["data"]["checkoutShippingAddressUpdate"]["errors"]
 
 
@@ -36,6 +36,9 @@ class RequestWithUser(HttpRequest):
 
 
 def set_decoded_auth_token(request: SaleorContext):
+    if hasattr(request, "decoded_auth_token"):
+        # The token is decoded once per request.
+        return
     auth_token = get_token_from_request(request)
     if auth_token:
         request.decoded_auth_token = jwt_decode_with_exception_handler(auth_token)
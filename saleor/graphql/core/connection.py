@@ -11,6 +11,7 @@ from typing import (
 
 import graphene
 from django.conf import settings
+from django.core.exceptions import FieldError
 from django.db.models import Model as DjangoModel
 from django.db.models import Q, QuerySet
 from graphene.relay import Connection
@@ -23,12 +24,15 @@ from graphql_relay.utils import base64, unbase64
 from ...channel.exceptions import ChannelNotDefined, NoDefaultChannel
 from ..channel import ChannelContext, ChannelQsContext
 from ..channel.utils import get_default_channel_slug_or_graphql_error
+from ..core.descriptions import ADDED_IN_320
 from ..core.enums import OrderDirection
 from ..core.types import BaseConnection, NonNullList
 from ..utils.sorting import sort_queryset_for_connection
+from .total_count import TotalCount, get_total_count_strategy
 
 if TYPE_CHECKING:
     from ..core import ResolveInfo
+    from ..core.dataloaders import DataLoader
 
 ConnectionArguments = dict[str, Any]
 
@@ -205,7 +209,7 @@ def _get_page_info(matching_records, cursor, first, last):
     return page_info
 
 
-def _get_edges_for_connection(edge_type, qs, args, sorting_fields):
+def _get_edges_for_connection(edge_type, qs, args, sorting_fields, load_nodes=None):
     before = args.get("before")
     after = args.get("after")
     first = args.get("first")
@@ -217,6 +221,13 @@ def _get_edges_for_connection(edge_type, qs, args, sorting_fields):
     if not first and not last:
         return [], {"has_previous_page": False, "has_next_page": False}
 
+    if load_nodes:
+        keyset = _get_keyset(qs, sorting_fields)
+        if keyset is not None:
+            return _get_edges_for_keyset(
+                edge_type, keyset, cursor, first, last, load_nodes
+            )
+
     if last:
         start_slice, end_slice = 1, None
     else:
@@ -245,6 +256,40 @@ def _get_edges_for_connection(edge_type, qs, args, sorting_fields):
     return edges, page_info
 
 
+def _get_keyset(qs, sorting_fields) -> Optional[list[tuple]]:
+    """Return the primary keys and the sorting values of the matching records.
+
+    Return `None` when any of the sorting fields can't be fetched from the database,
+    as it's resolved by the model instance.
+    """
+    try:
+        keyset_qs = qs.values_list("pk", *sorting_fields)
+    except FieldError:
+        return None
+    return list(keyset_qs)
+
+
+def _get_edges_for_keyset(edge_type, keyset, cursor, first, last, load_nodes):
+    requested_count = first or last
+    page_info = _get_page_info(keyset, cursor, first, last)
+    # With `last`, the records are fetched in the reversed order.
+    page_keyset = keyset[:requested_count]
+    if last:
+        page_keyset.reverse()
+
+    nodes = load_nodes([pk for pk, *_values in page_keyset])
+    edges = [
+        edge_type(node=node, cursor=to_global_cursor(values))
+        for node, (_pk, *values) in zip(nodes, page_keyset)
+        # Skip records deleted after the keyset was fetched.
+        if node is not None
+    ]
+    if edges:
+        page_info["start_cursor"] = edges[0].cursor
+        page_info["end_cursor"] = edges[-1].cursor
+    return edges, page_info
+
+
 def _get_id_coercion(qs: QuerySet) -> Callable[[str], Any]:
     return qs.model.id.field.to_python if hasattr(qs.model, "id") else int
 
@@ -255,8 +300,13 @@ def connection_from_queryset_slice(
     connection_type: Any = Connection,
     edge_type: Any = Edge,
     pageinfo_type: Any = PageInfo,
+    load_nodes: Optional[Callable[[list], list]] = None,
 ) -> Connection:
-    """Create a connection object from a QuerySet."""
+    """Create a connection object from a QuerySet.
+
+    When `load_nodes` is given, only the primary keys and the sorting values are
+    fetched with the queryset, and the nodes of the page are loaded by the function.
+    """
     args = args or {}
     before = args.get("before")
     after = args.get("after")
@@ -294,18 +344,18 @@ def connection_from_queryset_slice(
         raise GraphQLError("Received cursor is invalid.")
     filtered_qs = filtered_qs[:end_margin]
     edges, page_info = _get_edges_for_connection(
-        edge_type, filtered_qs, args, sorting_fields
+        edge_type, filtered_qs, args, sorting_fields, load_nodes
     )
 
     if "total_count" in connection_type._meta.fields:
-
-        def get_total_count():
-            return qs.count()
-
+        total_count = TotalCount(
+            qs, get_total_count_strategy(connection_type._meta.name)
+        )
         return connection_type(
             edges=edges,
             page_info=pageinfo_type(**page_info),
-            total_count=get_total_count,
+            total_count=total_count.get_count,
+            total_count_is_exact=total_count.is_exact,
         )
 
     return connection_type(
@@ -322,7 +372,14 @@ def create_connection_slice(
     edge_type=None,
     pageinfo_type=graphene.relay.PageInfo,
     max_limit: Optional[int] = None,
+    node_loader: Optional[type["DataLoader"]] = None,
 ):
+    """Slice the iterable for the connection.
+
+    Pass `node_loader` to load nodes of querysets by IDs with the data loader, so
+    nodes already loaded in the request are not fetched again. The loaded nodes
+    don't have the annotations of the queryset.
+    """
     _validate_slice_args(info, args, max_limit)
 
     if isinstance(iterable, list):
@@ -347,6 +404,12 @@ def create_connection_slice(
 
     from ...core.db.connection import allow_writer_in_context
 
+    load_nodes = None
+    if node_loader:
+
+        def load_nodes(pks):
+            return node_loader(info.context).load_many(pks).get()
+
     with allow_writer_in_context(info.context):
         slice = connection_from_queryset_slice(
             queryset,
@@ -354,6 +417,7 @@ def create_connection_slice(
             connection_type,
             edge_type or connection_type.Edge,
             pageinfo_type or graphene.relay.PageInfo,
+            load_nodes=load_nodes,
         )
 
     if isinstance(iterable, ChannelQsContext):
@@ -446,6 +510,7 @@ def slice_connection_iterable(
 
     if "total_count" in connection_type._meta.fields:
         slice.total_count = _len
+        slice.total_count_is_exact = True
 
     return slice
 
@@ -682,6 +747,12 @@ class CountableConnection(NonNullConnection):
         abstract = True
 
     total_count = graphene.Int(description="A total count of items in the collection.")
+    total_count_is_exact = graphene.Boolean(
+        description=(
+            "Determine if `totalCount` is the exact number of items in the "
+            "collection. It's `false` when the count is estimated." + ADDED_IN_320
+        )
+    )
 
     @staticmethod
     def resolve_total_count(root, _info):
@@ -697,3 +768,18 @@ class CountableConnection(NonNullConnection):
             return total_count()
 
         return total_count
+
+    @staticmethod
+    def resolve_total_count_is_exact(root, _info):
+        try:
+            if isinstance(root, dict):
+                is_exact = root["total_count_is_exact"]
+            else:
+                is_exact = root.total_count_is_exact
+        except (AttributeError, KeyError):
+            return None
+
+        if callable(is_exact):
+            return is_exact()
+
+        return is_exact
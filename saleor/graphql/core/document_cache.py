@@ -0,0 +1,170 @@
+import hashlib
+import pickle
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import GraphQLBackend, GraphQLDocument, GraphQLSchema
+from graphql.backend.cache import get_unique_schema_id
+
+from ...core.utils.cache import SizedCacheDict
+
+if TYPE_CHECKING:
+    from ..api import SaleorGraphQLBackend
+
+DOCUMENT_CACHE_KEY = "graphql_document:{schema_id}:{document_id}"
+
+CACHE_SOURCE_LOCAL = "local"
+CACHE_SOURCE_SHARED = "shared"
+CACHE_SOURCE_MISS = "miss"
+
+
+@dataclass
+class DocumentCacheLookup:
+    source: str
+    # Time spent on parsing and validating the document when it was first seen;
+    # on hits it's the time the lookup saved.
+    parse_time: float
+
+    @property
+    def is_hit(self) -> bool:
+        return self.source != CACHE_SOURCE_MISS
+
+
+@dataclass
+class DocumentCacheStats:
+    local_hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+    time_saved: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.local_hits + self.shared_hits + self.misses
+        if not total:
+            return 0.0
+        return (self.local_hits + self.shared_hits) / total
+
+
+def get_document_id(document_string: str) -> str:
+    return hashlib.sha256(document_string.encode("utf-8")).hexdigest()
+
+
+class DocumentCacheBackend(GraphQLBackend):
+    """Two-tier cache of parsed and validated GraphQL documents.
+
+    The first tier is an in-process LRU bounded by the size of cached documents.
+    The second tier is the shared cache, which stores pickled ASTs of valid
+    documents keyed by the schema hash and the document hash, so new workers don't
+    have to parse and validate the queries that other workers have already seen.
+
+    Documents with validation errors are kept only in the process-local tier.
+    """
+
+    def __init__(
+        self,
+        backend: "SaleorGraphQLBackend",
+        capacity_bytes: int,
+        use_shared_cache: bool = True,
+    ):
+        self.backend = backend
+        self.cache_map = SizedCacheDict(capacity_bytes)
+        self.use_shared_cache = use_shared_cache
+        self.stats = DocumentCacheStats()
+
+    def document_from_string(  # type: ignore[override]
+        self, schema: GraphQLSchema, document_string: str
+    ) -> GraphQLDocument:
+        document, _lookup = self.get_document(schema, document_string)
+        return document
+
+    def get_document(
+        self, schema: GraphQLSchema, document_string: str
+    ) -> tuple[GraphQLDocument, DocumentCacheLookup]:
+        document_id = get_document_id(document_string)
+        return self.get_document_by_id(schema, document_id, document_string)
+
+    def get_document_by_id(
+        self,
+        schema: GraphQLSchema,
+        document_id: str,
+        document_string: Optional[str] = None,
+    ) -> tuple[Optional[GraphQLDocument], DocumentCacheLookup]:
+        """Return the document for the given hash.
+
+        When `document_string` is not provided and the document is in none of the
+        cache tiers, `None` is returned instead of the document.
+        """
+        key = self.get_cache_key(schema, document_id)
+        if cached := self.cache_map.get(key):
+            document, parse_time = cached
+            self.stats.local_hits += 1
+            self.stats.time_saved += parse_time
+            return document, DocumentCacheLookup(CACHE_SOURCE_LOCAL, parse_time)
+
+        if self.use_shared_cache and (shared := cache.get(key)):
+            pickled_ast, cached_document_string, parse_time = shared
+            document = self.backend.document_from_ast(
+                schema, cached_document_string, pickle.loads(pickled_ast)
+            )
+            self.cache_map.set(
+                key,
+                (document, parse_time),
+                size=len(pickled_ast) + len(cached_document_string),
+            )
+            self.stats.shared_hits += 1
+            self.stats.time_saved += parse_time
+            return document, DocumentCacheLookup(CACHE_SOURCE_SHARED, parse_time)
+
+        if document_string is None:
+            return None, DocumentCacheLookup(CACHE_SOURCE_MISS, 0.0)
+
+        document, parse_time = self._parse_and_store(schema, key, document_string)
+        self.stats.misses += 1
+        return document, DocumentCacheLookup(CACHE_SOURCE_MISS, parse_time)
+
+    def warm_up(self, schema: GraphQLSchema, document_strings: list[str]) -> int:
+        """Parse, validate and cache the given documents.
+
+        Return the number of documents that were not cached before.
+        """
+        added = 0
+        for document_string in document_strings:
+            _document, lookup = self.get_document(schema, document_string)
+            if not lookup.is_hit:
+                added += 1
+        return added
+
+    @staticmethod
+    def get_cache_key(schema: GraphQLSchema, document_id: str) -> str:
+        return DOCUMENT_CACHE_KEY.format(
+            schema_id=get_unique_schema_id(schema), document_id=document_id
+        )
+
+    def _parse_and_store(
+        self, schema: GraphQLSchema, key: str, document_string: str
+    ) -> tuple[GraphQLDocument, float]:
+        start = perf_counter()
+        document_ast, validation_errors = self.backend.parse_and_validate(
+            schema, document_string
+        )
+        parse_time = perf_counter() - start
+        document = self.backend.document_from_ast(
+            schema, document_string, document_ast, validation_errors
+        )
+
+        pickled_ast = pickle.dumps(document_ast)
+        self.cache_map.set(
+            key,
+            (document, parse_time),
+            size=len(pickled_ast) + len(document_string),
+        )
+        if self.use_shared_cache and not validation_errors:
+            cache.set(
+                key,
+                (pickled_ast, document_string, parse_time),
+                timeout=settings.GRAPHQL_DOCUMENT_CACHE_TIMEOUT.total_seconds(),
+            )
+        return document, parse_time
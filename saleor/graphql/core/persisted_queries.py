@@ -0,0 +1,100 @@
+"""Support for Automatic Persisted Queries.
+
+Clients send a sha256 hash of the query in the `persistedQuery` extension instead
+of the whole document. When the hash is not known yet, the server responds with
+`PersistedQueryNotFound` and the client retries with both the query and the hash,
+which registers the query in the document cache.
+
+In the allow-list mode, only queries from the `GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST`
+manifest are accepted, and registering new queries is not possible.
+"""
+
+import json
+from functools import lru_cache
+from typing import Optional
+
+from django.conf import settings
+from graphql.error import GraphQLError
+
+PERSISTED_QUERY_VERSION = 1
+
+
+class PersistedQueryNotFound(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "PersistedQueryNotFound",
+            extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+        )
+
+
+class PersistedQueryNotAllowed(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "PersistedQueryNotAllowed",
+            extensions={"code": "PERSISTED_QUERY_NOT_ALLOWED"},
+        )
+
+
+class PersistedQueryNotSupported(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "PersistedQueryNotSupported",
+            extensions={"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+        )
+
+
+class PersistedQueryHashMismatch(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "Provided sha256Hash does not match the query.",
+            extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+        )
+
+
+def get_persisted_query_hash(extensions) -> Optional[str]:
+    """Return the query hash from the `persistedQuery` extension of the request.
+
+    Extensions can be provided as a dict in the request body or as a JSON
+    encoded string in the query params of GET requests.
+    """
+    if not extensions:
+        return None
+    if isinstance(extensions, str):
+        try:
+            extensions = json.loads(extensions)
+        except ValueError:
+            return None
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return None
+    version = persisted_query.get("version", PERSISTED_QUERY_VERSION)
+    if version != PERSISTED_QUERY_VERSION:
+        return None
+    query_hash = persisted_query.get("sha256Hash")
+    if not isinstance(query_hash, str):
+        return None
+    return query_hash.lower()
+
+
+@lru_cache(maxsize=1)
+def _load_allow_list(path: str) -> dict[str, str]:
+    with open(path) as f:
+        manifest = json.load(f)
+    # Support both a plain `{hash: query}` mapping and the Apollo persisted query
+    # manifest format with a list of operations.
+    if isinstance(manifest, dict) and "operations" in manifest:
+        return {
+            operation["id"].lower(): operation["body"]
+            for operation in manifest["operations"]
+        }
+    return {query_hash.lower(): query for query_hash, query in manifest.items()}
+
+
+def get_persisted_queries_allow_list() -> Optional[dict[str, str]]:
+    """Return the allowed queries by their hashes, or None if allow-list is off."""
+    path = settings.GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST
+    if not path:
+        return None
+    return _load_allow_list(path)
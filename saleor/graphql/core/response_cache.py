@@ -0,0 +1,227 @@
+"""Cache of responses to anonymous storefront queries.
+
+Only queries whose root fields are listed in `ROOT_FIELD_TAGS` are cached. Each
+response is tagged with the tags of its root fields, and the current versions of
+the tags are part of the cache key, so bumping a tag's version on a catalogue
+change makes all responses with the tag unreachable.
+
+Responses older than `GRAPHQL_RESPONSE_CACHE_TIMEOUT` are stale. A stale response is
+served for up to `GRAPHQL_RESPONSE_CACHE_STALE_TIMEOUT` while a single request
+executes the query again and refreshes the cache.
+"""
+
+import hashlib
+import json
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+from graphql import GraphQLDocument
+from graphql.execution import ExecutionResult
+from graphql.language.ast import Field, OperationDefinition
+
+from ... import __version__ as saleor_version
+from ...core.auth import get_token_from_request
+from .document_cache import get_document_id
+
+RESPONSE_CACHE_KEY = "graphql_response:{version}:{key}"
+RESPONSE_CACHE_TAG_KEY = "graphql_response_tag:{tag}"
+RESPONSE_CACHE_REVALIDATION_KEY = "graphql_response_revalidation:{key}"
+# How long other requests get the stale response while one request revalidates it.
+RESPONSE_CACHE_REVALIDATION_TIMEOUT = 30
+
+RESPONSE_CACHE_HEADER = "X-Saleor-Cache"
+
+
+class ResponseCacheStatus:
+    HIT = "HIT"
+    # The response is stale and is being refreshed by another request.
+    STALE = "STALE"
+    MISS = "MISS"
+
+
+class ResponseCacheTag:
+    CATEGORY = "category"
+    COLLECTION = "collection"
+    PRODUCT = "product"
+
+    ALL = [CATEGORY, COLLECTION, PRODUCT]
+
+
+# Root fields of cacheable queries with the tags invalidating their responses.
+# Categories and collections embed products, and products embed their categories
+# and collections.
+ROOT_FIELD_TAGS = {
+    "categories": [ResponseCacheTag.CATEGORY, ResponseCacheTag.PRODUCT],
+    "category": [ResponseCacheTag.CATEGORY, ResponseCacheTag.PRODUCT],
+    "collections": [ResponseCacheTag.COLLECTION, ResponseCacheTag.PRODUCT],
+    "collection": [ResponseCacheTag.COLLECTION, ResponseCacheTag.PRODUCT],
+    "products": [
+        ResponseCacheTag.PRODUCT,
+        ResponseCacheTag.CATEGORY,
+        ResponseCacheTag.COLLECTION,
+    ],
+    "product": [
+        ResponseCacheTag.PRODUCT,
+        ResponseCacheTag.CATEGORY,
+        ResponseCacheTag.COLLECTION,
+    ],
+}
+
+# Plugin manager events with the tags they invalidate.
+EVENT_TAGS = {
+    "category_created": [ResponseCacheTag.CATEGORY],
+    "category_updated": [ResponseCacheTag.CATEGORY],
+    "category_deleted": [ResponseCacheTag.CATEGORY],
+    "collection_created": [ResponseCacheTag.COLLECTION],
+    "collection_updated": [ResponseCacheTag.COLLECTION],
+    "collection_deleted": [ResponseCacheTag.COLLECTION],
+    "collection_metadata_updated": [ResponseCacheTag.COLLECTION],
+    "product_created": [ResponseCacheTag.PRODUCT],
+    "product_updated": [ResponseCacheTag.PRODUCT],
+    "product_deleted": [ResponseCacheTag.PRODUCT],
+    "product_media_created": [ResponseCacheTag.PRODUCT],
+    "product_media_updated": [ResponseCacheTag.PRODUCT],
+    "product_media_deleted": [ResponseCacheTag.PRODUCT],
+    "product_metadata_updated": [ResponseCacheTag.PRODUCT],
+    "product_variant_created": [ResponseCacheTag.PRODUCT],
+    "product_variant_updated": [ResponseCacheTag.PRODUCT],
+    "product_variant_deleted": [ResponseCacheTag.PRODUCT],
+    "product_variant_out_of_stock": [ResponseCacheTag.PRODUCT],
+    "product_variant_back_in_stock": [ResponseCacheTag.PRODUCT],
+    "product_variant_stock_updated": [ResponseCacheTag.PRODUCT],
+    "product_variant_metadata_updated": [ResponseCacheTag.PRODUCT],
+    # Channel settings and availability affect responses of all cached queries.
+    "channel_updated": ResponseCacheTag.ALL,
+    "channel_status_changed": ResponseCacheTag.ALL,
+}
+
+
+def _get_operation(
+    document: GraphQLDocument, operation_name: Optional[str]
+) -> Optional[OperationDefinition]:
+    operations = [
+        definition
+        for definition in document.document_ast.definitions
+        if isinstance(definition, OperationDefinition)
+    ]
+    if operation_name is None:
+        return operations[0] if len(operations) == 1 else None
+    for operation in operations:
+        if operation.name and operation.name.value == operation_name:
+            return operation
+    return None
+
+
+def get_response_cache_tags(
+    request: HttpRequest, document: GraphQLDocument, operation_name: Optional[str]
+) -> Optional[list[str]]:
+    """Return the tags of the response if it can be cached, otherwise `None`."""
+    if not settings.GRAPHQL_RESPONSE_CACHE_ENABLED:
+        return None
+    if get_token_from_request(request):
+        return None
+    operation = _get_operation(document, operation_name)
+    if operation is None or operation.operation != "query":
+        return None
+    tags: set[str] = set()
+    for selection in operation.selection_set.selections:
+        # Fragments on the root type are not inspected.
+        if not isinstance(selection, Field):
+            return None
+        name = selection.name.value
+        if name == "__typename":
+            continue
+        if name not in ROOT_FIELD_TAGS:
+            return None
+        tags.update(ROOT_FIELD_TAGS[name])
+    return sorted(tags) or None
+
+
+def _get_tag_key(tag: str) -> str:
+    return RESPONSE_CACHE_TAG_KEY.format(tag=tag)
+
+
+def get_response_cache_key(
+    request: HttpRequest,
+    document: GraphQLDocument,
+    operation_name: Optional[str],
+    variables: Optional[dict],
+    tags: list[str],
+) -> str:
+    tag_keys = [_get_tag_key(tag) for tag in tags]
+    tag_versions = cache.get_many(tag_keys)
+    # The channel is passed as an argument, so it's part of the document or the
+    # variables. The scheme and the host are used to build absolute URLs in
+    # responses.
+    key_data = json.dumps(
+        [
+            get_document_id(document.document_string),
+            operation_name,
+            variables,
+            request.scheme,
+            request.get_host(),
+            [tag_versions.get(tag_key, 0) for tag_key in tag_keys],
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    key = hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+    return RESPONSE_CACHE_KEY.format(version=saleor_version, key=key)
+
+
+def get_cached_response(key: str) -> tuple[Optional[ExecutionResult], str]:
+    """Return the cached response and the cache status.
+
+    A stale response is returned only when another request is already refreshing it.
+    """
+    cached = cache.get(key)
+    if not cached:
+        return None, ResponseCacheStatus.MISS
+    response, created_at = cached
+    if time.time() - created_at <= settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT:
+        return response, ResponseCacheStatus.HIT
+    if cache.add(
+        RESPONSE_CACHE_REVALIDATION_KEY.format(key=key),
+        1,
+        timeout=RESPONSE_CACHE_REVALIDATION_TIMEOUT,
+    ):
+        return None, ResponseCacheStatus.MISS
+    return response, ResponseCacheStatus.STALE
+
+
+def cache_response(key: str, response: ExecutionResult):
+    if response.errors or response.invalid:
+        return
+    timeout = (
+        settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT
+        + settings.GRAPHQL_RESPONSE_CACHE_STALE_TIMEOUT
+    )
+    cache.set(key, (response, time.time()), timeout=timeout)
+    cache.delete(RESPONSE_CACHE_REVALIDATION_KEY.format(key=key))
+
+
+def invalidate_response_cache(tags: list[str]):
+    for tag in tags:
+        tag_key = _get_tag_key(tag)
+        cache.add(tag_key, 0, timeout=None)
+        try:
+            cache.incr(tag_key)
+        except ValueError:
+            # The key was evicted between `add` and `incr`; a new version
+            # invalidates the responses as well.
+            cache.set(tag_key, int(time.time()), timeout=None)
+
+
+def invalidate_response_cache_for_event(event: str):
+    if settings.GRAPHQL_RESPONSE_CACHE_ENABLED and event in EVENT_TAGS:
+        invalidate_response_cache(EVENT_TAGS[event])
+
+
+def set_response_cache_status(request: HttpRequest, status: str):
+    statuses = getattr(request, "response_cache_statuses", None)
+    if statuses is None:
+        statuses = request.response_cache_statuses = []  # type: ignore[attr-defined]
+    statuses.append(status)
@@ -0,0 +1,98 @@
+import pytest
+from django.core.cache import cache
+
+from ...api import SaleorGraphQLBackend, schema
+from ..document_cache import (
+    CACHE_SOURCE_LOCAL,
+    CACHE_SOURCE_MISS,
+    CACHE_SOURCE_SHARED,
+    DocumentCacheBackend,
+    get_document_id,
+)
+
+QUERY = """
+    query {
+        shop {
+            name
+        }
+    }
+"""
+
+INVALID_QUERY = """
+    query {
+        shop {
+            notExistingField
+        }
+    }
+"""
+
+
+@pytest.fixture
+def document_cache_backend():
+    cache.clear()
+    return DocumentCacheBackend(SaleorGraphQLBackend(), capacity_bytes=1024 * 1024)
+
+
+def test_document_cache_miss_and_local_hit(document_cache_backend):
+    # when
+    document, first_lookup = document_cache_backend.get_document(schema, QUERY)
+    cached_document, second_lookup = document_cache_backend.get_document(schema, QUERY)
+
+    # then
+    assert first_lookup.source == CACHE_SOURCE_MISS
+    assert second_lookup.source == CACHE_SOURCE_LOCAL
+    assert cached_document is document
+    stats = document_cache_backend.stats
+    assert stats.misses == 1
+    assert stats.local_hits == 1
+    assert stats.hit_ratio == 0.5
+
+
+def test_document_cache_shared_hit(document_cache_backend):
+    # given
+    document, _ = document_cache_backend.get_document(schema, QUERY)
+    other_process_backend = DocumentCacheBackend(
+        SaleorGraphQLBackend(), capacity_bytes=1024 * 1024
+    )
+
+    # when
+    shared_document, lookup = other_process_backend.get_document(schema, QUERY)
+
+    # then
+    assert lookup.source == CACHE_SOURCE_SHARED
+    assert shared_document.document_ast == document.document_ast
+    assert shared_document.document_string == QUERY
+
+
+def test_document_cache_invalid_document_not_shared(document_cache_backend):
+    # given
+    document, _ = document_cache_backend.get_document(schema, INVALID_QUERY)
+    key = document_cache_backend.get_cache_key(schema, get_document_id(INVALID_QUERY))
+
+    # when
+    result = document.execute()
+
+    # then
+    assert result.invalid
+    assert cache.get(key) is None
+
+
+def test_document_cache_get_document_by_id_unknown(document_cache_backend):
+    # when
+    document, lookup = document_cache_backend.get_document_by_id(
+        schema, get_document_id(QUERY)
+    )
+
+    # then
+    assert document is None
+    assert lookup.source == CACHE_SOURCE_MISS
+
+
+def test_document_cache_warm_up(document_cache_backend):
+    # when
+    added = document_cache_backend.warm_up(schema, [QUERY, QUERY])
+
+    # then
+    assert added == 1
+    _, lookup = document_cache_backend.get_document(schema, QUERY)
+    assert lookup.source == CACHE_SOURCE_LOCAL
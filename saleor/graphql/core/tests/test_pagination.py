@@ -6,6 +6,7 @@ import pytest
 
 from ....tests.models import Book
 from ..connection import CountableConnection, create_connection_slice
+from ..dataloaders import DataLoader
 from ..fields import ConnectionField
 
 
@@ -18,14 +19,30 @@ class BookTypeCountableConnection(CountableConnection):
         node = BookType
 
 
+class BookByIdLoader(DataLoader):
+    context_key = "book_by_id"
+
+    def batch_load(self, keys):
+        books = Book.objects.using(self.database_connection_name).in_bulk(keys)
+        return [books.get(book_id) for book_id in keys]
+
+
 class Query(graphene.ObjectType):
     books = ConnectionField(BookTypeCountableConnection)
+    books_by_keyset = ConnectionField(BookTypeCountableConnection)
 
     @staticmethod
     def resolve_books(_root, info, **kwargs):
         qs = Book.objects.all()
         return create_connection_slice(qs, info, kwargs, BookTypeCountableConnection)
 
+    @staticmethod
+    def resolve_books_by_keyset(_root, info, **kwargs):
+        qs = Book.objects.all()
+        return create_connection_slice(
+            qs, info, kwargs, BookTypeCountableConnection, node_loader=BookByIdLoader
+        )
+
 
 schema = graphene.Schema(query=Query)
 
@@ -310,3 +327,53 @@ def test_query_with_pagination_and_fragments_no_first_or_last_raises_an_error(bo
         "the `books` connection."
     )
     assert str(result.errors[0]) == expected_err_msg
+
+
+QUERY_KEYSET_PAGINATION_TEST = QUERY_PAGINATION_TEST.replace("books(", "booksByKeyset(")
+
+
+@pytest.mark.parametrize(
+    ("page_size", "direction"),
+    [(1, "first"), (5, "first"), (25, "first"), (1, "last"), (5, "last"), (25, "last")],
+)
+def test_keyset_pagination_matches_default_pagination(
+    page_size, direction, books, schema_context
+):
+    cursor_arg = "after" if direction == "first" else "before"
+    cursor_field = "endCursor" if direction == "first" else "startCursor"
+    has_more_field = "hasNextPage" if direction == "first" else "hasPreviousPage"
+    cursor = None
+    has_more = True
+    while has_more:
+        variables = {direction: page_size, cursor_arg: cursor}
+        result = schema.execute(QUERY_PAGINATION_TEST, variables=variables)
+        keyset_result = schema.execute(
+            QUERY_KEYSET_PAGINATION_TEST,
+            variables=variables,
+            context_value=schema_context,
+        )
+        assert not result.errors
+        assert not keyset_result.errors
+        assert keyset_result.data["booksByKeyset"] == result.data["books"]
+        page_info = result.data["books"]["pageInfo"]
+        has_more = page_info[has_more_field]
+        cursor = page_info[cursor_field]
+
+
+def test_keyset_pagination_reuses_loaded_nodes(
+    books, schema_context, django_assert_num_queries
+):
+    # given
+    BookByIdLoader(schema_context).load_many([book.pk for book in books]).get()
+
+    # when
+    with django_assert_num_queries(1):
+        result = schema.execute(
+            QUERY_KEYSET_PAGINATION_TEST,
+            variables={"first": 5},
+            context_value=schema_context,
+        )
+
+    # then
+    assert not result.errors
+    assert len(result.data["booksByKeyset"]["edges"]) == 5
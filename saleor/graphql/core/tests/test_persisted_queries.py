@@ -0,0 +1,161 @@
+import hashlib
+import json
+
+import pytest
+
+from ...tests.fixtures import API_PATH
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+from ..persisted_queries import _load_allow_list, get_persisted_query_hash
+
+QUERY = """
+query {
+    shop {
+        name
+    }
+}
+"""
+QUERY_HASH = hashlib.sha256(QUERY.encode("utf-8")).hexdigest()
+
+
+def _extensions(query_hash=QUERY_HASH):
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+@pytest.fixture(autouse=True)
+def _enable_persisted_queries(settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+
+
+@pytest.fixture
+def allow_list_path(tmp_path, settings):
+    path = tmp_path / "allow_list.json"
+    path.write_text(json.dumps({QUERY_HASH: QUERY}))
+    settings.GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST = str(path)
+    _load_allow_list.cache_clear()
+    yield path
+    _load_allow_list.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("extensions", "expected"),
+    [
+        (None, None),
+        ({}, None),
+        ({"persistedQuery": {"version": 1, "sha256Hash": "ABC"}}, "abc"),
+        ('{"persistedQuery": {"version": 1, "sha256Hash": "abc"}}', "abc"),
+        ({"persistedQuery": {"version": 2, "sha256Hash": "abc"}}, None),
+        ("not-json", None),
+    ],
+)
+def test_get_persisted_query_hash(extensions, expected):
+    assert get_persisted_query_hash(extensions) == expected
+
+
+def test_persisted_query_not_found(api_client):
+    # given
+    data = {"extensions": _extensions(hashlib.sha256(b"unknown").hexdigest())}
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_register_and_use(api_client, site_settings):
+    # given
+    api_client.post({"query": QUERY, "extensions": _extensions()})
+
+    # when
+    response = api_client.post({"extensions": _extensions()})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_ignored_when_disabled(api_client, site_settings, settings):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+    data = {"query": QUERY, "extensions": _extensions("a" * 64)}
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_hash_mismatch(api_client):
+    # given
+    data = {"query": QUERY, "extensions": _extensions("a" * 64)}
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_HASH_MISMATCH"
+
+
+def test_persisted_query_get_request(api_client, site_settings):
+    # given
+    api_client.post({"query": QUERY, "extensions": _extensions()})
+
+    # when
+    response = api_client.get(API_PATH, {"extensions": json.dumps(_extensions())})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_get_request_mutation_not_allowed(api_client):
+    # given
+    mutation = "mutation { tokenRefresh { token } }"
+
+    # when
+    response = api_client.get(API_PATH, {"query": mutation})
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Only queries can be sent with GET requests."
+    )
+
+
+def test_persisted_query_allow_list(api_client, site_settings, allow_list_path):
+    # when
+    response = api_client.post({"extensions": _extensions()})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_allow_list_rejects_unknown_hash(api_client, allow_list_path):
+    # given
+    other_query = "query { shop { description } }"
+    other_hash = hashlib.sha256(other_query.encode("utf-8")).hexdigest()
+
+    # when
+    response = api_client.post(
+        {"query": other_query, "extensions": _extensions(other_hash)}
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
+
+
+def test_persisted_query_allow_list_rejects_plain_query(api_client, allow_list_path):
+    # when
+    response = api_client.post({"query": QUERY})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
@@ -1,7 +1,17 @@
+from unittest.mock import patch
+
 import graphene
 import pytest
 from django.test import override_settings
 
+from ...api import SaleorGraphQLBackend, schema
+from ...query_cost_map import COST_MAP
+from ..validators.query_cost import (
+    _validate_query_cost,
+    analyze_document_cost,
+    validate_query_cost,
+)
+
 
 @override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=1)
 def test_query_exceeding_cost_limit_fails_validation(
@@ -235,3 +245,69 @@ def test_query_with_fragments_have_same_multiplied_complexity_cost(
     assert json_response["data"] == expected_data
     query_cost = json_response["extensions"]["cost"]["requestedQueryCost"]
     assert query_cost == 120
+
+
+MEMOIZED_COST_QUERY = """
+    query productsCost($first: Int, $channel: String) {
+        products(first: $first, channel: $channel) {
+            edges {
+                node {
+                    id
+                }
+            }
+        }
+    }
+"""
+
+
+@patch(
+    "saleor.graphql.core.validators.query_cost._validate_query_cost",
+    wraps=_validate_query_cost,
+)
+def test_query_cost_is_memoized_per_document(mocked_validate_query_cost):
+    # given
+    document = SaleorGraphQLBackend().document_from_string(schema, MEMOIZED_COST_QUERY)
+    variables = {"first": 10, "channel": "default-channel"}
+
+    # when
+    first_result = validate_query_cost(schema, document, variables, COST_MAP, 1000)
+    second_result = validate_query_cost(
+        schema, document, {**variables, "channel": "other-channel"}, COST_MAP, 1000
+    )
+
+    # then
+    assert first_result == second_result
+    mocked_validate_query_cost.assert_called_once()
+
+
+@patch(
+    "saleor.graphql.core.validators.query_cost._validate_query_cost",
+    wraps=_validate_query_cost,
+)
+def test_query_cost_is_recomputed_for_different_pagination(
+    mocked_validate_query_cost,
+):
+    # given
+    document = SaleorGraphQLBackend().document_from_string(schema, MEMOIZED_COST_QUERY)
+
+    # when
+    first_cost, _ = validate_query_cost(schema, document, {"first": 10}, COST_MAP, 1000)
+    second_cost, _ = validate_query_cost(
+        schema, document, {"first": 20}, COST_MAP, 1000
+    )
+
+    # then
+    assert second_cost == 2 * first_cost
+    assert mocked_validate_query_cost.call_count == 2
+
+
+def test_analyze_document_cost_collects_multiplier_variables():
+    # given
+    document = SaleorGraphQLBackend().document_from_string(schema, MEMOIZED_COST_QUERY)
+
+    # when
+    analysis = analyze_document_cost(document.document_ast, COST_MAP)
+
+    # then
+    assert analysis.multiplier_variables == ("first",)
+    assert analysis.argument_variables == ("channel", "first")
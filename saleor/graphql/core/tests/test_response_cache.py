@@ -0,0 +1,221 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from ....product.models import Product
+from ...tests.utils import get_graphql_content
+from ..response_cache import (
+    RESPONSE_CACHE_HEADER,
+    ResponseCacheStatus,
+    ResponseCacheTag,
+    invalidate_response_cache,
+    invalidate_response_cache_for_event,
+)
+
+QUERY_PRODUCTS = """
+    query ($channel: String){
+        products (first: 10, channel: $channel){
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+QUERY_PRODUCTS_AND_SHOP = """
+    query ($channel: String){
+        shop {
+            name
+        }
+        products (first: 10, channel: $channel){
+            totalCount
+        }
+    }
+"""
+
+
+@pytest.fixture
+def response_cache_enabled(settings):
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    settings.GRAPHQL_RESPONSE_CACHE_STALE_TIMEOUT = 300
+    cache.clear()
+    yield settings
+    cache.clear()
+
+
+def test_response_cache_hit(
+    response_cache_enabled, api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    first_response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+    Product.objects.update(name="Changed without an event")
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert first_response[RESPONSE_CACHE_HEADER] == ResponseCacheStatus.MISS
+    assert response[RESPONSE_CACHE_HEADER] == ResponseCacheStatus.HIT
+    assert get_graphql_content(response) == get_graphql_content(first_response)
+
+
+def test_response_cache_disabled(api_client, product_list, channel_USD, settings):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = False
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+
+    # then
+    get_graphql_content(response)
+    assert RESPONSE_CACHE_HEADER not in response
+
+
+def test_response_cache_skips_authenticated_requests(
+    response_cache_enabled, user_api_client, product_list, channel_USD
+):
+    # when
+    response = user_api_client.post_graphql(
+        QUERY_PRODUCTS, {"channel": channel_USD.slug}
+    )
+
+    # then
+    get_graphql_content(response)
+    assert RESPONSE_CACHE_HEADER not in response
+
+
+def test_response_cache_skips_not_cacheable_root_fields(
+    response_cache_enabled, api_client, product_list, channel_USD
+):
+    # when
+    response = api_client.post_graphql(
+        QUERY_PRODUCTS_AND_SHOP, {"channel": channel_USD.slug}
+    )
+
+    # then
+    get_graphql_content(response)
+    assert RESPONSE_CACHE_HEADER not in response
+
+
+def test_response_cache_key_includes_variables(
+    response_cache_enabled, api_client, product_list, channel_USD, channel_PLN
+):
+    # given
+    api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_PLN.slug})
+
+    # then
+    assert response[RESPONSE_CACHE_HEADER] == ResponseCacheStatus.MISS
+
+
+def test_response_cache_invalidated_by_event(
+    response_cache_enabled, api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+    Product.objects.filter(pk=product_list[0].pk).update(name="Changed")
+
+    # when
+    invalidate_response_cache_for_event("product_updated")
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert response[RESPONSE_CACHE_HEADER] == ResponseCacheStatus.MISS
+    content = get_graphql_content(response)
+    names = [edge["node"]["name"] for edge in content["data"]["products"]["edges"]]
+    assert "Changed" in names
+
+
+def test_response_cache_key_includes_scheme(
+    response_cache_enabled, api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables, secure=True)
+
+    # then
+    assert response[RESPONSE_CACHE_HEADER] == ResponseCacheStatus.MISS
+
+
+@pytest.mark.parametrize("event", ["channel_updated", "channel_status_changed"])
+def test_response_cache_invalidated_by_channel_event(
+    event, response_cache_enabled, api_client, category, channel_USD
+):
+    # given
+    query = "query ($slug: String) { category(slug: $slug) { name } }"
+    variables = {"slug": category.slug}
+    api_client.post_graphql(query, variables)
+
+    # when
+    invalidate_response_cache_for_event(event)
+    response = api_client.post_graphql(query, variables)
+
+    # then
+    assert response[RESPONSE_CACHE_HEADER] == ResponseCacheStatus.MISS
+
+
+def test_response_cache_not_invalidated_by_other_tags(
+    response_cache_enabled, api_client, category, channel_USD
+):
+    # given
+    query = "query ($slug: String) { category(slug: $slug) { name } }"
+    variables = {"slug": category.slug}
+    api_client.post_graphql(query, variables)
+
+    # when
+    invalidate_response_cache([ResponseCacheTag.COLLECTION])
+    response = api_client.post_graphql(query, variables)
+
+    # then
+    assert response[RESPONSE_CACHE_HEADER] == ResponseCacheStatus.HIT
+
+
+@patch("saleor.graphql.core.response_cache.time.time")
+def test_response_cache_stale_while_revalidate(
+    time_mock, response_cache_enabled, api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    time_mock.return_value = 1000
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+    time_mock.return_value = 1100
+
+    # when
+    revalidating_response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+    stale_response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert revalidating_response[RESPONSE_CACHE_HEADER] == ResponseCacheStatus.MISS
+    assert stale_response[RESPONSE_CACHE_HEADER] == ResponseCacheStatus.HIT
+
+
+@patch("saleor.graphql.core.response_cache.time.time")
+def test_response_cache_serves_stale_response_during_revalidation(
+    time_mock, response_cache_enabled, api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    time_mock.return_value = 1000
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+    time_mock.return_value = 1100
+
+    # when
+    # the revalidating request doesn't finish before the next request arrives
+    with patch("saleor.graphql.views.cache_response"):
+        revalidating_response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+        stale_response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert revalidating_response[RESPONSE_CACHE_HEADER] == ResponseCacheStatus.MISS
+    assert stale_response[RESPONSE_CACHE_HEADER] == ResponseCacheStatus.STALE
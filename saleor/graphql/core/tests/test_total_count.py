@@ -0,0 +1,141 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from ....product.models import Product
+from ...tests.utils import get_graphql_content
+from ..total_count import (
+    TotalCount,
+    TotalCountStrategy,
+    estimate_count,
+    get_total_count_cache_key,
+    get_total_count_strategy,
+)
+
+QUERY_PRODUCTS_TOTAL_COUNT = """
+    query ($channel: String){
+        products (first: 1, channel: $channel){
+            totalCount
+            totalCountIsExact
+        }
+    }
+"""
+
+
+def test_total_count_exact(product_list):
+    # when
+    total_count = TotalCount(Product.objects.all())
+
+    # then
+    assert total_count.get_count() == len(product_list)
+    assert total_count.is_exact() is True
+
+
+def test_total_count_cached(product_list, django_assert_num_queries):
+    # given
+    cache.clear()
+    qs = Product.objects.all()
+    TotalCount(qs, TotalCountStrategy.CACHED).get_count()
+
+    # when
+    with django_assert_num_queries(0):
+        total_count = TotalCount(qs.order_by("-pk"), TotalCountStrategy.CACHED)
+        count = total_count.get_count()
+
+    # then
+    assert count == len(product_list)
+    assert total_count.is_exact() is True
+    cache.delete(get_total_count_cache_key(qs))
+
+
+@patch("saleor.graphql.core.total_count.estimate_count")
+def test_total_count_estimated(estimate_count_mock, product_list, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 1000
+    estimate_count_mock.return_value = 2000
+
+    # when
+    total_count = TotalCount(Product.objects.all(), TotalCountStrategy.ESTIMATED)
+
+    # then
+    assert total_count.get_count() == 2000
+    assert total_count.is_exact() is False
+
+
+@patch("saleor.graphql.core.total_count.estimate_count")
+def test_total_count_estimated_below_threshold(
+    estimate_count_mock, product_list, settings
+):
+    # given
+    cache.clear()
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 1000
+    estimate_count_mock.return_value = 10
+
+    # when
+    total_count = TotalCount(Product.objects.all(), TotalCountStrategy.ESTIMATED)
+
+    # then
+    assert total_count.get_count() == len(product_list)
+    assert total_count.is_exact() is True
+
+
+def test_estimate_count(product_list):
+    # when
+    estimate = estimate_count(Product.objects.all())
+
+    # then
+    assert isinstance(estimate, int)
+
+
+def test_get_total_count_strategy(settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGIES = {
+        "ProductCountableConnection": TotalCountStrategy.CACHED,
+        "OrderCountableConnection": "unknown",
+    }
+
+    # when & then
+    assert (
+        get_total_count_strategy("ProductCountableConnection")
+        == TotalCountStrategy.CACHED
+    )
+    assert (
+        get_total_count_strategy("OrderCountableConnection") == TotalCountStrategy.EXACT
+    )
+    assert get_total_count_strategy("UserCountableConnection") == (
+        TotalCountStrategy.EXACT
+    )
+
+
+def test_total_count_query_exact(api_client, product_list, channel_USD):
+    # when
+    response = api_client.post_graphql(
+        QUERY_PRODUCTS_TOTAL_COUNT, {"channel": channel_USD.slug}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["totalCount"] == len(product_list)
+    assert content["data"]["products"]["totalCountIsExact"] is True
+
+
+@patch("saleor.graphql.core.total_count.estimate_count")
+def test_total_count_query_estimated(
+    estimate_count_mock, api_client, product_list, channel_USD, settings
+):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGIES = {
+        "ProductCountableConnection": TotalCountStrategy.ESTIMATED
+    }
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 1000
+    estimate_count_mock.return_value = 5000
+
+    # when
+    response = api_client.post_graphql(
+        QUERY_PRODUCTS_TOTAL_COUNT, {"channel": channel_USD.slug}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["totalCount"] == 5000
+    assert content["data"]["products"]["totalCountIsExact"] is False
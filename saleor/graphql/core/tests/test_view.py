@@ -281,6 +281,7 @@ query IntrospectionQuery {
 INTROSPECTION_RESULT = {"__schema": {"queryType": {"name": "Query"}}}
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.graphql.views.cache.set")
 @mock.patch("saleor.graphql.views.cache.get")
 @override_settings(DEBUG=False, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
@@ -296,6 +297,7 @@ def test_introspection_query_is_cached(cache_get_mock, cache_set_mock, api_clien
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.graphql.views.cache.set")
 @mock.patch("saleor.graphql.views.cache.get")
 @override_settings(DEBUG=False, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
@@ -311,6 +313,7 @@ def test_introspection_query_is_cached_only_once(
     cache_set_mock.assert_not_called()
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.graphql.views.cache.set")
 @mock.patch("saleor.graphql.views.cache.get")
 @override_settings(DEBUG=True, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
@@ -0,0 +1,99 @@
+import hashlib
+import json
+import logging
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from django.db.models import QuerySet
+
+logger = logging.getLogger(__name__)
+
+TOTAL_COUNT_CACHE_KEY = "graphql_total_count:{model}:{query_id}"
+
+
+class TotalCountStrategy:
+    # Count all matching rows.
+    EXACT = "exact"
+    # Count all matching rows and cache the result for a short time.
+    CACHED = "cached"
+    # Use the query planner's estimate when it's above the threshold; smaller
+    # counts are cached exact counts.
+    ESTIMATED = "estimated"
+
+    CHOICES = [EXACT, CACHED, ESTIMATED]
+
+
+def get_total_count_strategy(connection_name: str) -> str:
+    strategy = settings.GRAPHQL_TOTAL_COUNT_STRATEGIES.get(
+        connection_name, TotalCountStrategy.EXACT
+    )
+    if strategy not in TotalCountStrategy.CHOICES:
+        logger.warning(
+            "Unknown total count strategy %r for %s.", strategy, connection_name
+        )
+        return TotalCountStrategy.EXACT
+    return strategy
+
+
+def get_total_count_cache_key(qs: QuerySet) -> str:
+    # The filters and the channel end up in the SQL query, so queries that differ
+    # only in the order of the filters or the ordering share the key.
+    sql, params = qs.order_by().query.sql_with_params()
+    query_id = hashlib.sha256(f"{sql}{params!r}".encode()).hexdigest()
+    return TOTAL_COUNT_CACHE_KEY.format(model=qs.model._meta.label, query_id=query_id)
+
+
+def estimate_count(qs: QuerySet) -> Optional[int]:
+    """Return the number of rows estimated by the query planner."""
+    sql, params = qs.order_by().query.sql_with_params()
+    try:
+        with connections[qs.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+    except DatabaseError:
+        logger.warning("Unable to estimate the number of rows.", exc_info=True)
+        return None
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class TotalCount:
+    """Lazily computed total count of a connection's queryset."""
+
+    def __init__(self, qs: QuerySet, strategy: str = TotalCountStrategy.EXACT):
+        self.qs = qs
+        self.strategy = strategy
+        self._result: Optional[tuple[int, bool]] = None
+
+    def get_count(self) -> int:
+        return self._get_result()[0]
+
+    def is_exact(self) -> bool:
+        return self._get_result()[1]
+
+    def _get_result(self) -> tuple[int, bool]:
+        if self._result is None:
+            self._result = self._count()
+        return self._result
+
+    def _count(self) -> tuple[int, bool]:
+        if self.strategy == TotalCountStrategy.EXACT:
+            return self.qs.count(), True
+
+        if self.strategy == TotalCountStrategy.ESTIMATED:
+            estimate = estimate_count(self.qs)
+            if (
+                estimate is not None
+                and estimate >= settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD
+            ):
+                return estimate, False
+
+        key = get_total_count_cache_key(self.qs)
+        count = cache.get(key)
+        if count is None:
+            count = self.qs.count()
+            cache.set(key, count, timeout=settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT)
+        return count, True
@@ -1,8 +1,12 @@
+import json
+import weakref
+from dataclasses import dataclass, field
 from functools import reduce
 from operator import add, mul
 from typing import Any, Optional, Union, cast
 
 from graphql import (
+    GraphQLDocument,
     GraphQLError,
     GraphQLInterfaceType,
     GraphQLObjectType,
@@ -15,13 +19,18 @@ from graphql.language.ast import (
     FragmentDefinition,
     FragmentSpread,
     InlineFragment,
+    ListValue,
+    ObjectValue,
     OperationDefinition,
+    Variable,
 )
 from graphql.type import GraphQLField
 from graphql.validation import validate
 from graphql.validation.rules.base import ValidationRule
 from graphql.validation.validation import ValidationContext
 
+from ....core.utils.cache import CacheDict
+
 CostAwareNode = Union[
     Field,
     FragmentDefinition,
@@ -283,12 +292,127 @@ def cost_validator(
     )
 
 
+QUERY_COST_RESULTS_PER_DOCUMENT = 100
+
+
+@dataclass
+class DocumentCostAnalysis:
+    """Variables that can affect the cost computed for a document.
+
+    The cost of a document depends on the request only through the variables
+    passed to the arguments used as multipliers in the cost map, and through the
+    presence of the variables passed to any field argument, as missing required
+    arguments are reported as errors.
+    """
+
+    multiplier_variables: tuple[str, ...]
+    argument_variables: tuple[str, ...]
+    results: CacheDict = field(
+        default_factory=lambda: CacheDict(QUERY_COST_RESULTS_PER_DOCUMENT)
+    )
+
+    def get_cache_key(self, schema, variables, cost_map, maximum_cost):
+        variables = variables or {}
+        multiplier_values = json.dumps(
+            [variables.get(name) for name in self.multiplier_variables],
+            sort_keys=True,
+            default=str,
+        )
+        present_variables = tuple(name in variables for name in self.argument_variables)
+        return (
+            id(schema),
+            id(cost_map),
+            maximum_cost,
+            multiplier_values,
+            present_variables,
+        )
+
+
+def _collect_variable_names(value_node, names: set[str]):
+    if isinstance(value_node, Variable):
+        names.add(value_node.name.value)
+    elif isinstance(value_node, ListValue):
+        for item in value_node.values:
+            _collect_variable_names(item, names)
+    elif isinstance(value_node, ObjectValue):
+        for object_field in value_node.fields:
+            _collect_variable_names(object_field.value, names)
+
+
+_document_cost_analyses: weakref.WeakKeyDictionary[
+    GraphQLDocument, DocumentCostAnalysis
+] = weakref.WeakKeyDictionary()
+
+
+def analyze_document_cost(document_ast, cost_map) -> DocumentCostAnalysis:
+    multiplier_arguments = {
+        multiplier.split(".")[0]
+        for type_fields in (cost_map or {}).values()
+        for field_cost in type_fields.values()
+        for multiplier in field_cost.get("multipliers", [])
+    }
+    multiplier_variables: set[str] = set()
+    argument_variables: set[str] = set()
+
+    nodes = [
+        definition
+        for definition in document_ast.definitions
+        if isinstance(definition, (OperationDefinition, FragmentDefinition))
+    ]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, Field):
+            for argument in node.arguments or []:
+                _collect_variable_names(argument.value, argument_variables)
+                if argument.name.value in multiplier_arguments:
+                    _collect_variable_names(argument.value, multiplier_variables)
+        if selection_set := getattr(node, "selection_set", None):
+            nodes.extend(selection_set.selections)
+
+    return DocumentCostAnalysis(
+        multiplier_variables=tuple(sorted(multiplier_variables)),
+        argument_variables=tuple(sorted(argument_variables)),
+    )
+
+
 def validate_query_cost(
     schema,
     query,
     variables,
     cost_map,
     maximum_cost,
+):
+    """Return the cost of the query and the cost validation errors.
+
+    Results are memoized per document, keyed by the values of the variables the
+    cost depends on, so identical documents are not traversed on every request.
+    """
+    if variables is not None and not isinstance(variables, dict):
+        return _validate_query_cost(schema, query, variables, cost_map, maximum_cost)
+
+    analysis = _document_cost_analyses.get(query)
+    if analysis is None:
+        analysis = analyze_document_cost(query.document_ast, cost_map)
+        _document_cost_analyses[query] = analysis
+
+    try:
+        key = analysis.get_cache_key(schema, variables, cost_map, maximum_cost)
+    except (TypeError, ValueError):
+        return _validate_query_cost(schema, query, variables, cost_map, maximum_cost)
+
+    if key not in analysis.results:
+        analysis.results[key] = _validate_query_cost(
+            schema, query, variables, cost_map, maximum_cost
+        )
+    return analysis.results[key]
+
+
+def _validate_query_cost(
+    schema,
+    query,
+    variables,
+    cost_map,
+    maximum_cost,
 ):
     validator = cost_validator(
         maximum_cost,
@@ -0,0 +1,44 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...api import backend, schema
+
+
+class Command(BaseCommand):
+    help = (
+        "Parses and validates known GraphQL operations and stores them in the "
+        "document cache. Accepts `.graphql` files containing a single document or "
+        "`.json` files with a list of documents or a mapping of hashes to documents."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", type=str)
+
+    def handle(self, *args, **options):
+        documents = []
+        for path in options["paths"]:
+            documents.extend(self.read_documents(path))
+
+        added = backend.warm_up(schema, documents)
+        self.stdout.write(
+            f"Cached {added} new documents out of {len(documents)} provided."
+        )
+
+    @staticmethod
+    def read_documents(path: str) -> list[str]:
+        try:
+            with open(path) as f:
+                content = f.read()
+        except OSError as e:
+            raise CommandError(f"Cannot read {path}: {e}")
+
+        if not path.endswith(".json"):
+            return [content]
+
+        data = json.loads(content)
+        if isinstance(data, dict):
+            return list(data.values())
+        if isinstance(data, list):
+            return data
+        raise CommandError(f"Unsupported format of {path}.")
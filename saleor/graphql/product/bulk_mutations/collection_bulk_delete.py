@@ -45,8 +45,7 @@ class CollectionBulkDelete(ModelBulkDeleteMutation):
         queryset.delete()
 
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_UPDATED)
-        for product in products:
-            cls.call_event(manager.product_updated, product, webhooks=webhooks)
+        cls.call_event(manager.product_bulk_updated, products, webhooks=webhooks)
 
         channel_ids = set(
             ProductChannelListing.objects.filter(
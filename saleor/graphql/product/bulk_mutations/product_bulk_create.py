@@ -20,6 +20,7 @@ from ....permission.enums import ProductPermissions
 from ....product import ProductMediaTypes, models
 from ....product.error_codes import ProductBulkCreateErrorCode
 from ....product.models import CollectionProduct
+from ....product.search import mark_product_search_index_dirty
 from ....thumbnail.utils import get_filename_from_url
 from ....warehouse.models import Warehouse
 from ....webhook.event_types import WebhookEventAsyncType
@@ -653,7 +654,7 @@ class ProductBulkCreate(BaseMutation):
                     instance, metadata_list, private_metadata_list
                 )
                 cls.clean_instance(info, instance)
-                instance.search_index_dirty = True
+                mark_product_search_index_dirty(instance)
 
                 instances_data_and_errors_list.append(
                     {
@@ -869,15 +870,17 @@ class ProductBulkCreate(BaseMutation):
     @classmethod
     def post_save_actions(cls, info, products, variants, channels):
         manager = get_plugin_manager_promise(info.context).get()
-        product_ids = []
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_CREATED)
-        for product in products:
-            cls.call_event(manager.product_created, product.node, webhooks=webhooks)
-            product_ids.append(product.node.id)
+        cls.call_event(
+            manager.product_bulk_created,
+            [product.node for product in products],
+            webhooks=webhooks,
+        )
 
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_VARIANT_CREATED)
-        for variant in variants:
-            cls.call_event(manager.product_variant_created, variant, webhooks=webhooks)
+        cls.call_event(
+            manager.product_variant_bulk_created, variants, webhooks=webhooks
+        )
 
         if products:
             channel_ids = set([channel.id for channel in channels])
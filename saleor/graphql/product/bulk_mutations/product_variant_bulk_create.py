@@ -13,6 +13,10 @@ from ....discount.utils import mark_active_catalogue_promotion_rules_as_dirty
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.error_codes import ProductVariantBulkErrorCode
+from ....product.search import (
+    SEARCH_INDEX_DIRTY_FIELDS,
+    mark_product_search_index_dirty,
+)
 from ....warehouse import models as warehouse_models
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
@@ -926,15 +930,16 @@ class ProductVariantBulkCreate(BaseMutation):
         # This will finally recalculate discounted prices for products.
         cls.call_event(mark_active_catalogue_promotion_rules_as_dirty, channel_ids)
 
-        product.search_index_dirty = True
-        product.save(update_fields=["search_index_dirty"])
+        mark_product_search_index_dirty(product)
+        product.save(update_fields=SEARCH_INDEX_DIRTY_FIELDS)
 
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_VARIANT_CREATED)
         manager = get_plugin_manager_promise(info.context).get()
-        for instance in instances:
-            cls.call_event(
-                manager.product_variant_created, instance.node, webhooks=webhooks
-            )
+        cls.call_event(
+            manager.product_variant_bulk_created,
+            [instance.node for instance in instances],
+            webhooks=webhooks,
+        )
 
     @classmethod
     @traced_atomic_transaction()
@@ -17,6 +17,7 @@ from ....order.tasks import recalculate_orders_task
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.search import prepare_product_search_vector_value
+from ....product.utils.variant_prices import invalidate_price_ranges
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...app.dataloaders import get_app_promise
@@ -66,8 +67,9 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
 
         manager = get_plugin_manager_promise(info.context).get()
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_VARIANT_DELETED)
-        for variant in variants:
-            cls.call_event(manager.product_variant_deleted, variant, webhooks=webhooks)
+        cls.call_event(
+            manager.product_variant_bulk_deleted, list(variants), webhooks=webhooks
+        )
 
     @classmethod
     @traced_atomic_transaction()
@@ -104,6 +106,9 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
 
         cls.delete_assigned_attribute_values(pks)
         cls.delete_product_channel_listings_without_available_variants(product_pks, pks)
+        invalidate_price_ranges(
+            models.ProductVariantChannelListing.objects.filter(variant_id__in=pks)
+        )
         response = super().perform_mutation(_root, info, ids=ids, **data)
 
         # delete order lines for deleted variants
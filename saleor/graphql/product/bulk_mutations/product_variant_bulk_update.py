@@ -12,6 +12,10 @@ from ....discount.utils import mark_active_catalogue_promotion_rules_as_dirty
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.error_codes import ProductErrorCode, ProductVariantBulkErrorCode
+from ....product.search import (
+    SEARCH_INDEX_DIRTY_FIELDS,
+    mark_product_search_index_dirty,
+)
 from ....warehouse import models as warehouse_models
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
@@ -719,17 +723,16 @@ class ProductVariantBulkUpdate(BaseMutation):
                 mark_active_catalogue_promotion_rules_as_dirty, impacted_channel_ids
             )
         manager = get_plugin_manager_promise(info.context).get()
-        product.search_index_dirty = True
-        product.save(update_fields=["search_index_dirty"])
+        mark_product_search_index_dirty(product)
+        product.save(update_fields=SEARCH_INDEX_DIRTY_FIELDS)
 
-        for instance in instances:
-            cls.call_event(
-                manager.product_variant_updated,
-                instance.node,
-                webhooks=webhooks,
-                pre_save_payloads=pre_save_payloads,
-                request_time=request_time,
-            )
+        cls.call_event(
+            manager.product_variant_bulk_updated,
+            [instance.node for instance in instances],
+            webhooks=webhooks,
+            pre_save_payloads=pre_save_payloads,
+            request_time=request_time,
+        )
 
     @classmethod
     def _get_impacted_channels(cls, cleaned_inputs_map):
@@ -356,7 +356,7 @@ class ProductAttributeUnassign(BaseMutation):
         cls.save_field_values(product_type, "product_attributes", attribute_pks)
         cls.save_field_values(product_type, "variant_attributes", attribute_pks)
 
-        product_type.products.all().update(search_index_dirty=True)
+        product_type.products.all().mark_search_index_dirty()
 
         return cls(product_type=product_type)
 
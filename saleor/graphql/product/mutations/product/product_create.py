@@ -7,6 +7,7 @@ from .....core.utils.editorjs import clean_editor_js
 from .....permission.enums import ProductPermissions
 from .....product import models
 from .....product.error_codes import ProductErrorCode
+from .....product.search import mark_product_search_index_dirty
 from ....attribute.types import AttributeValueInput
 from ....attribute.utils import AttrValuesInput, ProductAttributeAssignmentMixin
 from ....channel import ChannelContext
@@ -204,7 +205,7 @@ class ProductCreate(ModelMutation):
     @classmethod
     def save(cls, info: ResolveInfo, instance, cleaned_input):
         with traced_atomic_transaction():
-            instance.search_index_dirty = True
+            mark_product_search_index_dirty(instance)
             instance.save()
             attributes = cleaned_input.get("attributes")
             if attributes:
@@ -43,6 +43,6 @@ class ProductTypeUpdate(ProductTypeCreate):
             "product_attributes" in cleaned_input
             or "variant_attributes" in cleaned_input
         ):
-            models.Product.objects.filter(product_type=instance).update(
-                search_index_dirty=True
-            )
+            models.Product.objects.filter(
+                product_type=instance
+            ).mark_search_index_dirty()
@@ -13,6 +13,11 @@ from .....order import models as order_models
 from .....order.tasks import recalculate_orders_task
 from .....permission.enums import ProductPermissions
 from .....product import models
+from .....product.search import (
+    SEARCH_INDEX_DIRTY_FIELDS,
+    mark_product_search_index_dirty,
+)
+from .....product.utils.variant_prices import invalidate_price_ranges
 from ....app.dataloaders import get_app_promise
 from ....channel import ChannelContext
 from ....core import ResolveInfo
@@ -51,8 +56,8 @@ class ProductVariantDelete(ModelDeleteMutation, ModelWithExtRefMutation):
     @classmethod
     def success_response(cls, instance):
         product = models.Product.objects.get(id=instance.product_id)
-        product.search_index_dirty = True
-        product.save(update_fields=["search_index_dirty"])
+        mark_product_search_index_dirty(product)
+        product.save(update_fields=SEARCH_INDEX_DIRTY_FIELDS)
         # if the product default variant has been removed set the new one
         if not product.default_variant:
             product.default_variant = product.variants.first()
@@ -115,6 +120,7 @@ class ProductVariantDelete(ModelDeleteMutation, ModelWithExtRefMutation):
         with traced_atomic_transaction():
             cls.delete_assigned_attribute_values(variant)
             cls.delete_product_channel_listings_without_available_variants(variant)
+            invalidate_price_ranges(variant.channel_listings.all())
             response = super().perform_mutation(_root, info, id=node_id)
 
             # delete order lines for deleted variant
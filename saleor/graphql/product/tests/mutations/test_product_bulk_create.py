@@ -270,7 +270,7 @@ def test_product_bulk_create_with_no_slug_and_name_with_unslugify_characters(
     assert len(products) == 2
 
 
-@patch("saleor.plugins.manager.PluginsManager.product_created")
+@patch("saleor.plugins.manager.PluginsManager.product_bulk_created")
 def test_product_bulk_create_send_product_created_webhook(
     created_webhook_mock,
     staff_api_client,
@@ -325,9 +325,11 @@ def test_product_bulk_create_send_product_created_webhook(
     assert not data["results"][0]["errors"]
     assert not data["results"][1]["errors"]
     assert data["count"] == 2
-    assert created_webhook_mock.call_count == 2
-    for call in created_webhook_mock.call_args_list:
-        assert isinstance(call.args[0], Product)
+    created_webhook_mock.assert_called_once()
+    created_products = created_webhook_mock.call_args.args[0]
+    assert len(created_products) == 2
+    for product in created_products:
+        assert isinstance(product, Product)
 
 
 def test_product_bulk_create_with_same_name_and_no_slug(
@@ -1374,8 +1376,8 @@ def test_product_bulk_create_with_variants_with_duplicated_sku(
     "saleor.graphql.product.bulk_mutations."
     "product_bulk_create.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_variant_created")
-@patch("saleor.plugins.manager.PluginsManager.product_created")
+@patch("saleor.plugins.manager.PluginsManager.product_variant_bulk_created")
+@patch("saleor.plugins.manager.PluginsManager.product_bulk_created")
 def test_product_bulk_create_with_variants_send_product_variant_created_event(
     product_created_webhook_mock,
     variant_created_webhook_mock,
@@ -1480,8 +1482,10 @@ def test_product_bulk_create_with_variants_send_product_variant_created_event(
     assert not data["results"][0]["errors"]
     assert not data["results"][1]["errors"]
     assert data["count"] == 2
-    assert product_created_webhook_mock.call_count == 2
-    assert variant_created_webhook_mock.call_count == 3
+    product_created_webhook_mock.assert_called_once()
+    assert len(product_created_webhook_mock.call_args.args[0]) == 2
+    variant_created_webhook_mock.assert_called_once()
+    assert len(variant_created_webhook_mock.call_args.args[0]) == 3
 
 
 def test_product_bulk_create_with_variants_and_stocks(
@@ -1692,8 +1696,8 @@ def test_product_bulk_create_with_variants_and_invalid_stock(
     "saleor.graphql.product.bulk_mutations."
     "product_bulk_create.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_created")
-@patch("saleor.plugins.manager.PluginsManager.product_variant_created")
+@patch("saleor.plugins.manager.PluginsManager.product_bulk_created")
+@patch("saleor.plugins.manager.PluginsManager.product_variant_bulk_created")
 def test_product_bulk_create_with_variants_and_channel_listings(
     product_variant_created_mock,
     product_created_mock,
@@ -26,6 +26,7 @@ from ....product.models import (
     ProductVariantChannelListing,
     VariantMedia,
 )
+from ....product.utils.variant_prices import update_discounted_prices_for_promotion
 from ....tests.utils import flush_post_commit_hooks
 from ....thumbnail.models import Thumbnail
 from ...tests.utils import get_graphql_content
@@ -426,7 +427,7 @@ def test_delete_collections_trigger_collection_deleted_webhook(
     "saleor.graphql.product.bulk_mutations."
     "collection_bulk_delete.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_updated")
+@patch("saleor.plugins.manager.PluginsManager.product_bulk_updated")
 def test_delete_collections_trigger_product_updated_webhook(
     product_updated_mock,
     mocked_get_webhooks_for_event,
@@ -459,7 +460,8 @@ def test_delete_collections_trigger_product_updated_webhook(
     assert not Collection.objects.filter(
         id__in=[collection.id for collection in collection_list]
     ).exists()
-    assert len(product_list) == product_updated_mock.call_count
+    product_updated_mock.assert_called_once()
+    assert len(product_list) == len(product_updated_mock.call_args.args[0])
 
 
 DELETE_PRODUCTS_MUTATION = """
@@ -956,7 +958,7 @@ mutation productVariantBulkDelete($skus: [String!]!) {
 @patch(
     "saleor.graphql.product.bulk_mutations.product_variant_bulk_delete.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_variant_deleted")
+@patch("saleor.plugins.manager.PluginsManager.product_variant_bulk_deleted")
 @patch("saleor.order.tasks.recalculate_orders_task.delay")
 def test_delete_product_variants_by_sku(
     mocked_recalculate_orders_task,
@@ -997,8 +999,9 @@ def test_delete_product_variants_by_sku(
     assert not ProductVariant.objects.filter(
         id__in=[variant.id for variant in product_variant_list]
     ).exists()
+    product_variant_deleted_webhook_mock.assert_called_once()
     assert (
-        product_variant_deleted_webhook_mock.call_count
+        len(product_variant_deleted_webhook_mock.call_args.args[0])
         == content["data"]["productVariantBulkDelete"]["count"]
     )
     mocked_recalculate_orders_task.assert_not_called()
@@ -1008,7 +1011,7 @@ def test_delete_product_variants_by_sku(
     "saleor.graphql.product.bulk_mutations."
     "product_variant_bulk_delete.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_variant_deleted")
+@patch("saleor.plugins.manager.PluginsManager.product_variant_bulk_deleted")
 @patch("saleor.order.tasks.recalculate_orders_task.delay")
 def test_delete_product_variants_by_sku_task_for_recalculate_product_prices_called(
     mocked_recalculate_orders_task,
@@ -1044,8 +1047,9 @@ def test_delete_product_variants_by_sku_task_for_recalculate_product_prices_call
     assert not ProductVariant.objects.filter(
         id__in=[variant.id for variant in variants]
     ).exists()
+    product_variant_deleted_webhook_mock.assert_called_once()
     assert (
-        product_variant_deleted_webhook_mock.call_count
+        len(product_variant_deleted_webhook_mock.call_args.args[0])
         == content["data"]["productVariantBulkDelete"]["count"]
     )
     mocked_recalculate_orders_task.assert_not_called()
@@ -1070,7 +1074,7 @@ mutation productVariantBulkDelete($ids: [ID!]!) {
     "saleor.graphql.product.bulk_mutations."
     "product_variant_bulk_delete.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_variant_deleted")
+@patch("saleor.plugins.manager.PluginsManager.product_variant_bulk_deleted")
 @patch("saleor.order.tasks.recalculate_orders_task.delay")
 def test_delete_product_variants(
     mocked_recalculate_orders_task,
@@ -1113,8 +1117,9 @@ def test_delete_product_variants(
     assert not ProductVariant.objects.filter(
         id__in=[variant.id for variant in product_variant_list]
     ).exists()
+    product_variant_deleted_webhook_mock.assert_called_once()
     assert (
-        product_variant_deleted_webhook_mock.call_count
+        len(product_variant_deleted_webhook_mock.call_args.args[0])
         == content["data"]["productVariantBulkDelete"]["count"]
     )
     mocked_recalculate_orders_task.assert_not_called()
@@ -1124,7 +1129,7 @@ def test_delete_product_variants(
     "saleor.graphql.product.bulk_mutations."
     "product_variant_bulk_delete.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_variant_deleted")
+@patch("saleor.plugins.manager.PluginsManager.product_variant_bulk_deleted")
 @patch("saleor.order.tasks.recalculate_orders_task.delay")
 def test_delete_product_variants_task_for_recalculate_product_prices_called(
     mocked_recalculate_orders_task,
@@ -1162,8 +1167,9 @@ def test_delete_product_variants_task_for_recalculate_product_prices_called(
     assert not ProductVariant.objects.filter(
         id__in=[variant.id for variant in variants]
     ).exists()
+    product_variant_deleted_webhook_mock.assert_called_once()
     assert (
-        product_variant_deleted_webhook_mock.call_count
+        len(product_variant_deleted_webhook_mock.call_args.args[0])
         == content["data"]["productVariantBulkDelete"]["count"]
     )
     mocked_recalculate_orders_task.assert_not_called()
@@ -1171,6 +1177,37 @@ def test_delete_product_variants_task_for_recalculate_product_prices_called(
         assert rule.variants_dirty
 
 
+def test_delete_product_variants_clears_price_ranges(
+    staff_api_client,
+    product_with_two_variants,
+    channel_USD,
+    permission_manage_products,
+):
+    # given
+    product = product_with_two_variants
+    update_discounted_prices_for_promotion(Product.objects.filter(id=product.id))
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    assert product_channel_listing.price_range_start_amount is not None
+    variant = product.variants.first()
+
+    variables = {"ids": [graphene.Node.to_global_id("ProductVariant", variant.id)]}
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_BULK_DELETE_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariantBulkDelete"]["count"] == 1
+    product_channel_listing.refresh_from_db()
+    assert product_channel_listing.price_range_start_amount is None
+    assert product_channel_listing.price_range_stop_amount is None
+    assert product_channel_listing.discounted_price_range_stop_amount is None
+
+
 def test_delete_product_variants_invalid_object_typed_of_given_ids(
     staff_api_client,
     product_variant_list,
@@ -1249,7 +1286,7 @@ def test_delete_product_variants_removes_checkout_lines(
     "product_variant_bulk_delete.get_webhooks_for_event"
 )
 @patch("saleor.product.signals.delete_from_storage_task")
-@patch("saleor.plugins.manager.PluginsManager.product_variant_deleted")
+@patch("saleor.plugins.manager.PluginsManager.product_variant_bulk_deleted")
 @patch("saleor.order.tasks.recalculate_orders_task.delay")
 def test_delete_product_variants_with_images(
     mocked_recalculate_orders_task,
@@ -1299,8 +1336,9 @@ def test_delete_product_variants_with_images(
     assert not ProductVariant.objects.filter(
         id__in=[variant.id for variant in product_variant_list]
     ).exists()
+    product_variant_deleted_webhook_mock.assert_called_once()
     assert (
-        product_variant_deleted_webhook_mock.call_count
+        len(product_variant_deleted_webhook_mock.call_args.args[0])
         == content["data"]["productVariantBulkDelete"]["count"]
     )
     mocked_recalculate_orders_task.assert_not_called()
@@ -1477,7 +1515,7 @@ def test_product_delete_removes_reference_to_page(
     "saleor.graphql.product.bulk_mutations."
     "product_variant_bulk_delete.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_variant_deleted")
+@patch("saleor.plugins.manager.PluginsManager.product_variant_bulk_deleted")
 @patch("saleor.order.tasks.recalculate_orders_task.delay")
 def test_delete_product_variants_with_file_attribute(
     mocked_recalculate_orders_task,
@@ -1524,8 +1562,9 @@ def test_delete_product_variants_with_file_attribute(
     assert not ProductVariant.objects.filter(
         id__in=[variant.id for variant in product_variant_list]
     ).exists()
+    product_variant_deleted_webhook_mock.assert_called_once()
     assert (
-        product_variant_deleted_webhook_mock.call_count
+        len(product_variant_deleted_webhook_mock.call_args.args[0])
         == content["data"]["productVariantBulkDelete"]["count"]
     )
     mocked_recalculate_orders_task.assert_not_called()
@@ -22,6 +22,8 @@ from ....product.models import ALL_PRODUCTS_PERMISSIONS
 from ....product.utils import calculate_revenue_for_variant
 from ....product.utils.availability import (
     get_product_availability,
+    get_product_price_ranges,
+    get_product_price_ranges_from_snapshot,
     get_variant_availability,
 )
 from ....product.utils.variants import get_variant_selection_attributes
@@ -1136,22 +1138,38 @@ class Product(ChannelContextTypeWithMetadata[models.Product]):
         product_channel_listing = ProductChannelListingByProductIdAndChannelSlugLoader(
             context
         ).load((root.node.id, channel_slug))
-        variants_channel_listing = (
-            VariantsChannelListingByProductIdAndChannelSlugLoader(context).load(
-                (root.node.id, channel_slug)
-            )
-        )
         tax_class = TaxClassByProductIdLoader(context).load(root.node.id)
 
+        def load_price_ranges(product_channel_listing):
+            # Variant listings are loaded only when the price ranges stored on the
+            # product listing are outdated.
+            if price_ranges := get_product_price_ranges_from_snapshot(
+                product_channel_listing
+            ):
+                return price_ranges
+            return (
+                VariantsChannelListingByProductIdAndChannelSlugLoader(context)
+                .load((root.node.id, channel_slug))
+                .then(
+                    lambda variants_channel_listing: (
+                        get_product_price_ranges(variants_channel_listing)
+                        if variants_channel_listing
+                        else None
+                    )
+                )
+            )
+
+        price_ranges = product_channel_listing.then(load_price_ranges)
+
         def load_tax_configuration(data):
             (
                 channel,
                 product_channel_listing,
-                variants_channel_listing,
+                price_ranges,
                 tax_class,
             ) = data
 
-            if not variants_channel_listing:
+            if not price_ranges:
                 return None
             country_code = get_active_country(channel, address_data=address)
 
@@ -1186,7 +1204,7 @@ class Product(ChannelContextTypeWithMetadata[models.Product]):
 
                         availability = get_product_availability(
                             product_channel_listing=product_channel_listing,
-                            variants_channel_listing=variants_channel_listing,
+                            price_ranges=price_ranges,
                             prices_entered_with_tax=tax_config.prices_entered_with_tax,
                             tax_calculation_strategy=tax_calculation_strategy,
                             tax_rate=tax_rate,
@@ -1226,7 +1244,7 @@ class Product(ChannelContextTypeWithMetadata[models.Product]):
             [
                 channel,
                 product_channel_listing,
-                variants_channel_listing,
+                price_ranges,
                 tax_class,
             ]
         ).then(load_tax_configuration)
@@ -25,12 +25,35 @@ from ..core.utils import is_valid_ipv4, is_valid_ipv6
 from ..webhook import observability
 from .api import API_PATH, schema
 from .context import clear_context, get_context_value
+from .core.document_cache import (
+    DocumentCacheBackend,
+    DocumentCacheLookup,
+    DocumentCacheStats,
+    get_document_id,
+)
+from .core.persisted_queries import (
+    PersistedQueryHashMismatch,
+    PersistedQueryNotAllowed,
+    PersistedQueryNotFound,
+    PersistedQueryNotSupported,
+    get_persisted_queries_allow_list,
+    get_persisted_query_hash,
+)
+from .core.response_cache import (
+    RESPONSE_CACHE_HEADER,
+    cache_response,
+    get_cached_response,
+    get_response_cache_key,
+    get_response_cache_tags,
+    set_response_cache_status,
+)
 from .core.validators.query_cost import validate_query_cost
 from .query_cost_map import COST_MAP
 from .utils import format_error, query_fingerprint, query_identifier
 from .utils.validators import check_if_query_contains_only_schema
 
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
+GET_NOT_ALLOWED_OPERATION_MSG = "Only queries can be sent with GET requests."
 
 
 def tracing_wrapper(execute, sql, params, many, context):
@@ -106,6 +129,10 @@ class GraphQLView(View):
     def dispatch(self, request, *args, **kwargs):
         # Handle options method the GraphQlView restricts it.
         if request.method == "GET":
+            if settings.GRAPHQL_PERSISTED_QUERIES_ENABLED and (
+                "query" in request.GET or "extensions" in request.GET
+            ):
+                return self.handle_query(request)
             if settings.PLAYGROUND_ENABLED:
                 return self.render_playground(request)
             return HttpResponseNotAllowed(["OPTIONS", "POST"])
@@ -144,7 +171,10 @@ class GraphQLView(View):
             status_code = max((code for response, code in responses), default=200)
         else:
             result, status_code = self.get_response(request, data)
-        return JsonResponse(data=result, status=status_code, safe=False)
+        response = JsonResponse(data=result, status=status_code, safe=False)
+        if cache_statuses := getattr(request, "response_cache_statuses", None):
+            response[RESPONSE_CACHE_HEADER] = ", ".join(cache_statuses)
+        return response
 
     def handle_query(self, request: HttpRequest) -> JsonResponse:
         tracer = opentracing.global_tracer()
@@ -248,6 +278,10 @@ class GraphQLView(View):
 
         # Attempt to parse the query, if it fails, return the error
         try:
+            if isinstance(self.backend, DocumentCacheBackend):
+                document, lookup = self.backend.get_document(self.schema, query)
+                self.report_document_cache_lookup(lookup, self.backend.stats)
+                return document, None
             return (
                 self.backend.document_from_string(self.schema, query),
                 None,
@@ -255,6 +289,86 @@ class GraphQLView(View):
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
 
+    def get_document(
+        self,
+        request: HttpRequest,
+        data: dict,
+        query: Optional[str],
+        operation_name: Optional[str],
+    ) -> tuple[Optional[GraphQLDocument], Optional[ExecutionResult]]:
+        persisted_query_hash = None
+        if settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+            persisted_query_hash = get_persisted_query_hash(data.get("extensions"))
+
+        if persisted_query_hash:
+            document, error = self.parse_persisted_query(persisted_query_hash, query)
+        elif get_persisted_queries_allow_list() is not None:
+            return None, ExecutionResult(
+                errors=[PersistedQueryNotAllowed()], invalid=True
+            )
+        else:
+            document, error = self.parse_query(query)
+
+        if (
+            document is not None
+            and request.method == "GET"
+            and document.get_operation_type(operation_name) != "query"
+        ):
+            return None, ExecutionResult(
+                errors=[GraphQLError(GET_NOT_ALLOWED_OPERATION_MSG)], invalid=True
+            )
+        return document, error
+
+    def parse_persisted_query(
+        self, query_hash: str, query: Optional[str]
+    ) -> tuple[Optional[GraphQLDocument], Optional[ExecutionResult]]:
+        """Get a gql document of the persisted query with the given hash.
+
+        When the query is provided along with the hash, it is registered in the
+        document cache, unless the allow-list mode is enabled.
+        """
+        if not isinstance(self.backend, DocumentCacheBackend):
+            return None, ExecutionResult(
+                errors=[PersistedQueryNotSupported()], invalid=True
+            )
+
+        allow_list = get_persisted_queries_allow_list()
+        if allow_list is not None:
+            if query_hash not in allow_list:
+                return None, ExecutionResult(
+                    errors=[PersistedQueryNotAllowed()], invalid=True
+                )
+            query = allow_list[query_hash]
+
+        if query is not None:
+            if not isinstance(query, str) or get_document_id(query) != query_hash:
+                return None, ExecutionResult(
+                    errors=[PersistedQueryHashMismatch()], invalid=True
+                )
+            return self.parse_query(query)
+
+        document, lookup = self.backend.get_document_by_id(self.schema, query_hash)
+        if document is None:
+            return None, ExecutionResult(
+                errors=[PersistedQueryNotFound()], invalid=True
+            )
+        self.report_document_cache_lookup(lookup, self.backend.stats)
+        return document, None
+
+    @staticmethod
+    def report_document_cache_lookup(
+        lookup: DocumentCacheLookup, stats: DocumentCacheStats
+    ):
+        span = opentracing.global_tracer().active_span
+        if span is None:
+            return
+        span.set_tag("graphql.document_cache", lookup.source)
+        span.set_tag(
+            "graphql.document_cache.time_saved",
+            lookup.parse_time if lookup.is_hit else 0.0,
+        )
+        span.set_tag("graphql.document_cache.hit_ratio", stats.hit_ratio)
+
     def execute_graphql_request(self, request: HttpRequest, data: dict):
         with opentracing.global_tracer().start_active_span("graphql_query") as scope:
             span = scope.span
@@ -266,7 +380,7 @@ class GraphQLView(View):
 
             query, variables, operation_name = self.get_graphql_params(request, data)
 
-            document, error = self.parse_query(query)
+            document, error = self.get_document(request, data, query, operation_name)
             with observability.report_gql_operation() as operation:
                 operation.query = document
                 operation.name = operation_name
@@ -302,6 +416,19 @@ class GraphQLView(View):
                 # executor is not a valid argument in all backends
                 extra_options["executor"] = self.executor
 
+            response_cache_key = None
+            if response_cache_tags := get_response_cache_tags(
+                request, document, operation_name
+            ):
+                response_cache_key = get_response_cache_key(
+                    request, document, operation_name, variables, response_cache_tags
+                )
+                cached_response, cache_status = get_cached_response(response_cache_key)
+                set_response_cache_status(request, cache_status)
+                span.set_tag("graphql.response_cache", cache_status)
+                if cached_response:
+                    return set_query_cost_on_result(cached_response, query_cost)
+
             context = get_context_value(request)
             if app := getattr(request, "app", None):
                 span.set_tag("app.id", app.id)
@@ -328,6 +455,8 @@ class GraphQLView(View):
                         )
                         if should_use_cache_for_scheme:
                             cache.set(key, response)
+                        if response_cache_key:
+                            cache_response(response_cache_key, response)
 
                     return set_query_cost_on_result(response, query_cost)
             except Exception as e:
@@ -352,6 +481,8 @@ class GraphQLView(View):
             return json.loads(body)
         if content_type in ["application/x-www-form-urlencoded", "multipart/form-data"]:
             return request.POST
+        if request.method == "GET":
+            return request.GET
         return {}
 
     @staticmethod
@@ -361,6 +492,12 @@ class GraphQLView(View):
         operation_name = data.get("operationName")
         if operation_name == "null":
             operation_name = None
+        if isinstance(variables, str):
+            # Variables are sent as a JSON encoded string in GET requests
+            try:
+                variables = json.loads(variables)
+            except ValueError:
+                variables = None
 
         if request.content_type == "multipart/form-data":
             operations = json.loads(data.get("operations", "{}"))
@@ -1,14 +1,24 @@
 from collections.abc import Iterable
 from datetime import datetime
-from typing import Any, Optional, Union
+from functools import lru_cache
+from typing import Any, Optional, Union, cast
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
-from graphql import get_default_backend, parse
+from graphql import (
+    GraphQLDocument,
+    GraphQLInterfaceType,
+    GraphQLUnionType,
+    get_named_type,
+)
 from graphql.error import GraphQLError
+from graphql.language.printer import print_ast
+from graphql.validation import validate
+from graphql.validation.rules.base import ValidationRule
+from graphql.validation.validation import ValidationContext
 from promise import Promise
 
 from ...account.models import User
@@ -18,6 +28,7 @@ from ...core.utils import get_domain
 from ...webhook.models import Webhook
 from ..core import SaleorContext
 from ..core.dataloaders import DataLoader
+from ..core.document_cache import get_document_id
 from ..utils import format_error
 
 logger = get_task_logger(__name__)
@@ -65,6 +76,89 @@ def get_event_payload(event):
     return event
 
 
+def get_subscription_document(subscription_query: str) -> GraphQLDocument:
+    """Return the parsed and validated document of the subscription query.
+
+    Documents are kept in the GraphQL document cache, which is shared with the API
+    and between workers, so executing a subscription skips parsing and validation
+    of queries that were seen before.
+    """
+    from ..api import backend, schema
+
+    return backend.document_from_string(schema, subscription_query)
+
+
+class AppFieldSelected(GraphQLError):
+    pass
+
+
+class ContainAppField(ValidationRule):
+    """Find fields that resolve to the `App` type.
+
+    Resolvers of such fields depend on the app that receives the payload, e.g.
+    `recipient` returns the app itself and apps can see their own private metadata.
+    """
+
+    def __init__(self):  # pylint: disable=super-init-not-called
+        pass
+
+    def __call__(self, context: ValidationContext):
+        self.context = context
+        return self
+
+    def enter_Field(self, node, key, parent, path, ancestors):  # pylint: disable=unused-argument
+        field_type = self.context.get_type()
+        if field_type is None:
+            return
+        named_type = get_named_type(field_type)
+        possible_types = [named_type]
+        if isinstance(named_type, (GraphQLInterfaceType, GraphQLUnionType)):
+            possible_types = self.context.get_schema().get_possible_types(named_type)
+        if any(possible_type.name == "App" for possible_type in possible_types):
+            raise AppFieldSelected(f"The query contains field {node.name.value}.")
+
+
+@lru_cache(maxsize=256)
+def get_subscription_query_signature(subscription_query: str) -> tuple[str, bool]:
+    """Return the hash of the normalized query and whether it selects app fields.
+
+    Queries that differ only in formatting and comments have the same hash.
+    """
+    document = get_subscription_document(subscription_query)
+    query_hash = get_document_id(print_ast(document.document_ast))
+    validator = cast(type[ValidationRule], ContainAppField())
+    try:
+        validate(document.schema, document.document_ast, [validator])
+    except AppFieldSelected:
+        return query_hash, True
+    return query_hash, False
+
+
+def group_webhooks_by_payload(webhooks: Iterable[Webhook]) -> list[list[Webhook]]:
+    """Group webhooks whose subscriptions generate identical payloads.
+
+    Payloads are identical for the same normalized query executed on behalf of
+    apps with the same permissions, unless the query selects fields that depend on
+    the app itself; such webhooks are grouped only with webhooks of the same app.
+    """
+    groups: dict[tuple, list[Webhook]] = {}
+    webhooks_by_query: dict[tuple[str, bool], list[Webhook]] = {}
+    for webhook in webhooks:
+        signature = get_subscription_query_signature(webhook.subscription_query)
+        webhooks_by_query.setdefault(signature, []).append(webhook)
+
+    for (query_hash, depends_on_app), query_webhooks in webhooks_by_query.items():
+        for webhook in query_webhooks:
+            if len(query_webhooks) == 1:
+                key: tuple = (query_hash,)
+            elif depends_on_app:
+                key = (query_hash, webhook.app_id)
+            else:
+                key = (query_hash, frozenset(webhook.app.get_permissions()))
+            groups.setdefault(key, []).append(webhook)
+    return list(groups.values())
+
+
 def generate_payload_from_subscription(
     event_type: str,
     subscribable_object,
@@ -88,50 +182,97 @@ def generate_payload_from_subscription(
     return: A payload ready to send via webhook. None if the function was not able to
     generate a payload
     """
-    from ..api import schema
+    return generate_payloads_from_subscription(
+        event_type=event_type,
+        subscribable_objects=[subscribable_object],
+        subscription_query=subscription_query,
+        request=request,
+        app=app,
+    )[0]
+
+
+def generate_payloads_from_subscription(
+    event_type: str,
+    subscribable_objects: Iterable,
+    subscription_query: str,
+    request: SaleorContext,
+    app: Optional[App] = None,
+) -> list[Optional[dict[str, Any]]]:
+    """Generate webhook payloads for many objects from one subscription query.
+
+    The query is executed for all objects before any of the payloads is resolved, so
+    dataloaders collect the keys of all objects and fetch them in shared batches
+    instead of running separate queries for each object.
+
+    All payloads are generated for the same app, as `request.app` is read by the
+    resolvers until the payloads are resolved.
+
+    return: A list of payloads in the order of given objects. A payload is None if
+    the function was not able to generate it.
+    """
     from ..context import get_context_value
 
-    graphql_backend = get_default_backend()
-    ast = parse(subscription_query)
-    document = graphql_backend.document_from_string(
-        schema,
-        ast,
-    )
+    document = get_subscription_document(subscription_query)
     app_id = app.pk if app else None
     request.app = app
-    results = document.execute(
-        allow_subscriptions=True,
-        root=(event_type, subscribable_object),
-        context=get_context_value(request),
-    )
-    if hasattr(results, "errors"):
-        logger.warning(
-            "Unable to build a payload for subscription. \n" "error: %s",
-            str(results.errors),
-            extra={"query": subscription_query, "app": app_id},
-        )
-        return None
-
-    payload: list[Any] = []
-    results.subscribe(payload.append)
 
-    if not payload:
-        logger.warning(
-            "Subscription did not return a payload.",
-            extra={"query": subscription_query, "app": app_id},
+    def execute_subscription(subscribable_object):
+        results = document.execute(
+            allow_subscriptions=True,
+            root=(event_type, subscribable_object),
+            context=get_context_value(request),
         )
-        return None
+        if hasattr(results, "errors"):
+            logger.warning(
+                "Unable to build a payload for subscription. \n" "error: %s",
+                str(results.errors),
+                extra={"query": subscription_query, "app": app_id},
+            )
+            return None
 
-    payload_instance = payload[0]
-    event_payload = get_event_payload(payload_instance.data.get("event"))
+        payload: list[Any] = []
+        results.subscribe(payload.append)
 
-    if payload_instance.errors:
-        event_payload["errors"] = [
-            format_error(error, (GraphQLError, PermissionDenied))
-            for error in payload_instance.errors
-        ]
+        if not payload:
+            logger.warning(
+                "Subscription did not return a payload.",
+                extra={"query": subscription_query, "app": app_id},
+            )
+            return None
+        return payload[0]
 
-    return event_payload
+    # Dataloaders dispatch their batches when the promise queue is drained. The
+    # executions are run within a single promise job, so the keys loaded for all
+    # objects end up in the same batches.
+    executed_payloads = (
+        Promise.resolve(None)
+        .then(lambda _: [execute_subscription(obj) for obj in subscribable_objects])
+        .get()
+    )
+    # Payloads are resolved one by one, so an object whose payload can't be resolved
+    # doesn't discard the payloads of the other objects.
+    event_payloads: list[Optional[dict[str, Any]]] = []
+    for payload_instance in executed_payloads:
+        if payload_instance is None:
+            event_payloads.append(None)
+            continue
+        try:
+            event_payload = get_event_payload(payload_instance.data.get("event"))
+        except Exception:
+            logger.warning(
+                "Unable to resolve a payload for subscription.",
+                exc_info=True,
+                extra={"query": subscription_query, "app": app_id},
+            )
+            event_payloads.append(None)
+            continue
+        if payload_instance.errors:
+            event_payload["errors"] = [
+                format_error(error, (GraphQLError, PermissionDenied))
+                for error in payload_instance.errors
+            ]
+        event_payloads.append(event_payload)
+    return event_payloads
 
 
 def get_pre_save_payload_key(webhook, instance):
@@ -164,18 +305,19 @@ def generate_pre_save_payloads(
         dataloaders=dataloaders,
     )
 
+    instances = list(instances)
     for webhook in webhooks:
         if not webhook.subscription_query:
             continue
 
-        for instance in instances:
-            instance_payload = generate_payload_from_subscription(
-                event_type=event_type,
-                subscribable_object=instance,
-                subscription_query=webhook.subscription_query,
-                request=request,
-                app=webhook.app,
-            )
+        instance_payloads = generate_payloads_from_subscription(
+            event_type=event_type,
+            subscribable_objects=instances,
+            subscription_query=webhook.subscription_query,
+            request=request,
+            app=webhook.app,
+        )
+        for instance, instance_payload in zip(instances, instance_payloads):
             key = get_pre_save_payload_key(webhook, instance)
             pre_save_payloads[key] = instance_payload
 
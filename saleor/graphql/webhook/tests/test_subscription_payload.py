@@ -1,11 +1,21 @@
+from unittest.mock import patch
+
 from django.test import override_settings
 from django.utils import timezone
 
+from ....product.models import ProductVariant
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.models import Webhook
+from ...api import backend
+from ...product.dataloaders import ProductByIdLoader
+from .. import subscription_payload
 from ..subscription_payload import (
+    generate_payload_from_subscription,
+    generate_payloads_from_subscription,
     generate_pre_save_payloads,
     get_pre_save_payload_key,
+    get_subscription_document,
+    get_subscription_query_signature,
     initialize_request,
 )
 
@@ -117,3 +127,154 @@ def test_generate_pre_save_payloads(webhook_app, variant):
     key = get_pre_save_payload_key(webhook, variant)
     assert key in pre_save_payloads
     assert pre_save_payloads[key]
+
+
+def test_get_subscription_document_cached():
+    # when
+    document = get_subscription_document(SUBSCRIPTION_QUERY)
+
+    # then
+    assert get_subscription_document(SUBSCRIPTION_QUERY) is document
+
+
+def test_subscription_document_cached_on_webhook_save(webhook_app):
+    # given
+    query = SUBSCRIPTION_QUERY.replace("name", "name sku")
+
+    # when
+    Webhook.objects.create(name="Webhook", app=webhook_app, subscription_query=query)
+
+    # then
+    with patch.object(
+        backend.backend, "parse_and_validate", wraps=backend.backend.parse_and_validate
+    ) as mocked_parse_and_validate:
+        get_subscription_document(query)
+    mocked_parse_and_validate.assert_not_called()
+
+
+def test_generate_payload_from_subscription_skips_parsing(variant):
+    # given
+    get_subscription_document(SUBSCRIPTION_QUERY)
+    request = initialize_request()
+
+    # when
+    with patch.object(
+        backend.backend, "parse_and_validate", wraps=backend.backend.parse_and_validate
+    ) as mocked_parse_and_validate:
+        payload = generate_payload_from_subscription(
+            WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED,
+            variant,
+            SUBSCRIPTION_QUERY,
+            request,
+        )
+
+    # then
+    mocked_parse_and_validate.assert_not_called()
+    assert payload["productVariant"]["name"] == variant.name
+
+
+PRODUCT_SUBSCRIPTION_QUERY = """
+    subscription {
+        event {
+            ... on ProductVariantUpdated {
+                productVariant {
+                    product {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_generate_payloads_from_subscription_batches_dataloaders(product_list):
+    # given
+    variants = list(
+        ProductVariant.objects.filter(product__in=product_list).order_by("pk")
+    )
+    request = initialize_request()
+
+    # when
+    with patch.object(
+        ProductByIdLoader,
+        "batch_load",
+        autospec=True,
+        side_effect=ProductByIdLoader.batch_load,
+    ) as mocked_batch_load:
+        payloads = generate_payloads_from_subscription(
+            WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED,
+            variants,
+            PRODUCT_SUBSCRIPTION_QUERY,
+            request,
+        )
+
+    # then
+    mocked_batch_load.assert_called_once()
+    assert len(mocked_batch_load.call_args[0][1]) == len(product_list)
+    assert [payload["productVariant"]["product"]["name"] for payload in payloads] == [
+        variant.product.name for variant in variants
+    ]
+
+
+def test_generate_payloads_from_subscription_skips_only_failed_payload(
+    product_variant_list,
+):
+    # given
+    request = initialize_request()
+    resolved_events = []
+
+    def get_event_payload(event):
+        # Fail to resolve the payload of the first variant only.
+        resolved_events.append(event)
+        if len(resolved_events) == 1:
+            raise ValueError("Unable to resolve payload.")
+        return subscription_payload.get_event_payload(event)
+
+    # when
+    with patch.object(
+        subscription_payload, "get_event_payload", side_effect=get_event_payload
+    ):
+        payloads = generate_payloads_from_subscription(
+            WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED,
+            product_variant_list,
+            SUBSCRIPTION_QUERY,
+            request,
+        )
+
+    # then
+    assert payloads == [None] + [
+        {"productVariant": {"name": variant.name}}
+        for variant in product_variant_list[1:]
+    ]
+
+
+def test_get_subscription_query_signature_ignores_formatting():
+    # given
+    formatted_query = "# comment\n" + SUBSCRIPTION_QUERY.replace("    ", "  ")
+
+    # when
+    query_hash, depends_on_app = get_subscription_query_signature(formatted_query)
+
+    # then
+    assert query_hash == get_subscription_query_signature(SUBSCRIPTION_QUERY)[0]
+    assert depends_on_app is False
+
+
+def test_get_subscription_query_signature_with_recipient():
+    # given
+    query = """
+        subscription {
+            event {
+                recipient {
+                    name
+                }
+            }
+        }
+    """
+
+    # when
+    _query_hash, depends_on_app = get_subscription_query_signature(query)
+
+    # then
+    assert depends_on_app is True
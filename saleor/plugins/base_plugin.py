@@ -956,6 +956,12 @@ class BasePlugin:
     # created.
     product_created: Callable[["Product", Any, None], Any]
 
+    # Trigger when products are created in bulk.
+    #
+    # Overwrite this method to handle all products at once. Plugins that don't
+    # implement it get `product_created` called for each of the products.
+    product_bulk_created: Callable[[list["Product"], Any, None], Any]
+
     # Trigger when product is deleted.
     #
     # Overwrite this method if you need to trigger specific logic after a product is
@@ -968,6 +974,12 @@ class BasePlugin:
     # updated.
     product_updated: Callable[["Product", Any, None], Any]
 
+    # Trigger when products are updated in bulk.
+    #
+    # Overwrite this method to handle all products at once. Plugins that don't
+    # implement it get `product_updated` called for each of the products.
+    product_bulk_updated: Callable[[list["Product"], Any, None], Any]
+
     # Trigger when product media is created.
     #
     # Overwrite this method if you need to trigger specific logic after a product media
@@ -998,18 +1010,36 @@ class BasePlugin:
     # variant is created.
     product_variant_created: Callable[["ProductVariant", Any, None], Any]
 
+    # Trigger when product variants are created in bulk.
+    #
+    # Overwrite this method to handle all variants at once. Plugins that don't
+    # implement it get `product_variant_created` called for each of the variants.
+    product_variant_bulk_created: Callable[[list["ProductVariant"], Any, None], Any]
+
     # Trigger when product variant is deleted.
     #
     # Overwrite this method if you need to trigger specific logic after a product
     # variant is deleted.
     product_variant_deleted: Callable[["ProductVariant", Any, None], Any]
 
+    # Trigger when product variants are deleted in bulk.
+    #
+    # Overwrite this method to handle all variants at once. Plugins that don't
+    # implement it get `product_variant_deleted` called for each of the variants.
+    product_variant_bulk_deleted: Callable[[list["ProductVariant"], Any, None], Any]
+
     # Trigger when product variant is updated.
     #
     # Overwrite this method if you need to trigger specific logic after a product
     # variant is updated.
     product_variant_updated: Callable[["ProductVariant", Any, None], Any]
 
+    # Trigger when product variants are updated in bulk.
+    #
+    # Overwrite this method to handle all variants at once. Plugins that don't
+    # implement it get `product_variant_updated` called for each of the variants.
+    product_variant_bulk_updated: Callable[[list["ProductVariant"], Any, None], Any]
+
     # Trigger when product variant metadata is updated.
     #
     # Overwrite this method if you need to trigger specific logic after a product
@@ -0,0 +1,67 @@
+"""Cache of plugin configurations.
+
+Every plugins manager loads the configurations of the plugins for each channel it
+touches, which used to be a query per channel on every request. Configurations are
+kept in the shared cache per channel, versioned with a global counter stored in the
+shared cache. Bumping the counter (on saving or deleting a `PluginConfiguration`)
+invalidates the cached configurations in every process.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..core.db.connection import allow_writer
+from ..core.utils.cache import bump_cache_version_on_commit, get_cache_version
+from .models import PluginConfiguration
+
+if TYPE_CHECKING:
+    from ..channel.models import Channel
+
+PLUGIN_CONFIGURATION_CACHE_KEY = "plugin_configurations:{version}:{channel_id}"
+PLUGIN_CONFIGURATION_CACHE_VERSION_KEY = "plugin_configuration_cache_version"
+
+
+def get_plugin_configuration_cache_version() -> int:
+    return get_cache_version(PLUGIN_CONFIGURATION_CACHE_VERSION_KEY)
+
+
+def get_plugin_configurations(
+    channel: Optional["Channel"],
+) -> dict[str, PluginConfiguration]:
+    """Return configurations of the channel's plugins keyed by the plugin id.
+
+    Configurations of global plugins are returned for `channel=None`.
+    """
+    version = get_plugin_configuration_cache_version()
+    key = PLUGIN_CONFIGURATION_CACHE_KEY.format(
+        version=version, channel_id=channel.pk if channel else None
+    )
+    configs = cache.get(key)
+    if configs is None:
+        # Configurations are kept until the next change, so they are read from the
+        # writer to not cache a state that the replica has not caught up with yet.
+        with allow_writer():
+            configs = {
+                config.identifier: config
+                for config in PluginConfiguration.objects.using(
+                    settings.DATABASE_CONNECTION_DEFAULT_NAME
+                ).filter(channel=channel)
+            }
+        cache.set(
+            key,
+            configs,
+            timeout=settings.PLUGIN_CONFIGURATION_CACHE_TIMEOUT.total_seconds(),
+        )
+
+    # Channels are not cached with the configurations, as changes of channels don't
+    # invalidate the cache; the given channel is used instead.
+    for config in configs.values():
+        config.channel = channel
+    return configs
+
+
+def invalidate_plugin_configuration_cache():
+    """Invalidate cached plugin configurations in every process."""
+    bump_cache_version_on_commit(PLUGIN_CONFIGURATION_CACHE_VERSION_KEY)
@@ -20,6 +20,7 @@ from ..core.payments import PaymentInterface
 from ..core.prices import quantize_price
 from ..core.taxes import TaxData, TaxType, zero_money, zero_taxed_money
 from ..graphql.core import ResolveInfo, SaleorContext
+from ..graphql.core.response_cache import invalidate_response_cache_for_event
 from ..order import base_calculations as base_order_calculations
 from ..order.base_calculations import (
     base_order_line_total,
@@ -53,6 +54,7 @@ from ..payment.interface import (
 )
 from ..tax.utils import calculate_tax_rate
 from .base_plugin import ExcludedShippingMethod, ExternalAccessTokens
+from .configuration_cache import get_plugin_configurations
 from .models import PluginConfiguration
 
 if TYPE_CHECKING:
@@ -143,6 +145,10 @@ class PluginsManager(PaymentInterface):
             self.loaded_channels: set[str] = set()
             self.loaded_global = False
             self.requestor_getter = requestor_getter
+            # channel slug -> method name -> plugins implementing the method
+            self._dispatch_tables: defaultdict[
+                Optional[str], dict[str, list[BasePlugin]]
+            ] = defaultdict(dict)
 
     def __del__(self) -> None:
         # remove references to plugins
@@ -151,6 +157,7 @@ class PluginsManager(PaymentInterface):
         for c in self.plugins_per_channel.values():
             c.clear()
         self.loaded_channels.clear()
+        self._dispatch_tables.clear()
 
     def _ensure_channel_plugins_loaded(
         self, channel_slug: Optional[str], channel: Optional[Channel] = None
@@ -171,6 +178,7 @@ class PluginsManager(PaymentInterface):
                         self.global_plugins.append(plugin)
                         self.all_plugins.append(plugin)
             self.loaded_global = True
+            self._dispatch_tables.clear()
 
         if channel_slug is not None and channel_slug not in self.loaded_channels:
             if channel is None:
@@ -201,16 +209,30 @@ class PluginsManager(PaymentInterface):
             self._ensure_channel_plugins_loaded(None)
             self.plugins_per_channel[channel_slug].extend(self.global_plugins)
             self.loaded_channels.add(channel_slug)
+            # Plugins of all loaded channels are dispatched for `channel_slug=None`.
+            self._dispatch_tables.pop(channel_slug, None)
+            self._dispatch_tables.pop(None, None)
 
     def _get_db_plugin_configs(self, channel: Optional[Channel]):
         with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
-            plugin_manager_configs = PluginConfiguration.objects.using(
-                self.database
-            ).filter(channel=channel)
-            configs = {}
-            for db_plugin_config in plugin_manager_configs.iterator():
-                configs[db_plugin_config.identifier] = db_plugin_config
-            return configs
+            return get_plugin_configurations(channel)
+
+    def _get_plugins_implementing(
+        self, method_name: str, channel_slug: Optional[str]
+    ) -> list["BasePlugin"]:
+        """Return plugins of the channel that implement the given method.
+
+        The result is kept in the dispatch table, so plugins are checked for the
+        method only once per manager.
+        """
+        dispatch_table = self._dispatch_tables[channel_slug]
+        if method_name not in dispatch_table:
+            dispatch_table[method_name] = [
+                plugin
+                for plugin in self.get_plugins(channel_slug=channel_slug)
+                if getattr(plugin, method_name, NotImplemented) is not NotImplemented
+            ]
+        return dispatch_table[method_name]
 
     def __run_method_on_plugins(
         self,
@@ -222,18 +244,48 @@ class PluginsManager(PaymentInterface):
         **kwargs,
     ):
         """Try to run a method with the given name on each declared active plugin."""
+        invalidate_response_cache_for_event(method_name)
         value = default_value
-        plugins = self.get_plugins(
-            channel_slug=channel_slug,
-            active_only=True,
-            plugin_ids=plugin_ids,
-        )
+        plugins = self._get_plugins_implementing(method_name, channel_slug)
         for plugin in plugins:
+            if not plugin.active:
+                continue
+            if plugin_ids and plugin.PLUGIN_ID not in plugin_ids:
+                continue
             value = self.__run_method_on_single_plugin(
                 plugin, method_name, value, *args, **kwargs
             )
         return value
 
+    def __run_bulk_method_on_plugins(
+        self,
+        method_name: str,
+        single_method_name: str,
+        objects: list,
+        **kwargs,
+    ):
+        """Run a method for many objects on each declared active plugin.
+
+        Plugins that don't implement the method get the method for a single object
+        run for each of the objects instead.
+        """
+        if not objects:
+            return
+        invalidate_response_cache_for_event(single_method_name)
+        bulk_plugins = self._get_plugins_implementing(method_name, None)
+        for plugin in bulk_plugins:
+            if plugin.active:
+                self.__run_method_on_single_plugin(
+                    plugin, method_name, None, objects, **kwargs
+                )
+        for plugin in self._get_plugins_implementing(single_method_name, None):
+            if not plugin.active or plugin in bulk_plugins:
+                continue
+            for obj in objects:
+                self.__run_method_on_single_plugin(
+                    plugin, single_method_name, None, obj, **kwargs
+                )
+
     def __run_method_on_single_plugin(
         self,
         plugin: Optional["BasePlugin"],
@@ -769,6 +821,16 @@ class PluginsManager(PaymentInterface):
             channel_slug=None,
         )
 
+    def product_bulk_created(self, products: list["Product"], webhooks=None):
+        return self.__run_bulk_method_on_plugins(
+            "product_bulk_created", "product_created", products, webhooks=webhooks
+        )
+
+    def product_bulk_updated(self, products: list["Product"], webhooks=None):
+        return self.__run_bulk_method_on_plugins(
+            "product_bulk_updated", "product_updated", products, webhooks=webhooks
+        )
+
     def product_deleted(self, product: "Product", variants: list[int], webhooks=None):
         default_value = None
         return self.__run_method_on_plugins(
@@ -837,6 +899,37 @@ class PluginsManager(PaymentInterface):
             channel_slug=None,
         )
 
+    def product_variant_bulk_created(
+        self, product_variants: list["ProductVariant"], webhooks=None
+    ):
+        return self.__run_bulk_method_on_plugins(
+            "product_variant_bulk_created",
+            "product_variant_created",
+            product_variants,
+            webhooks=webhooks,
+        )
+
+    def product_variant_bulk_updated(
+        self, product_variants: list["ProductVariant"], webhooks=None, **kwargs
+    ):
+        return self.__run_bulk_method_on_plugins(
+            "product_variant_bulk_updated",
+            "product_variant_updated",
+            product_variants,
+            webhooks=webhooks,
+            **kwargs,
+        )
+
+    def product_variant_bulk_deleted(
+        self, product_variants: list["ProductVariant"], webhooks=None
+    ):
+        return self.__run_bulk_method_on_plugins(
+            "product_variant_bulk_deleted",
+            "product_variant_deleted",
+            product_variants,
+            webhooks=webhooks,
+        )
+
     def product_variant_out_of_stock(self, stock: "Stock", webhooks=None):
         default_value = None
         self.__run_method_on_plugins(
@@ -2294,7 +2387,11 @@ class PluginsManager(PaymentInterface):
         plugins: Optional[list["BasePlugin"]] = None,
     ):
         if plugins is None:
-            plugins = self.get_plugins(channel_slug=channel_slug, active_only=True)
+            plugins = [
+                plugin
+                for plugin in self._get_plugins_implementing(method_name, channel_slug)
+                if plugin.active
+            ]
         if plugins:
             for plugin in plugins:
                 result = self.__run_method_on_single_plugin(
@@ -0,0 +1,5 @@
+from .configuration_cache import invalidate_plugin_configuration_cache
+
+
+def invalidate_plugin_configuration_cache_on_change(sender, instance, **kwargs):
+    invalidate_plugin_configuration_cache()
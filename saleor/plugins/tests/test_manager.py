@@ -959,6 +959,33 @@ def test_list_external_authentications_active_only(channel_USD):
     } in external_auths
 
 
+def test_run_bulk_method_falls_back_to_single_object_method(
+    plugins_manager, product_variant_list
+):
+    # given
+    bulk_plugin = mock.Mock(
+        spec=["active", "product_variant_bulk_created", "product_variant_created"],
+        active=True,
+    )
+    single_object_plugin = mock.Mock(
+        spec=["active", "product_variant_created"], active=True
+    )
+    plugins_manager.all_plugins = [bulk_plugin, single_object_plugin]
+
+    # when
+    plugins_manager.product_variant_bulk_created(product_variant_list)
+
+    # then
+    bulk_plugin.product_variant_bulk_created.assert_called_once_with(
+        product_variant_list, webhooks=None, previous_value=None
+    )
+    bulk_plugin.product_variant_created.assert_not_called()
+    assert [
+        call.args[0]
+        for call in single_object_plugin.product_variant_created.call_args_list
+    ] == product_variant_list
+
+
 def test_run_method_on_plugins_default_value(plugins_manager):
     default_value = "default"
     value = plugins_manager._PluginsManager__run_method_on_plugins(
@@ -1000,8 +1027,9 @@ def test_run_method_on_plugins_value_overridden_by_plugin_method(
 def test_run_method_on_plugins_only_on_active_ones(
     mocked_method, channel_USD, all_plugins_manager
 ):
+    method_name = "get_supported_currencies"
     all_plugins_manager._PluginsManager__run_method_on_plugins(
-        method_name="test_method_name",
+        method_name=method_name,
         default_value="default_value",
         channel_slug=channel_USD.slug,
     )
@@ -1012,15 +1040,15 @@ def test_run_method_on_plugins_only_on_active_ones(
         len([p for p in all_plugins_manager.all_plugins if p.active])
         == active_plugins_count
     )
-    assert mocked_method.call_count == active_plugins_count
 
     called_plugins_id = [arg.args[0].PLUGIN_ID for arg in mocked_method.call_args_list]
     expected_active_plugins_id = [
         p.PLUGIN_ID
         for p in all_plugins_manager.plugins_per_channel[channel_USD.slug]
-        if p.active
+        if p.active and hasattr(p, method_name)
     ]
 
+    assert expected_active_plugins_id
     assert called_plugins_id == expected_active_plugins_id
 
 
@@ -1048,7 +1076,7 @@ def test_run_method_on_plugins_only_for_given_channel(
 
     # when
     plugins_manager._PluginsManager__run_method_on_plugins(
-        method_name="test_method",
+        method_name="get_supported_currencies",
         default_value=default_value,
         channel_slug=channel_USD.slug,
     )
@@ -1613,9 +1641,121 @@ def test_run_plugin_method_until_first_success_for_active_plugins_only(
         return_value=None,
     ) as mock_run_method:
         result = manager._PluginsManager__run_plugin_method_until_first_success(
-            "some_method", channel_slug=None
+            "external_obtain_access_tokens", channel_slug=None
         )
 
     # then
     assert result is None
     assert mock_run_method.call_count == calls
+
+
+def test_plugin_configurations_cached_between_managers(
+    plugin_configuration, django_assert_num_queries
+):
+    # given
+    plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    PluginsManager(plugins=plugins).get_plugins()
+
+    # when
+    with django_assert_num_queries(0):
+        plugin = PluginsManager(plugins=plugins).get_plugin(PluginSample.PLUGIN_ID)
+
+    # then
+    assert plugin.db_config.pk == plugin_configuration.pk
+
+
+def test_plugin_configurations_cache_invalidated_on_save(plugin_configuration):
+    # given
+    plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    assert PluginsManager(plugins=plugins).get_plugin(PluginSample.PLUGIN_ID).active
+
+    # when
+    plugin_configuration.active = False
+    plugin_configuration.save(update_fields=["active"])
+
+    # then
+    plugin = PluginsManager(plugins=plugins).get_plugin(PluginSample.PLUGIN_ID)
+    assert plugin.active is False
+
+
+def test_plugin_configurations_cache_invalidated_on_delete(plugin_configuration):
+    # given
+    plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    assert PluginsManager(plugins=plugins).get_plugin(PluginSample.PLUGIN_ID).db_config
+
+    # when
+    plugin_configuration.delete()
+
+    # then
+    plugin = PluginsManager(plugins=plugins).get_plugin(PluginSample.PLUGIN_ID)
+    assert plugin.db_config is None
+
+
+def test_get_plugins_implementing(channel_USD):
+    # given
+    manager = PluginsManager(
+        plugins=[
+            "saleor.plugins.tests.sample_plugins.ActivePaymentGateway",
+            "saleor.plugins.tests.sample_plugins.ActivePlugin",
+            "saleor.plugins.tests.sample_plugins.InactivePaymentGateway",
+        ]
+    )
+
+    # when
+    plugins = manager._get_plugins_implementing(
+        "get_supported_currencies", channel_USD.slug
+    )
+
+    # then
+    assert [plugin.PLUGIN_ID for plugin in plugins] == [
+        ActivePaymentGateway.PLUGIN_ID,
+        InactivePaymentGateway.PLUGIN_ID,
+    ]
+    assert (
+        manager._get_plugins_implementing("get_supported_currencies", channel_USD.slug)
+        is plugins
+    )
+    assert manager._get_plugins_implementing("not_implemented", channel_USD.slug) == []
+
+
+def test_run_method_on_plugins_skips_plugins_deactivated_after_dispatch(channel_USD):
+    # given
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.ActivePaymentGateway"]
+    )
+    run_method = partial(
+        manager._PluginsManager__run_method_on_plugins,
+        "get_supported_currencies",
+        None,
+        channel_slug=channel_USD.slug,
+    )
+    assert run_method() == ActivePaymentGateway.SUPPORTED_CURRENCIES
+
+    # when
+    manager.get_plugin(ActivePaymentGateway.PLUGIN_ID, channel_USD.slug).active = False
+
+    # then
+    assert run_method() is None
+
+
+def test_cached_plugin_configurations_use_current_channel(channel_USD):
+    # given
+    plugins = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    PluginConfiguration.objects.create(
+        identifier=ChannelPluginSample.PLUGIN_ID,
+        name=ChannelPluginSample.PLUGIN_NAME,
+        active=True,
+        channel=channel_USD,
+    )
+    PluginsManager(plugins=plugins).get_plugins(channel_slug=channel_USD.slug)
+
+    # when
+    channel_USD.name = "Changed name"
+    channel_USD.save(update_fields=["name"])
+
+    # then
+    plugin = PluginsManager(plugins=plugins).get_plugin(
+        ChannelPluginSample.PLUGIN_ID, channel_slug=channel_USD.slug
+    )
+    assert plugin.db_config
+    assert plugin.channel.name == "Changed name"
@@ -89,6 +89,7 @@ from ...webhook.payloads import (
 from ...webhook.transport.asynchronous.transport import (
     send_webhook_request_async,
     trigger_webhooks_async,
+    trigger_webhooks_async_for_multiple_objects,
 )
 from ...webhook.transport.list_stored_payment_methods import (
     get_list_stored_payment_methods_data_dict,
@@ -251,6 +252,11 @@ class WebhookPlugin(BasePlugin):
     def trigger_webhooks_async(self, *args, **kwargs):
         return trigger_webhooks_async(*args, **kwargs, allow_replica=self.allow_replica)  # type: ignore
 
+    def trigger_webhooks_async_for_multiple_objects(self, *args, **kwargs):
+        return trigger_webhooks_async_for_multiple_objects(
+            *args, **kwargs, allow_replica=self.allow_replica
+        )
+
     def account_confirmed(self, user: "User", previous_value: None) -> None:
         if not self.active:
             return previous_value
@@ -1569,6 +1575,15 @@ class WebhookPlugin(BasePlugin):
                 legacy_data_generator=product_data_generator,
             )
 
+    def product_bulk_created(
+        self, products: list["Product"], previous_value: Any, webhooks=None
+    ) -> Any:
+        if not self.active:
+            return previous_value
+        self._trigger_products_event(
+            WebhookEventAsyncType.PRODUCT_CREATED, products, webhooks
+        )
+
     def product_updated(
         self, product: "Product", previous_value: Any, webhooks=None
     ) -> Any:
@@ -1588,6 +1603,29 @@ class WebhookPlugin(BasePlugin):
                 legacy_data_generator=product_data_generator,
             )
 
+    def product_bulk_updated(
+        self, products: list["Product"], previous_value: Any, webhooks=None
+    ) -> Any:
+        if not self.active:
+            return previous_value
+        self._trigger_products_event(
+            WebhookEventAsyncType.PRODUCT_UPDATED, products, webhooks
+        )
+
+    def _trigger_products_event(self, event_type, products, webhooks):
+        if webhooks := self._get_webhooks_for_event(event_type, webhooks):
+
+            def generate_product_payload_for_product(product):
+                return generate_product_payload(product, self.requestor)
+
+            self.trigger_webhooks_async_for_multiple_objects(
+                event_type,
+                webhooks,
+                products,
+                self.requestor,
+                legacy_data_generator=generate_product_payload_for_product,
+            )
+
     def product_metadata_updated(self, product: "Product", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
@@ -1736,6 +1774,65 @@ class WebhookPlugin(BasePlugin):
                 legacy_data_generator=product_variant_data_generator,
             )
 
+    def product_variant_bulk_created(
+        self,
+        product_variants: list["ProductVariant"],
+        previous_value: Any,
+        webhooks=None,
+    ) -> Any:
+        if not self.active:
+            return previous_value
+        self._trigger_product_variants_event(
+            WebhookEventAsyncType.PRODUCT_VARIANT_CREATED, product_variants, webhooks
+        )
+
+    def product_variant_bulk_updated(
+        self,
+        product_variants: list["ProductVariant"],
+        previous_value: Any,
+        webhooks=None,
+        **kwargs,
+    ) -> Any:
+        if not self.active:
+            return previous_value
+        self._trigger_product_variants_event(
+            WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED,
+            product_variants,
+            webhooks,
+            **kwargs,
+        )
+
+    def product_variant_bulk_deleted(
+        self,
+        product_variants: list["ProductVariant"],
+        previous_value: Any,
+        webhooks=None,
+    ) -> Any:
+        if not self.active:
+            return previous_value
+        self._trigger_product_variants_event(
+            WebhookEventAsyncType.PRODUCT_VARIANT_DELETED, product_variants, webhooks
+        )
+
+    def _trigger_product_variants_event(
+        self, event_type, product_variants, webhooks, **kwargs
+    ):
+        if webhooks := self._get_webhooks_for_event(event_type, webhooks):
+
+            def generate_product_variant_payload_for_variant(product_variant):
+                return generate_product_variant_payload(
+                    [product_variant], self.requestor
+                )
+
+            self.trigger_webhooks_async_for_multiple_objects(
+                event_type,
+                webhooks,
+                product_variants,
+                self.requestor,
+                legacy_data_generator=generate_product_variant_payload_for_variant,
+                **kwargs,
+            )
+
     def product_variant_metadata_updated(
         self, product_variant: "ProductVariant", previous_value: Any
     ) -> Any:
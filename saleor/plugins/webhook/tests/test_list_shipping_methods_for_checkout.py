@@ -4,6 +4,7 @@ from unittest import mock
 
 from django.utils import timezone
 
+from ....graphql.api import backend
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.payloads import generate_checkout_payload
 from ....webhook.transport.shipping import (
@@ -81,6 +82,7 @@ def test_get_shipping_methods_no_webhook_response_does_not_set_cache(
     assert not mocked_cache_set.called
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
 def test_get_shipping_methods_for_checkout_use_cache(
@@ -109,6 +111,7 @@ def test_get_shipping_methods_for_checkout_use_cache(
     assert mocked_cache_get.called
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
 def test_get_shipping_methods_for_checkout_use_cache_for_empty_list(
@@ -130,6 +133,7 @@ def test_get_shipping_methods_for_checkout_use_cache_for_empty_list(
     assert mocked_cache_get.called
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
@@ -187,6 +191,7 @@ def test_checkout_change_invalidates_cache_key(
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
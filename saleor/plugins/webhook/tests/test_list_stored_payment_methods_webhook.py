@@ -4,6 +4,7 @@ from unittest import mock
 import graphene
 
 from ....core.models import EventDelivery
+from ....graphql.api import backend
 from ....payment.interface import ListStoredPaymentMethodsRequestData
 from ....settings import WEBHOOK_SYNC_TIMEOUT
 from ....webhook.const import WEBHOOK_CACHE_DEFAULT_TIMEOUT
@@ -32,6 +33,7 @@ subscription {
 """
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
@@ -89,6 +91,7 @@ def test_list_stored_payment_methods_with_static_payload(
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
 def test_list_stored_payment_methods_subscription_issuing_principal(
@@ -135,6 +138,7 @@ def test_list_stored_payment_methods_subscription_issuing_principal(
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
 def test_list_stored_payment_methods_subscription_issuing_principal_as_app(
@@ -183,6 +187,7 @@ def test_list_stored_payment_methods_subscription_issuing_principal_as_app(
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
@@ -243,6 +248,7 @@ def test_list_stored_payment_methods_with_subscription_payload(
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
@@ -297,6 +303,7 @@ def test_list_stored_payment_methods_uses_cache_if_available(
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
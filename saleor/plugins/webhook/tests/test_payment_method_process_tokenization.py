@@ -5,6 +5,7 @@ import graphene
 import pytest
 
 from ....core.models import EventDelivery
+from ....graphql.api import backend
 from ....payment.interface import (
     ListStoredPaymentMethodsRequestData,
     PaymentMethodProcessTokenizationRequestData,
@@ -405,6 +406,7 @@ def test_payment_method_process_tokenization_missing_required_id(
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @pytest.mark.parametrize(
     "result",
     [
@@ -8,9 +8,11 @@ from saleor.webhook.const import (
     CACHE_EXCLUDED_SHIPPING_TIME,
 )
 
+from ....graphql.api import backend
 from ...base_plugin import ExcludedShippingMethod
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
@@ -64,6 +66,7 @@ def test_excluded_shipping_methods_for_order_use_cache(
     assert not mocked_cache_set.called
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
@@ -125,6 +128,7 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_empty(
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
@@ -189,6 +193,7 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_payload_is_dif
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
@@ -245,6 +250,7 @@ def test_excluded_shipping_methods_for_checkout_use_cache(
     assert not mocked_cache_set.called
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
@@ -309,6 +315,7 @@ def test_excluded_shipping_methods_for_checkout_stores_in_cache_when_empty(
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
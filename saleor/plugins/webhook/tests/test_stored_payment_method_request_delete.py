@@ -5,6 +5,7 @@ import graphene
 import pytest
 
 from ....core.models import EventDelivery
+from ....graphql.api import backend
 from ....payment.interface import (
     ListStoredPaymentMethodsRequestData,
     StoredPaymentMethodRequestDeleteData,
@@ -350,6 +351,7 @@ def test_stored_payment_method_request_delete_missing_result_in_response_from_we
     )
 
 
+@mock.patch.object(backend, "use_shared_cache", False)
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.delete")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
 @mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
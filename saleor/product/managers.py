@@ -20,6 +20,7 @@ from django.db.models import (
     When,
 )
 from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from ..account.models import User
 from ..app.models import App
@@ -28,6 +29,19 @@ from ..permission.utils import has_one_of_permissions
 
 
 class ProductsQueryset(models.QuerySet):
+    def mark_search_index_dirty(self) -> int:
+        """Mark products for the search vector update.
+
+        Products that are already dirty keep the time they were first marked.
+        """
+        return self.update(
+            search_index_dirty=True,
+            search_index_dirty_at=Coalesce(
+                "search_index_dirty_at",
+                Value(timezone.now(), output_field=DateTimeField()),
+            ),
+        )
+
     def published(self, channel: Channel):
         from .models import ProductChannelListing
 
@@ -320,7 +334,13 @@ class ProductVariantQueryset(models.QuerySet):
 ProductVariantManager = models.Manager.from_queryset(ProductVariantQueryset)
 
 
+# Changes of these fields outdate the price ranges stored on product listings.
+VARIANT_LISTING_PRICE_FIELDS = {"price", "price_amount", "currency"}
+
+
 class ProductVariantChannelListingQuerySet(models.QuerySet):
+    """Invalidate product price ranges on price changes that skip `save`."""
+
     def annotate_preorder_quantity_allocated(self):
         return self.annotate(
             preorder_quantity_allocated=Coalesce(
@@ -328,6 +348,42 @@ class ProductVariantChannelListingQuerySet(models.QuerySet):
             ),
         )
 
+    def bulk_create(self, objs, *args, **kwargs):
+        from .utils.variant_prices import invalidate_price_ranges
+
+        objs = super().bulk_create(objs, *args, **kwargs)
+        if objs:
+            invalidate_price_ranges(self._filter_by_variants_and_channels(objs))
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        from .utils.variant_prices import invalidate_price_ranges
+
+        objs = list(objs)
+        result = super().bulk_update(objs, fields, *args, **kwargs)
+        if objs and VARIANT_LISTING_PRICE_FIELDS.intersection(fields):
+            invalidate_price_ranges(self._filter_by_variants_and_channels(objs))
+        return result
+
+    def update(self, **kwargs):
+        from .utils.variant_prices import invalidate_price_ranges
+
+        if VARIANT_LISTING_PRICE_FIELDS.intersection(kwargs):
+            invalidate_price_ranges(self)
+        return super().update(**kwargs)
+
+    def delete(self):
+        from .utils.variant_prices import invalidate_price_ranges
+
+        invalidate_price_ranges(self)
+        return super().delete()
+
+    def _filter_by_variants_and_channels(self, listings):
+        return self.model.objects.filter(
+            variant_id__in={listing.variant_id for listing in listings},
+            channel_id__in={listing.channel_id for listing in listings},
+        )
+
 
 ProductVariantChannelListingManager = models.Manager.from_queryset(
     ProductVariantChannelListingQuerySet
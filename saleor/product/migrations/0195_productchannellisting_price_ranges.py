@@ -0,0 +1,111 @@
+# Generated by Django 3.2.25 on 2024-07-01 10:00
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def queryset_in_batches(queryset):
+    start_pk = 0
+
+    while True:
+        qs = queryset.order_by("pk").filter(pk__gt=start_pk)[:BATCH_SIZE]
+        pks = list(qs.values_list("pk", flat=True))
+
+        if not pks:
+            break
+
+        yield pks
+
+        start_pk = pks[-1]
+
+
+def set_product_listing_price_ranges(apps, schema_editor):
+    """Store price ranges calculated from the current variant prices.
+
+    Variants without a price are skipped. The ranges are left empty when the skipped
+    variants make the start of the discounted range differ from the product's
+    discounted price; in that case they are calculated from variant listings.
+    """
+    ProductChannelListing = apps.get_model("product", "ProductChannelListing")
+    ProductVariantChannelListing = apps.get_model(
+        "product", "ProductVariantChannelListing"
+    )
+    queryset = ProductChannelListing.objects.filter(
+        price_range_start_amount__isnull=True
+    )
+
+    for batch_pks in queryset_in_batches(queryset):
+        listings = list(ProductChannelListing.objects.filter(pk__in=batch_pks))
+        variant_listings = ProductVariantChannelListing.objects.filter(
+            variant__product_id__in={listing.product_id for listing in listings},
+            price_amount__gt=0,
+        ).values_list(
+            "variant__product_id",
+            "channel_id",
+            "price_amount",
+            "discounted_price_amount",
+        )
+        prices = defaultdict(list)
+        for product_id, channel_id, price, discounted_price in variant_listings:
+            if discounted_price is None:
+                discounted_price = price
+            prices[(product_id, channel_id)].append((price, discounted_price))
+
+        listings_to_update = []
+        for listing in listings:
+            listing_prices = prices[(listing.product_id, listing.channel_id)]
+            if not listing_prices:
+                continue
+            variants_price = [price for price, _ in listing_prices]
+            discounted_prices = [price for _, price in listing_prices]
+            if min(discounted_prices) != listing.discounted_price_amount:
+                continue
+            listing.discounted_price_range_stop_amount = max(discounted_prices)
+            listing.price_range_start_amount = min(variants_price)
+            listing.price_range_stop_amount = max(variants_price)
+            listings_to_update.append(listing)
+
+        ProductChannelListing.objects.bulk_update(
+            listings_to_update,
+            [
+                "discounted_price_range_stop_amount",
+                "price_range_start_amount",
+                "price_range_stop_amount",
+            ],
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0194_auto_20240620_1404"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productchannellisting",
+            name="discounted_price_range_stop_amount",
+            field=models.DecimalField(
+                blank=True, decimal_places=3, max_digits=12, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="productchannellisting",
+            name="price_range_start_amount",
+            field=models.DecimalField(
+                blank=True, decimal_places=3, max_digits=12, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="productchannellisting",
+            name="price_range_stop_amount",
+            field=models.DecimalField(
+                blank=True, decimal_places=3, max_digits=12, null=True
+            ),
+        ),
+        migrations.RunPython(
+            set_product_listing_price_ranges, migrations.RunPython.noop
+        ),
+    ]
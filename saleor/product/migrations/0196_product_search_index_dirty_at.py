@@ -0,0 +1,34 @@
+# Generated by Django 3.2.25 on 2024-07-02 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0195_productchannellisting_price_ranges"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_index_dirty_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        # Products waiting for the search vector update are treated as marked
+        # dirty when the migration runs.
+        migrations.RunSQL(
+            """
+            UPDATE product_product
+            SET search_index_dirty_at = now()
+            WHERE search_index_dirty = true;
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["search_index_dirty", "search_index_dirty_at"],
+                name="product_search_dirty_at_idx",
+            ),
+        ),
+    ]
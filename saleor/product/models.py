@@ -176,6 +176,9 @@ class Product(SeoModel, ModelWithMetadata, ModelWithExternalReference):
     search_document = models.TextField(blank=True, default="")
     search_vector = SearchVectorField(blank=True, null=True)
     search_index_dirty = models.BooleanField(default=False, db_index=True)
+    # Time when the product was marked dirty; the search index lag is measured
+    # from it.
+    search_index_dirty_at = models.DateTimeField(null=True, blank=True)
 
     category = models.ForeignKey(
         Category,
@@ -234,6 +237,10 @@ class Product(SeoModel, ModelWithMetadata, ModelWithExternalReference):
             models.Index(
                 fields=["category_id", "slug"],
             ),
+            models.Index(
+                name="product_search_dirty_at_idx",
+                fields=["search_index_dirty", "search_index_dirty_at"],
+            ),
         ]
         indexes.extend(ModelWithMetadata.Meta.indexes)
 
@@ -318,6 +325,27 @@ class ProductChannelListing(PublishableModel):
         amount_field="discounted_price_amount", currency_field="currency"
     )
     discounted_price_dirty = models.BooleanField(default=False)
+    # Price ranges of variants in the channel, stored together with the discounted
+    # price; `discounted_price_amount` is the start of the discounted range. The
+    # ranges are cleared when prices of variant listings change.
+    discounted_price_range_stop_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        blank=True,
+        null=True,
+    )
+    price_range_start_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        blank=True,
+        null=True,
+    )
+    price_range_stop_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        blank=True,
+        null=True,
+    )
 
     class Meta:
         unique_together = [["product", "channel"]]
@@ -521,6 +549,46 @@ class ProductVariantChannelListing(models.Model):
             GinIndex(fields=["price_amount", "channel_id"]),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_prices = instance._get_prices()
+        return instance
+
+    def _get_prices(self):
+        deferred_fields = self.get_deferred_fields()
+        return {
+            field: getattr(self, field)
+            for field in ["price_amount", "currency"]
+            if field not in deferred_fields
+        }
+
+    def save(self, *args, **kwargs):
+        from .utils.variant_prices import invalidate_price_ranges
+
+        update_fields = kwargs.get("update_fields")
+        prices_saved = update_fields is None or bool(
+            managers.VARIANT_LISTING_PRICE_FIELDS.intersection(update_fields)
+        )
+        # Skip the extra UPDATE of product listings when prices didn't change.
+        price_changed = prices_saved and (
+            self._state.adding
+            or self._get_prices() != getattr(self, "_loaded_prices", None)
+        )
+        super().save(*args, **kwargs)
+        if prices_saved:
+            self._loaded_prices = self._get_prices()
+        if price_changed:
+            invalidate_price_ranges(
+                ProductVariantChannelListing.objects.filter(pk=self.pk)
+            )
+
+    def delete(self, *args, **kwargs):
+        from .utils.variant_prices import invalidate_price_ranges
+
+        invalidate_price_ranges(ProductVariantChannelListing.objects.filter(pk=self.pk))
+        return super().delete(*args, **kwargs)
+
 
 class VariantChannelListingPromotionRule(models.Model):
     variant_channel_listing = models.ForeignKey(
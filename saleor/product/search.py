@@ -1,10 +1,13 @@
 from collections import defaultdict
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Union
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Optional, Union
 
 from django.conf import settings
 from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import F, Q, Value, prefetch_related_objects
+from django.db.models import Count, F, Min, Q, Value, prefetch_related_objects
+from django.utils import timezone
 
 from ..attribute import AttributeInputType
 from ..attribute.models import Attribute
@@ -16,6 +19,8 @@ if TYPE_CHECKING:
     from django.db.models import QuerySet
 
 PRODUCT_SEARCH_FIELDS = ["name", "description_plaintext"]
+# Attribute value fields used in the product search vector.
+ATTRIBUTE_VALUE_SEARCH_FIELDS = ["name", "rich_text", "plain_text", "date_time"]
 PRODUCT_FIELDS_TO_PREFETCH = [
     "variants__attributes__values",
     "variants__attributes__assignment__attribute",
@@ -23,6 +28,8 @@ PRODUCT_FIELDS_TO_PREFETCH = [
     "product_type__attributeproduct__attribute",
 ]
 
+SEARCH_INDEX_DIRTY_FIELDS = ["search_index_dirty", "search_index_dirty_at"]
+
 PRODUCTS_BATCH_SIZE = 100
 # Setting threshold to 100 results in about 766.98MB of memory usage
 # when testing locally with multiple attributes of different types assigned to product
@@ -37,9 +44,41 @@ def _prep_product_search_vector_index(products):
             *prepare_product_search_vector_value(product, already_prefetched=True)
         )
         product.search_index_dirty = False
+        product.search_index_dirty_at = None
 
     Product.objects.bulk_update(
-        products, ["search_vector", "updated_at", "search_index_dirty"]
+        products,
+        ["search_vector", "updated_at", "search_index_dirty", "search_index_dirty_at"],
+    )
+
+
+def mark_product_search_index_dirty(product: Product):
+    """Mark the product for the search vector update without saving it.
+
+    Save the product with `SEARCH_INDEX_DIRTY_FIELDS` to store the change.
+    """
+    product.search_index_dirty = True
+    if product.search_index_dirty_at is None:
+        product.search_index_dirty_at = timezone.now()
+
+
+@dataclass
+class SearchIndexBacklog:
+    # Number of products waiting for the search vector update.
+    size: int
+    # Time since the oldest product in the backlog was marked dirty.
+    lag: Optional[timedelta]
+
+
+def get_products_search_index_backlog() -> SearchIndexBacklog:
+    backlog = (
+        Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(search_index_dirty=True)
+        .aggregate(size=Count("id"), oldest=Min("search_index_dirty_at"))
+    )
+    oldest = backlog["oldest"]
+    return SearchIndexBacklog(
+        size=backlog["size"], lag=timezone.now() - oldest if oldest else None
     )
 
 
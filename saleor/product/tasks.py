@@ -1,4 +1,5 @@
 import logging
+import time
 from collections import defaultdict
 from collections.abc import Iterable
 from typing import Optional
@@ -6,9 +7,10 @@ from uuid import UUID
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.db.models import Exists, F, OuterRef, Q, QuerySet
 from django.utils import timezone
 
 from ..attribute.models import Attribute
@@ -21,7 +23,7 @@ from ..warehouse.management import deactivate_preorder_for_variant
 from ..webhook.event_types import WebhookEventAsyncType
 from ..webhook.utils import get_webhooks_for_event
 from .models import Product, ProductChannelListing, ProductType, ProductVariant
-from .search import update_products_search_vector
+from .search import get_products_search_index_backlog, update_products_search_vector
 from .utils.product import mark_products_in_channels_as_dirty
 from .utils.variant_prices import update_discounted_prices_for_promotion
 from .utils.variants import (
@@ -40,6 +42,8 @@ DISCOUNTED_PRODUCT_BATCH = 2000
 # Results in update time ~2s when 600 channels exist
 PROMOTION_RULE_BATCH_SIZE = 100
 
+UPDATE_SEARCH_VECTOR_LOCK_KEY = "update_products_search_vector_lock"
+
 
 def _variants_in_batches(variants_qs):
     """Slice a variants queryset into batches."""
@@ -288,13 +292,54 @@ def _get_preorder_variants_to_clean():
     expires=settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC,
 )
 def update_products_search_vector_task():
-    products = (
-        Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(search_index_dirty=True)
-        .order_by("updated_at")[:PRODUCTS_BATCH_SIZE]
-        .values_list("id", flat=True)
+    """Update search vectors of the products marked as dirty.
+
+    Batches are processed until there are no dirty products left or
+    `PRODUCT_SEARCH_INDEX_TIME_LIMIT` passes. In the latter case the task
+    schedules itself again, so the backlog doesn't wait for the next beat.
+    """
+    time_limit = settings.PRODUCT_SEARCH_INDEX_TIME_LIMIT
+    # Beat and the rescheduled task may overlap; only one of them does the work.
+    if not cache.add(UPDATE_SEARCH_VECTOR_LOCK_KEY, 1, timeout=time_limit * 2):
+        return
+
+    deadline = time.monotonic() + time_limit
+    # Search vectors are written to the default database, so the processed products
+    # may still be dirty on the replica.
+    processed_ids: list[int] = []
+    time_limit_exceeded = False
+    try:
+        while True:
+            product_ids = list(
+                Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+                .filter(search_index_dirty=True)
+                .exclude(id__in=processed_ids)
+                .order_by(F("search_index_dirty_at").asc(nulls_last=True), "pk")[
+                    :PRODUCTS_BATCH_SIZE
+                ]
+                .values_list("id", flat=True)
+            )
+            if not product_ids:
+                break
+            update_products_search_vector(product_ids)
+            processed_ids.extend(product_ids)
+            if time.monotonic() >= deadline:
+                time_limit_exceeded = True
+                break
+    finally:
+        cache.delete(UPDATE_SEARCH_VECTOR_LOCK_KEY)
+
+    if not time_limit_exceeded:
+        return
+    backlog = get_products_search_index_backlog()
+    task_logger.info(
+        "Updated search vectors of %s products; %s products left, lag: %s.",
+        len(processed_ids),
+        backlog.size,
+        backlog.lag,
     )
-    update_products_search_vector(products)
+    if backlog.size:
+        update_products_search_vector_task.delay()
 
 
 @app.task(queue=settings.COLLECTION_PRODUCT_UPDATED_QUEUE_NAME)
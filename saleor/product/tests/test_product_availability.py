@@ -3,11 +3,15 @@ from decimal import Decimal
 
 from django.utils import timezone
 from freezegun import freeze_time
-from prices import Money, TaxedMoney, TaxedMoneyRange
+from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
 
 from ...tax import TaxCalculationStrategy
 from .. import models
-from ..utils.availability import get_product_availability
+from ..utils.availability import (
+    get_product_availability,
+    get_product_price_ranges,
+    get_product_price_ranges_from_snapshot,
+)
 
 
 def test_availability(stock, monkeypatch, settings, channel_USD):
@@ -437,3 +441,60 @@ def test_filter_not_published_product_without_assigned_channel(
 
     not_available_products_pln = models.Product.objects.not_published(channel_PLN)
     assert not_available_products_pln.count() == 1
+
+
+def test_get_product_price_ranges_from_snapshot(product, channel_USD):
+    # given
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    product_channel_listing.discounted_price_amount = Decimal("8")
+    product_channel_listing.discounted_price_range_stop_amount = Decimal("9")
+    product_channel_listing.price_range_start_amount = Decimal("10")
+    product_channel_listing.price_range_stop_amount = Decimal("12")
+
+    # when
+    price_ranges = get_product_price_ranges_from_snapshot(product_channel_listing)
+
+    # then
+    assert price_ranges.discounted == MoneyRange(Money(8, "USD"), Money(9, "USD"))
+    assert price_ranges.undiscounted == MoneyRange(Money(10, "USD"), Money(12, "USD"))
+
+
+def test_get_product_price_ranges_from_snapshot_not_stored(product, channel_USD):
+    # given
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    product_channel_listing.price_range_start_amount = None
+
+    # when
+    price_ranges = get_product_price_ranges_from_snapshot(product_channel_listing)
+
+    # then
+    assert price_ranges is None
+
+
+def test_availability_from_price_ranges_matches_variant_listings(product, channel_USD):
+    # given
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    variants_channel_listing = list(
+        models.ProductVariantChannelListing.objects.filter(
+            variant__product=product, channel=channel_USD
+        )
+    )
+    tax_kwargs = {
+        "tax_rate": Decimal(23),
+        "tax_calculation_strategy": TaxCalculationStrategy.FLAT_RATES,
+        "prices_entered_with_tax": False,
+    }
+
+    # when
+    availability = get_product_availability(
+        product_channel_listing=product_channel_listing,
+        price_ranges=get_product_price_ranges(variants_channel_listing),
+        **tax_kwargs,
+    )
+
+    # then
+    assert availability == get_product_availability(
+        product_channel_listing=product_channel_listing,
+        variants_channel_listing=variants_channel_listing,
+        **tax_kwargs,
+    )
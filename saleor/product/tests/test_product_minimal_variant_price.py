@@ -7,11 +7,17 @@ import graphene
 import pytest
 import pytz
 from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from prices import Money
 
 from ...discount import RewardValueType
 from ...discount.models import Promotion, PromotionRule
-from ...product.models import Product, VariantChannelListingPromotionRule
+from ...product.models import (
+    Product,
+    ProductVariantChannelListing,
+    VariantChannelListingPromotionRule,
+)
 from ..utils.variant_prices import update_discounted_prices_for_promotion
 
 
@@ -664,3 +670,138 @@ def test_update_discounted_prices_for_promotion_only_dirty_products(
     )
     second_listing.refresh_from_db()
     assert second_listing.discounted_price_amount == second_channel_discounted_price
+
+
+def test_update_discounted_price_for_promotion_stores_price_ranges(
+    product_with_two_variants, channel_USD
+):
+    # given
+    product = product_with_two_variants
+    variant_listings = ProductVariantChannelListing.objects.filter(
+        variant__product=product, channel=channel_USD
+    ).order_by("pk")
+    prices = [Decimal("5"), Decimal("15")]
+    for variant_listing, price in zip(variant_listings, prices):
+        variant_listing.price_amount = price
+        variant_listing.discounted_price_amount = price
+        variant_listing.save()
+
+    # when
+    update_discounted_prices_for_promotion(Product.objects.filter(id=product.id))
+
+    # then
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    assert product_channel_listing.discounted_price_amount == prices[0]
+    assert product_channel_listing.discounted_price_range_stop_amount == prices[1]
+    assert product_channel_listing.price_range_start_amount == prices[0]
+    assert product_channel_listing.price_range_stop_amount == prices[1]
+
+
+def test_variant_price_change_clears_price_ranges(product, channel_USD):
+    # given
+    update_discounted_prices_for_promotion(Product.objects.filter(id=product.id))
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    assert product_channel_listing.price_range_start_amount is not None
+    variant_listing = product.variants.first().channel_listings.get(channel=channel_USD)
+
+    # when
+    variant_listing.price_amount = Decimal("20")
+    variant_listing.save(update_fields=["price_amount"])
+
+    # then
+    product_channel_listing.refresh_from_db()
+    assert product_channel_listing.price_range_start_amount is None
+    assert product_channel_listing.price_range_stop_amount is None
+    assert product_channel_listing.discounted_price_range_stop_amount is None
+
+
+def test_variant_listing_save_without_price_change_keeps_price_ranges(
+    product, channel_USD, django_assert_num_queries
+):
+    # given
+    update_discounted_prices_for_promotion(Product.objects.filter(id=product.id))
+    variant_listing = product.variants.first().channel_listings.get(channel=channel_USD)
+    variant_listing.preorder_quantity_threshold = 10
+
+    # when
+    with django_assert_num_queries(1):
+        variant_listing.save()
+
+    # then
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    assert product_channel_listing.price_range_start_amount is not None
+    assert product_channel_listing.price_range_stop_amount is not None
+
+
+def _count_update_discounted_prices_queries(products):
+    # Queries sent to the replica are captured as well, as in tests the replica
+    # shares the connection with the default database.
+    with CaptureQueriesContext(connection) as ctx:
+        update_discounted_prices_for_promotion(products)
+    return len(ctx)
+
+
+def test_update_discounted_price_for_promotion_number_of_queries(
+    product_list, channel_USD
+):
+    # given
+    promotion = Promotion.objects.create(name="Promotion")
+    rule = promotion.rules.create(
+        name="Percentage promotion rule",
+        catalogue_predicate={
+            "productPredicate": {
+                "ids": [
+                    graphene.Node.to_global_id("Product", product.id)
+                    for product in product_list
+                ]
+            }
+        },
+        reward_value_type=RewardValueType.PERCENTAGE,
+        reward_value=Decimal("10"),
+    )
+    rule.channels.add(channel_USD)
+    for product in product_list:
+        rule.variants.add(*product.variants.all())
+    products = Product.objects.filter(id__in=[product.id for product in product_list])
+
+    # when
+    single_product_queries = _count_update_discounted_prices_queries(
+        products.filter(id=product_list[0].id)
+    )
+    multiple_products_queries = _count_update_discounted_prices_queries(
+        products.exclude(id=product_list[0].id)
+    )
+
+    # then
+    assert single_product_queries == multiple_products_queries
+    assert (
+        VariantChannelListingPromotionRule.objects.filter(promotion_rule=rule).count()
+        == ProductVariantChannelListing.objects.filter(
+            variant__product__in=product_list, channel=channel_USD
+        ).count()
+    )
+
+
+def test_update_discounted_price_for_promotion_skips_ranges_with_zero_price(
+    product_with_two_variants, channel_USD
+):
+    # given
+    product = product_with_two_variants
+    variant_listings = ProductVariantChannelListing.objects.filter(
+        variant__product=product, channel=channel_USD
+    ).order_by("pk")
+    prices = [Decimal("0"), Decimal("15")]
+    for variant_listing, price in zip(variant_listings, prices):
+        variant_listing.price_amount = price
+        variant_listing.discounted_price_amount = price
+        variant_listing.save()
+
+    # when
+    update_discounted_prices_for_promotion(Product.objects.filter(id=product.id))
+
+    # then
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    assert product_channel_listing.discounted_price_amount == prices[0]
+    assert product_channel_listing.discounted_price_range_stop_amount is None
+    assert product_channel_listing.price_range_start_amount is None
+    assert product_channel_listing.price_range_stop_amount is None
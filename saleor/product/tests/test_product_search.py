@@ -1,5 +1,10 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from freezegun import freeze_time
+
 from ..models import Product
-from ..search import update_products_search_vector
+from ..search import get_products_search_index_backlog, update_products_search_vector
 
 
 def test_update_products_search_vector(product_list):
@@ -15,3 +20,64 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+
+
+def test_get_products_search_index_backlog(product_list):
+    # given
+    Product.objects.update(search_index_dirty=False, search_index_dirty_at=None)
+    dirty_product = product_list[0]
+    marked_at = timezone.now()
+    with freeze_time(marked_at):
+        Product.objects.filter(id=dirty_product.id).mark_search_index_dirty()
+
+    # when
+    with freeze_time(marked_at + timedelta(minutes=5)):
+        backlog = get_products_search_index_backlog()
+
+    # then
+    assert backlog.size == 1
+    assert backlog.lag == timedelta(minutes=5)
+
+
+def test_mark_search_index_dirty_keeps_first_mark_time(product):
+    # given
+    Product.objects.filter(id=product.id).update(
+        search_index_dirty=False, search_index_dirty_at=None
+    )
+    marked_at = timezone.now()
+    with freeze_time(marked_at):
+        Product.objects.filter(id=product.id).mark_search_index_dirty()
+
+    # when
+    with freeze_time(marked_at + timedelta(minutes=5)):
+        Product.objects.filter(id=product.id).mark_search_index_dirty()
+
+    # then
+    product.refresh_from_db()
+    assert product.search_index_dirty is True
+    assert product.search_index_dirty_at == marked_at
+
+
+def test_update_products_search_vector_clears_dirty_mark(product):
+    # given
+    Product.objects.filter(id=product.id).mark_search_index_dirty()
+
+    # when
+    update_products_search_vector([product.id])
+
+    # then
+    product.refresh_from_db()
+    assert product.search_index_dirty is False
+    assert product.search_index_dirty_at is None
+
+
+def test_get_products_search_index_backlog_empty(product_list):
+    # given
+    Product.objects.update(search_index_dirty=False)
+
+    # when
+    backlog = get_products_search_index_backlog()
+
+    # then
+    assert backlog.size == 0
+    assert backlog.lag is None
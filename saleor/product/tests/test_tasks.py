@@ -4,6 +4,7 @@ from decimal import Decimal
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from faker import Faker
 
@@ -11,6 +12,7 @@ from ...discount import PromotionType, RewardValueType
 from ...discount.models import Promotion, PromotionRule
 from ..models import Product, ProductChannelListing, ProductVariantChannelListing
 from ..tasks import (
+    UPDATE_SEARCH_VECTOR_LOCK_KEY,
     _get_preorder_variants_to_clean,
     recalculate_discounted_price_for_products_task,
     update_products_search_vector_task,
@@ -310,10 +312,86 @@ def test_update_products_search_vector_task_with_static_number_of_queries(
         product_list[i].save(update_fields=["search_index_dirty"])
 
     # when & # then
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(16):
         update_products_search_vector_task()
 
 
+@patch("saleor.product.tasks.PRODUCTS_BATCH_SIZE", 1)
+@patch("saleor.product.tasks.update_products_search_vector_task.delay")
+def test_update_products_search_vector_task_processes_all_batches(
+    update_task_delay_mock, product_list
+):
+    # given
+    Product.objects.update(search_index_dirty=True)
+
+    # when
+    update_products_search_vector_task()
+
+    # then
+    assert not Product.objects.filter(search_index_dirty=True).exists()
+    update_task_delay_mock.assert_not_called()
+
+
+@patch("saleor.product.tasks.PRODUCTS_BATCH_SIZE", 1)
+@patch("saleor.product.tasks.update_products_search_vector_task.delay")
+def test_update_products_search_vector_task_time_limit_exceeded(
+    update_task_delay_mock, product_list, settings
+):
+    # given
+    settings.PRODUCT_SEARCH_INDEX_TIME_LIMIT = 0
+    Product.objects.update(search_index_dirty=True)
+
+    # when
+    update_products_search_vector_task()
+
+    # then
+    assert Product.objects.filter(search_index_dirty=True).count() == (
+        len(product_list) - 1
+    )
+    update_task_delay_mock.assert_called_once_with()
+
+
+@patch("saleor.product.tasks.PRODUCTS_BATCH_SIZE", 1)
+@patch("saleor.product.tasks.update_products_search_vector_task.delay")
+def test_update_products_search_vector_task_processes_oldest_dirty_first(
+    update_task_delay_mock, product_list, settings
+):
+    # given
+    settings.PRODUCT_SEARCH_INDEX_TIME_LIMIT = 0
+    now = timezone.now()
+    oldest_product = product_list[-1]
+    Product.objects.update(search_index_dirty=True, search_index_dirty_at=now)
+    Product.objects.filter(pk=product_list[0].pk).update(search_index_dirty_at=None)
+    Product.objects.filter(pk=oldest_product.pk).update(
+        search_index_dirty_at=now - timedelta(hours=1)
+    )
+
+    # when
+    update_products_search_vector_task()
+
+    # then
+    oldest_product.refresh_from_db(fields=["search_index_dirty"])
+    assert oldest_product.search_index_dirty is False
+    assert Product.objects.filter(search_index_dirty=True).count() == (
+        len(product_list) - 1
+    )
+
+
+def test_update_products_search_vector_task_already_running(product):
+    # given
+    product.search_index_dirty = True
+    product.save(update_fields=["search_index_dirty"])
+    cache.add(UPDATE_SEARCH_VECTOR_LOCK_KEY, 1)
+
+    # when
+    update_products_search_vector_task()
+
+    # then
+    cache.delete(UPDATE_SEARCH_VECTOR_LOCK_KEY)
+    product.refresh_from_db(fields=["search_index_dirty"])
+    assert product.search_index_dirty is True
+
+
 @pytest.mark.slow
 @pytest.mark.limit_memory("50 MB")
 def test_mem_usage_recalculate_discounted_price_for_products_task(
@@ -17,6 +17,12 @@ class ProductAvailability:
     discount: Optional[TaxedMoney]
 
 
+@dataclass
+class ProductPriceRanges:
+    discounted: Optional[MoneyRange]
+    undiscounted: Optional[MoneyRange]
+
+
 @dataclass
 class VariantAvailability:
     on_sale: bool
@@ -73,6 +79,50 @@ def get_product_price_range(
     return None
 
 
+def get_product_price_ranges(
+    variants_channel_listing: list[ProductVariantChannelListing],
+) -> ProductPriceRanges:
+    return ProductPriceRanges(
+        discounted=get_product_price_range(
+            variants_channel_listing=variants_channel_listing, discounted=True
+        ),
+        undiscounted=get_product_price_range(
+            variants_channel_listing=variants_channel_listing, discounted=False
+        ),
+    )
+
+
+def get_product_price_ranges_from_snapshot(
+    product_channel_listing: Optional[ProductChannelListing],
+) -> Optional[ProductPriceRanges]:
+    """Return the price ranges stored on the product channel listing.
+
+    The ranges are stored by the discounted price recalculation and cleared when
+    variant prices change. None is returned when the ranges are not stored; in that
+    case, they should be calculated from variant listings.
+    """
+    listing = product_channel_listing
+    if (
+        listing is None
+        or listing.discounted_price_amount is None
+        or listing.discounted_price_range_stop_amount is None
+        or listing.price_range_start_amount is None
+        or listing.price_range_stop_amount is None
+    ):
+        return None
+    currency = listing.currency
+    return ProductPriceRanges(
+        discounted=MoneyRange(
+            Money(listing.discounted_price_amount, currency),
+            Money(listing.discounted_price_range_stop_amount, currency),
+        ),
+        undiscounted=MoneyRange(
+            Money(listing.price_range_start_amount, currency),
+            Money(listing.price_range_stop_amount, currency),
+        ),
+    )
+
+
 def _calculate_product_price_with_taxes(
     price: Money,
     tax_rate: Decimal,
@@ -90,15 +140,22 @@ def _calculate_product_price_with_taxes(
 def get_product_availability(
     *,
     product_channel_listing: Optional[ProductChannelListing],
-    variants_channel_listing: list[ProductVariantChannelListing],
+    variants_channel_listing: Optional[list[ProductVariantChannelListing]] = None,
+    price_ranges: Optional[ProductPriceRanges] = None,
     prices_entered_with_tax: bool,
     tax_calculation_strategy: str,
     tax_rate: Decimal,
 ) -> ProductAvailability:
+    """Return the availability of the product in the channel.
+
+    Net price ranges are taken from `price_ranges` when provided, otherwise they
+    are calculated from `variants_channel_listing`.
+    """
+    if price_ranges is None:
+        price_ranges = get_product_price_ranges(variants_channel_listing or [])
+
     discounted: Optional[TaxedMoneyRange] = None
-    discounted_net_range = get_product_price_range(
-        variants_channel_listing=variants_channel_listing, discounted=True
-    )
+    discounted_net_range = price_ranges.discounted
     if discounted_net_range is not None:
         discounted = TaxedMoneyRange(
             start=_calculate_product_price_with_taxes(
@@ -116,10 +173,7 @@ def get_product_availability(
         )
 
     undiscounted: Optional[TaxedMoneyRange] = None
-    undiscounted_net_range = get_product_price_range(
-        variants_channel_listing=variants_channel_listing,
-        discounted=False,
-    )
+    undiscounted_net_range = price_ranges.undiscounted
     if undiscounted_net_range is not None:
         undiscounted = TaxedMoneyRange(
             start=_calculate_product_price_with_taxes(
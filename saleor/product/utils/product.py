@@ -4,6 +4,7 @@ from django.conf import settings
 from django.db import transaction
 from django.db.models import Exists, OuterRef, QuerySet
 
+from ...checkout.line_snapshot_cache import invalidate_catalogue_line_snapshots
 from ...discount.models import PromotionRule
 from ...product.models import ProductChannelListing
 from ..models import ProductVariant
@@ -99,6 +100,9 @@ def mark_products_in_channels_as_dirty(
 
     if not channel_to_product_ids:
         return
+    # Listings of the products have changed, possibly with bulk updates that don't
+    # send signals.
+    invalidate_catalogue_line_snapshots()
     channels = list(channel_to_product_ids.keys())
     product_ids = {
         product_id
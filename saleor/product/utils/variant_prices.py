@@ -1,18 +1,20 @@
 from collections import defaultdict
 from decimal import Decimal
+from typing import Callable, Optional
 from uuid import UUID
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Exists, OuterRef
-from prices import Money
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from prices import Money, MoneyRange
 
 from ...channel.models import Channel
+from ...checkout.line_snapshot_cache import invalidate_promotion_line_snapshots
 from ...core.taxes import zero_money
 from ...discount import PromotionRuleInfo
 from ...discount.models import PromotionRule
 from ...discount.utils import (
-    calculate_discounted_price_for_promotions,
+    get_product_promotion_discounts,
     get_variants_to_promotion_rules_map,
 )
 from ..managers import ProductsQueryset, ProductVariantQueryset
@@ -23,6 +25,32 @@ from ..models import (
     VariantChannelListingPromotionRule,
 )
 
+PRICE_RANGE_FIELDS = [
+    "discounted_price_range_stop_amount",
+    "price_range_start_amount",
+    "price_range_stop_amount",
+]
+
+
+def invalidate_price_ranges(variant_listings: QuerySet[ProductVariantChannelListing]):
+    """Clear price ranges stored on product listings after variant prices changed.
+
+    Takes the queryset of changed variant channel listings, which is used as
+    a subquery, so it has to be called before the listings are deleted or
+    the fields it filters by are updated.
+    Until the ranges are recalculated with the discounted prices, they are
+    calculated from variant listings when needed.
+    """
+    ProductChannelListing.objects.filter(
+        Exists(
+            variant_listings.filter(
+                variant__product_id=OuterRef("product_id"),
+                channel_id=OuterRef("channel_id"),
+            )
+        ),
+        price_range_start_amount__isnull=False,
+    ).update(**{field: None for field in PRICE_RANGE_FIELDS})
+
 
 def update_discounted_prices_for_promotion(
     products: ProductsQueryset, only_dirty_products: bool = False
@@ -54,12 +82,22 @@ def update_discounted_prices_for_promotion(
 
     changed_variant_listing_promotion_rule_to_create = []
     changed_variant_listing_promotion_rule_to_update = []
+    outdated_variant_listing_promotion_rules: list[tuple[int, Optional[UUID]]] = []
 
     product_channel_listings = ProductChannelListing.objects.using(
         settings.DATABASE_CONNECTION_REPLICA_NAME
     ).filter(Exists(products.filter(id=OuterRef("product_id"))))
     if only_dirty_products:
-        product_channel_listings.filter(discounted_price_dirty=True)
+        product_channel_listings = product_channel_listings.filter(
+            discounted_price_dirty=True
+        )
+    product_channel_listings = list(product_channel_listings)
+    channels = Channel.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME).in_bulk(
+        {listing.channel_id for listing in product_channel_listings}
+    )
+    # Applicable discounts are shared by variants with the same rules, so they are
+    # resolved once per set of rules and channel.
+    discounts_cache: dict[tuple, list[tuple[UUID, Callable]]] = {}
 
     for product_channel_listing in product_channel_listings:
         product_id = product_channel_listing.product_id
@@ -68,17 +106,21 @@ def update_discounted_prices_for_promotion(
             channel_id
         ]
         if not variant_listings:
+            if _set_price_ranges(product_channel_listing, None, None):
+                changed_products_listings_to_update.append(product_channel_listing)
             continue
         (
             discounted_variants_price,
             variant_listings_to_update,
             variant_listing_promotion_rule_to_create,
             variant_listing_promotion_rule_to_update,
+            outdated_listing_promotion_rules,
         ) = _get_discounted_variants_prices_for_promotions(
             variant_listings,
             rules_info_per_variant,
-            product_channel_listing.channel,
+            channels[channel_id],
             variant_listing_to_listing_rule_per_rule_map,
+            discounts_cache,
         )
 
         product_discounted_price = min(discounted_variants_price)
@@ -89,14 +131,25 @@ def update_discounted_prices_for_promotion(
         changed_variant_listing_promotion_rule_to_update.extend(
             variant_listing_promotion_rule_to_update
         )
+        outdated_variant_listing_promotion_rules.extend(
+            outdated_listing_promotion_rules
+        )
 
-        # check if the product discounted_price has changed
-        if product_channel_listing.discounted_price != product_discounted_price:
-            product_channel_listing.discounted_price_amount = (
-                product_discounted_price.amount
-            )
+        discounted_range, undiscounted_range = _get_price_ranges(
+            variant_listings, discounted_variants_price, product_discounted_price
+        )
+        # check if the product discounted_price or price ranges have changed
+        if _set_price_ranges(
+            product_channel_listing,
+            discounted_range,
+            undiscounted_range,
+            discounted_price=product_discounted_price,
+        ):
             changed_products_listings_to_update.append(product_channel_listing)
 
+    _delete_outdated_variant_listing_promotion_rules(
+        outdated_variant_listing_promotion_rules
+    )
     _update_or_create_listings(
         changed_products_listings_to_update,
         changed_variants_listings_to_update,
@@ -105,6 +158,67 @@ def update_discounted_prices_for_promotion(
     )
 
 
+def _get_price_ranges(
+    variant_listings: list[ProductVariantChannelListing],
+    discounted_variants_price: list[Money],
+    product_discounted_price: Money,
+) -> tuple[Optional[MoneyRange], Optional[MoneyRange]]:
+    """Return the discounted and undiscounted price ranges of variant listings.
+
+    Variants without a price are skipped, the same as in `get_product_price_range`.
+    The stored discounted range starts at the product's discounted price, so the
+    ranges are not returned when skipped variants make them differ.
+    """
+    prices = [
+        (variant_listing.price, discounted_price)
+        for variant_listing, discounted_price in zip(
+            variant_listings, discounted_variants_price
+        )
+        if variant_listing.price
+    ]
+    if not prices:
+        return None, None
+    variants_price = [price for price, _ in prices]
+    discounted_prices = [discounted_price for _, discounted_price in prices]
+    if min(discounted_prices) != product_discounted_price:
+        return None, None
+    return (
+        MoneyRange(min(discounted_prices), max(discounted_prices)),
+        MoneyRange(min(variants_price), max(variants_price)),
+    )
+
+
+def _set_price_ranges(
+    product_channel_listing: ProductChannelListing,
+    discounted_range: Optional[MoneyRange],
+    undiscounted_range: Optional[MoneyRange],
+    discounted_price: Optional[Money] = None,
+) -> bool:
+    """Store the price ranges on the listing; return True if any of them changed.
+
+    The discounted price is stored when given; otherwise it is kept as it is.
+    """
+    amounts = {
+        "discounted_price_range_stop_amount": (
+            discounted_range.stop.amount if discounted_range else None
+        ),
+        "price_range_start_amount": (
+            undiscounted_range.start.amount if undiscounted_range else None
+        ),
+        "price_range_stop_amount": (
+            undiscounted_range.stop.amount if undiscounted_range else None
+        ),
+    }
+    if discounted_price is not None:
+        amounts["discounted_price_amount"] = discounted_price.amount
+    changed = False
+    for field, amount in amounts.items():
+        if getattr(product_channel_listing, field) != amount:
+            setattr(product_channel_listing, field, amount)
+            changed = True
+    return changed
+
+
 def _update_or_create_listings(
     changed_products_listings_to_update: list[ProductChannelListing],
     changed_variants_listings_to_update: list[ProductVariantChannelListing],
@@ -118,7 +232,7 @@ def _update_or_create_listings(
     if changed_products_listings_to_update:
         ProductChannelListing.objects.bulk_update(
             sorted(changed_products_listings_to_update, key=lambda listing: listing.id),
-            ["discounted_price_amount"],
+            ["discounted_price_amount", *PRICE_RANGE_FIELDS],
         )
     if changed_variants_listings_to_update:
         ProductVariantChannelListing.objects.bulk_update(
@@ -137,6 +251,15 @@ def _update_or_create_listings(
             ),
             ["discount_amount"],
         )
+    if any(
+        [
+            changed_products_listings_to_update,
+            changed_variants_listings_to_update,
+            changed_variant_listing_promotion_rule_to_create,
+            changed_variant_listing_promotion_rule_to_update,
+        ]
+    ):
+        invalidate_promotion_line_snapshots()
 
 
 def _create_variant_listing_promotion_rule(variant_listing_promotion_rule_to_create):
@@ -236,11 +359,13 @@ def _get_discounted_variants_prices_for_promotions(
     rules_info_per_variant: dict[int, list[PromotionRuleInfo]],
     channel: Channel,
     variant_listing_to_listing_rule_per_rule_map: dict,
+    discounts_cache: dict[tuple, list[tuple[UUID, Callable]]],
 ) -> tuple[
-    Money,
+    list[Money],
     list[ProductVariantChannelListing],
     list[VariantChannelListingPromotionRule],
     list[VariantChannelListingPromotionRule],
+    list[tuple[int, Optional[UUID]]],
 ]:
     variants_listings_to_update: list[ProductVariantChannelListing] = []
     discounted_variants_price: list[Money] = []
@@ -250,12 +375,13 @@ def _get_discounted_variants_prices_for_promotions(
     variant_listing_promotion_rule_to_update: list[
         VariantChannelListingPromotionRule
     ] = []
+    outdated_listing_promotion_rules: list[tuple[int, Optional[UUID]]] = []
     for variant_listing in variant_listings:
-        applied_discount = calculate_discounted_price_for_promotions(
-            price=variant_listing.price,
-            rules_info_per_variant=rules_info_per_variant,
-            channel=channel,
-            variant_id=variant_listing.variant_id,
+        applied_discount = _get_best_discount(
+            variant_listing.price,
+            rules_info_per_variant.get(variant_listing.variant_id, []),
+            channel,
+            discounts_cache,
         )
         discounted_variant_price = variant_listing.price
 
@@ -281,11 +407,9 @@ def _get_discounted_variants_prices_for_promotions(
             variant_listing.discounted_price_amount = discounted_variant_price.amount
             variants_listings_to_update.append(variant_listing)
 
-            # delete variant listing - promotion rules relations that are not valid
-            # anymore
-            VariantChannelListingPromotionRule.objects.filter(
-                variant_channel_listing_id=variant_listing.id
-            ).exclude(promotion_rule_id=rule_id).delete()
+            # variant listing - promotion rules relations that are not valid
+            # anymore are deleted in bulk
+            outdated_listing_promotion_rules.append((variant_listing.id, rule_id))
 
         discounted_variants_price.append(discounted_variant_price)
 
@@ -294,9 +418,62 @@ def _get_discounted_variants_prices_for_promotions(
         variants_listings_to_update,
         variant_listing_promotion_rule_to_create,
         variant_listing_promotion_rule_to_update,
+        outdated_listing_promotion_rules,
     )
 
 
+def _get_best_discount(
+    price: Money,
+    rules_info: list[PromotionRuleInfo],
+    channel: Channel,
+    discounts_cache: dict[tuple, list[tuple[UUID, Callable]]],
+) -> Optional[tuple[UUID, Money]]:
+    """Return the rule ID and the amount of the best discount for the price.
+
+    It's equivalent to `calculate_discounted_price_for_promotions`, but the
+    discounts applicable in the channel are resolved once per set of rules.
+    """
+    if not rules_info:
+        return None
+    key = (channel.id, *(rule_info.rule.id for rule_info in rules_info))
+    discounts = discounts_cache.get(key)
+    if discounts is None:
+        discounts = list(
+            get_product_promotion_discounts(rules_info=rules_info, channel=channel)
+        )
+        discounts_cache[key] = discounts
+    if not discounts:
+        return None
+    return max(
+        [(rule_id, price - discount(price)) for rule_id, discount in discounts],
+        key=lambda x: x[1].amount,
+    )
+
+
+def _delete_outdated_variant_listing_promotion_rules(
+    listing_promotion_rules: list[tuple[int, Optional[UUID]]],
+):
+    """Delete relations of variant listings to rules that are no longer applied.
+
+    Takes pairs of variant listing ID and the ID of the rule that is currently
+    applied to it, if any.
+    """
+    if not listing_promotion_rules:
+        return
+    listing_ids_per_rule_id: dict[Optional[UUID], list[int]] = defaultdict(list)
+    for listing_id, rule_id in listing_promotion_rules:
+        listing_ids_per_rule_id[rule_id].append(listing_id)
+    lookup = Q()
+    for rule_id, listing_ids in listing_ids_per_rule_id.items():
+        condition = Q(variant_channel_listing_id__in=listing_ids)
+        if rule_id:
+            condition &= ~Q(promotion_rule_id=rule_id)
+        lookup |= condition
+    deleted, _ = VariantChannelListingPromotionRule.objects.filter(lookup).delete()
+    if deleted:
+        invalidate_promotion_line_snapshots()
+
+
 def _handle_discount_rule_id(
     variant_listing: ProductVariantChannelListing,
     rule_id: UUID,
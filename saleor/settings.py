@@ -448,6 +448,11 @@ COUNTRIES_OVERRIDE = {"EU": "European Union"}
 
 MAX_USER_ADDRESSES = int(os.environ.get("MAX_USER_ADDRESSES", 100))
 
+# Search users by the trigram similarity of the search document and return only
+# the `USER_SEARCH_MAX_RESULTS` best matches, instead of all matching users.
+USER_SEARCH_RANKED = get_bool_from_env("USER_SEARCH_RANKED", False)
+USER_SEARCH_MAX_RESULTS = int(os.environ.get("USER_SEARCH_MAX_RESULTS", 1000))
+
 TEST_RUNNER = "saleor.tests.runner.PytestTestRunner"
 
 
@@ -542,6 +547,25 @@ EMPTY_CHECKOUTS_TIMEDELTA = timedelta(
     seconds=parse(os.environ.get("EMPTY_CHECKOUTS_TIMEDELTA", "6 hours"))
 )
 
+# Resolve shipping methods of checkouts with in-memory tables of shipping rates
+# instead of database queries. Tables are rebuilt on changes of shipping zones and
+# methods, and at the latest after SHIPPING_RATE_TABLE_TIMEOUT.
+SHIPPING_RATE_TABLE_ENABLED = get_bool_from_env("SHIPPING_RATE_TABLE_ENABLED", False)
+SHIPPING_RATE_TABLE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("SHIPPING_RATE_TABLE_TIMEOUT", "5 minutes"))
+)
+
+# Take the catalogue data of checkout lines (products, channel listings, tax classes
+# and promotion rules) from snapshots kept in the cache. Snapshots are invalidated on
+# changes of the catalogue and promotions, and expire after
+# CHECKOUT_LINE_SNAPSHOT_CACHE_TIMEOUT.
+CHECKOUT_LINE_SNAPSHOT_CACHE_ENABLED = get_bool_from_env(
+    "CHECKOUT_LINE_SNAPSHOT_CACHE_ENABLED", False
+)
+CHECKOUT_LINE_SNAPSHOT_CACHE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("CHECKOUT_LINE_SNAPSHOT_CACHE_TIMEOUT", "5 minutes"))
+)
+
 # Exports settings - defines after what time exported files will be deleted
 EXPORT_FILES_TIMEDELTA = timedelta(
     seconds=parse(os.environ.get("EXPORT_FILES_TIMEDELTA", "30 days"))
@@ -570,6 +594,12 @@ BEAT_UPDATE_SEARCH_SEC = parse(
 )
 BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC = BEAT_UPDATE_SEARCH_SEC
 
+# Defines for how many seconds a single run of the products search vector update
+# task processes the backlog before it schedules itself again.
+PRODUCT_SEARCH_INDEX_TIME_LIMIT = parse(
+    os.environ.get("PRODUCT_SEARCH_INDEX_TIME_LIMIT", "15 seconds")
+)
+
 BEAT_PRICE_RECALCULATION_SCHEDULE = parse(
     os.environ.get("BEAT_PRICE_RECALCULATION_SCHEDULE", "30 seconds")
 )
@@ -751,6 +781,70 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Parsed and validated GraphQL documents are cached in an in-process LRU limited to
+# GRAPHQL_DOCUMENT_CACHE_MAX_BYTES, backed by the shared cache so workers can reuse
+# documents already validated by other workers.
+GRAPHQL_DOCUMENT_CACHE_MAX_BYTES = int(
+    os.environ.get("GRAPHQL_DOCUMENT_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+)
+GRAPHQL_DOCUMENT_SHARED_CACHE_ENABLED = get_bool_from_env(
+    "GRAPHQL_DOCUMENT_SHARED_CACHE_ENABLED", True
+)
+GRAPHQL_DOCUMENT_CACHE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("GRAPHQL_DOCUMENT_CACHE_TIMEOUT", "1 day"))
+)
+
+# Automatic Persisted Queries: clients can send a sha256 hash of a query instead of
+# the whole document, also in GET requests.
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", False
+)
+# Path to a JSON manifest of allowed persisted queries. When set, only the queries
+# from the manifest are accepted and registering new ones is not possible.
+GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST = os.environ.get(
+    "GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST"
+)
+if GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST and not GRAPHQL_PERSISTED_QUERIES_ENABLED:
+    raise ImproperlyConfigured(
+        "GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST requires "
+        "GRAPHQL_PERSISTED_QUERIES_ENABLED to be set."
+    )
+
+# Cache of full responses to anonymous storefront queries for products, collections
+# and categories. Responses are fresh for GRAPHQL_RESPONSE_CACHE_TIMEOUT seconds and
+# can be served stale for GRAPHQL_RESPONSE_CACHE_STALE_TIMEOUT seconds more while
+# they are refreshed.
+GRAPHQL_RESPONSE_CACHE_ENABLED = get_bool_from_env(
+    "GRAPHQL_RESPONSE_CACHE_ENABLED", False
+)
+GRAPHQL_RESPONSE_CACHE_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_TIMEOUT", "1 minute")
+)
+GRAPHQL_RESPONSE_CACHE_STALE_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_STALE_TIMEOUT", "5 minutes")
+)
+
+# Strategies of computing `totalCount` of connections, set per connection type, e.g.
+# "OrderCountableConnection=estimated,ProductCountableConnection=cached".
+# Connections that are not listed use exact counts.
+GRAPHQL_TOTAL_COUNT_STRATEGIES: dict[str, str] = {}
+for item in get_list(os.environ.get("GRAPHQL_TOTAL_COUNT_STRATEGIES", "")):
+    if not item:
+        continue
+    if "=" not in item:
+        warnings.warn(f"Invalid total count strategy {item!r} is ignored.")
+        continue
+    connection_name, strategy = item.split("=", 1)
+    GRAPHQL_TOTAL_COUNT_STRATEGIES[connection_name] = strategy
+# The `estimated` strategy returns the query planner's estimate only when it's
+# above the threshold.
+GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD", 100000)
+)
+GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT", "30 seconds")
+)
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -836,6 +930,26 @@ if REDIS_URL:
 CACHES = {"default": django_cache_url.config()}
 CACHES["default"]["TIMEOUT"] = parse(os.environ.get("CACHE_TIMEOUT", "7 days"))
 
+# Time for which verified app tokens are cached, so the expensive password hash
+# check is not run on every request made by an app.
+APP_TOKEN_CACHE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("APP_TOKEN_CACHE_TIMEOUT", "5 minutes"))
+)
+
+# Time for which plugin configurations are cached. Cached configurations are
+# invalidated when a plugin configuration is saved or deleted.
+PLUGIN_CONFIGURATION_CACHE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("PLUGIN_CONFIGURATION_CACHE_TIMEOUT", "1 hour"))
+)
+
+# Keep users authenticated with access tokens, with their effective permissions and
+# accessible channels, in the cache for JWT_USER_CACHE_TIMEOUT. Cached users are
+# invalidated when the user, groups, permissions or channels are changed.
+JWT_USER_CACHE_ENABLED = get_bool_from_env("JWT_USER_CACHE_ENABLED", False)
+JWT_USER_CACHE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("JWT_USER_CACHE_TIMEOUT", "1 minute"))
+)
+
 JWT_EXPIRE = True
 JWT_TTL_ACCESS = timedelta(seconds=parse(os.environ.get("JWT_TTL_ACCESS", "5 minutes")))
 JWT_TTL_APP_ACCESS = timedelta(
@@ -931,6 +1045,44 @@ COMMON_REQUESTS_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 
+# Send async webhooks in batches of event deliveries, instead of a Celery task per
+# delivery. Deliveries of a batch are sent concurrently over keep-alive connections,
+# with at most WEBHOOK_BATCH_MAX_CONCURRENCY_PER_TARGET requests to the same URL.
+WEBHOOK_BATCH_DELIVERY_ENABLED = get_bool_from_env(
+    "WEBHOOK_BATCH_DELIVERY_ENABLED", False
+)
+WEBHOOK_BATCH_SIZE = int(os.environ.get("WEBHOOK_BATCH_SIZE", 100))
+WEBHOOK_BATCH_MAX_WORKERS = int(os.environ.get("WEBHOOK_BATCH_MAX_WORKERS", 16))
+WEBHOOK_BATCH_MAX_CONCURRENCY_PER_TARGET = int(
+    os.environ.get("WEBHOOK_BATCH_MAX_CONCURRENCY_PER_TARGET", 4)
+)
+
+# Stop sending async webhooks to a host after WEBHOOK_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+# consecutive failures. Deliveries to the host are parked for the cooldown, which
+# doubles each time the probe request fails, up to the max cooldown. A delivery is
+# failed after being parked WEBHOOK_CIRCUIT_BREAKER_MAX_PARKED times.
+WEBHOOK_CIRCUIT_BREAKER_ENABLED = get_bool_from_env(
+    "WEBHOOK_CIRCUIT_BREAKER_ENABLED", False
+)
+WEBHOOK_CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(
+    os.environ.get("WEBHOOK_CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5)
+)
+WEBHOOK_CIRCUIT_BREAKER_COOLDOWN = parse(
+    os.environ.get("WEBHOOK_CIRCUIT_BREAKER_COOLDOWN", "30 seconds")
+)
+WEBHOOK_CIRCUIT_BREAKER_MAX_COOLDOWN = parse(
+    os.environ.get("WEBHOOK_CIRCUIT_BREAKER_MAX_COOLDOWN", "10 minutes")
+)
+WEBHOOK_CIRCUIT_BREAKER_MAX_PARKED = int(
+    os.environ.get("WEBHOOK_CIRCUIT_BREAKER_MAX_PARKED", 20)
+)
+
+# Timeout of the cached warehouse ordering of channels, used to sort stocks when
+# allocating with the PRIORITIZE_SORTING_ORDER strategy.
+CHANNEL_WAREHOUSE_RANKS_CACHE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("CHANNEL_WAREHOUSE_RANKS_CACHE_TIMEOUT", "1 hour"))
+)
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
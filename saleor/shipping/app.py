@@ -0,0 +1,48 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class ShippingAppConfig(AppConfig):
+    name = "saleor.shipping"
+
+    def ready(self):
+        from .models import (
+            ShippingMethod,
+            ShippingMethodChannelListing,
+            ShippingMethodPostalCodeRule,
+            ShippingZone,
+        )
+        from .signals import (
+            invalidate_shipping_rate_tables_on_change,
+            invalidate_shipping_rate_tables_on_relation_change,
+        )
+
+        for model in (
+            ShippingZone,
+            ShippingMethod,
+            ShippingMethodChannelListing,
+            ShippingMethodPostalCodeRule,
+        ):
+            post_save.connect(
+                invalidate_shipping_rate_tables_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_shipping_rate_tables_on_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_shipping_rate_tables_on_change,
+                sender=model,
+                dispatch_uid=(
+                    f"invalidate_shipping_rate_tables_on_{model.__name__}_delete"
+                ),
+            )
+        for through in (
+            ShippingZone.channels.through,
+            ShippingMethod.excluded_products.through,
+        ):
+            m2m_changed.connect(
+                invalidate_shipping_rate_tables_on_relation_change,
+                sender=through,
+                dispatch_uid=(
+                    f"invalidate_shipping_rate_tables_on_{through.__name__}_change"
+                ),
+            )
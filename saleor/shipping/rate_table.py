@@ -0,0 +1,167 @@
+"""In-memory table of shipping rates used to resolve checkout shipping methods.
+
+Finding the shipping methods applicable to a checkout joins shipping zones,
+channel listings, excluded products and postal code rules. The table keeps all of
+it per channel, indexed by the countries of the shipping zones, so applicable
+methods are evaluated without queries.
+
+Tables are versioned with a global counter stored in the shared cache. The counter
+is bumped when any of the shipping models changes. Bulk updates don't send signals,
+so tables are also rebuilt after `SHIPPING_RATE_TABLE_TIMEOUT`.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING, Optional
+
+from django.conf import settings
+from measurement.measures import Weight
+from prices import Money
+
+from ..core.db.connection import allow_writer
+from ..core.utils.cache import bump_cache_version_on_commit, get_cache_version
+from . import ShippingMethodType
+from .models import ShippingMethod, ShippingMethodChannelListing
+from .postal_codes import is_shipping_method_applicable_for_postal_code
+
+if TYPE_CHECKING:
+    from ..account.models import Address
+
+SHIPPING_RATE_TABLE_VERSION_KEY = "shipping_rate_table_version"
+
+
+@dataclass
+class ShippingRate:
+    # Shipping method with its tax class and prefetched postal code rules.
+    method: ShippingMethod
+    listing: ShippingMethodChannelListing
+    excluded_product_ids: set[int] = field(default_factory=set)
+
+    def is_applicable(self, price: Money, weight: Weight, product_ids: set[int]):
+        if self.listing.currency != price.currency:
+            return False
+        if not self.excluded_product_ids.isdisjoint(product_ids):
+            return False
+        if self.method.type == ShippingMethodType.PRICE_BASED:
+            min_price = self.listing.minimum_order_price_amount
+            max_price = self.listing.maximum_order_price_amount
+            return (min_price is None or min_price <= price.amount) and (
+                max_price is None or max_price >= price.amount
+            )
+        if self.method.type == ShippingMethodType.WEIGHT_BASED:
+            min_weight = self.method.minimum_order_weight
+            max_weight = self.method.maximum_order_weight
+            return (min_weight is None or min_weight <= weight) and (
+                max_weight is None or max_weight >= weight
+            )
+        return False
+
+
+@dataclass
+class ShippingRateTable:
+    # country code -> rates of the channel's zones shipping to the country,
+    # ordered by price
+    rates_by_country: dict[str, list[ShippingRate]]
+    created_at: float
+
+    def get_applicable_shipping_methods(
+        self,
+        price: Money,
+        weight: Weight,
+        country_code: str,
+        shipping_address: "Address",
+        product_ids: Iterable[int] = (),
+    ) -> list[ShippingMethod]:
+        product_ids = set(product_ids)
+        return [
+            rate.method
+            for rate in self.rates_by_country.get(country_code, [])
+            if rate.is_applicable(price, weight, product_ids)
+            and is_shipping_method_applicable_for_postal_code(
+                shipping_address, rate.method
+            )
+        ]
+
+
+# channel id -> (version, table)
+_rate_tables: dict[int, tuple[int, ShippingRateTable]] = {}
+
+
+def invalidate_shipping_rate_tables():
+    """Invalidate shipping rate tables in every process."""
+    bump_cache_version_on_commit(SHIPPING_RATE_TABLE_VERSION_KEY)
+    _rate_tables.clear()
+
+
+def get_shipping_rate_table(channel_id: int) -> ShippingRateTable:
+    version = get_cache_version(SHIPPING_RATE_TABLE_VERSION_KEY)
+    cached = _rate_tables.get(channel_id)
+    if cached is not None:
+        cached_version, table = cached
+        timeout = settings.SHIPPING_RATE_TABLE_TIMEOUT.total_seconds()
+        if cached_version == version and monotonic() - table.created_at <= timeout:
+            return table
+
+    table = build_shipping_rate_table(channel_id)
+    _rate_tables[channel_id] = (version, table)
+    return table
+
+
+def build_shipping_rate_table(channel_id: int) -> ShippingRateTable:
+    # The table is kept until the next change of shipping, so it's built from the
+    # writer to not cache a state that the replica has not caught up with yet.
+    with allow_writer():
+        listings = list(
+            ShippingMethodChannelListing.objects.filter(
+                channel_id=channel_id,
+                shipping_method__shipping_zone__channels__id=channel_id,
+            )
+            .select_related(
+                "shipping_method__shipping_zone", "shipping_method__tax_class"
+            )
+            .prefetch_related("shipping_method__postal_code_rules")
+            .order_by("price_amount", "shipping_method_id")
+        )
+        excluded_products = ShippingMethod.excluded_products.through.objects.filter(
+            shippingmethod_id__in=[listing.shipping_method_id for listing in listings]
+        ).values_list("shippingmethod_id", "product_id")
+        excluded_product_ids: dict[int, set[int]] = defaultdict(set)
+        for shipping_method_id, product_id in excluded_products:
+            excluded_product_ids[shipping_method_id].add(product_id)
+
+    rates_by_country: dict[str, list[ShippingRate]] = defaultdict(list)
+    for listing in listings:
+        method = listing.shipping_method
+        rate = ShippingRate(
+            method=method,
+            listing=listing,
+            excluded_product_ids=excluded_product_ids[method.pk],
+        )
+        for country in method.shipping_zone.countries:
+            rates_by_country[country.code].append(rate)
+    return ShippingRateTable(
+        rates_by_country=dict(rates_by_country), created_at=monotonic()
+    )
+
+
+def get_applicable_shipping_methods(
+    channel_id: int,
+    price: Money,
+    weight: Weight,
+    shipping_address: "Address",
+    country_code: Optional[str] = None,
+    product_ids: Iterable[int] = (),
+) -> list[ShippingMethod]:
+    """Return shipping methods applicable to the given price, weight and products.
+
+    The result matches `ShippingMethod.objects.applicable_shipping_methods_for_instance`.
+    """
+    return get_shipping_rate_table(channel_id).get_applicable_shipping_methods(
+        price,
+        weight,
+        country_code or shipping_address.country.code,
+        shipping_address,
+        product_ids,
+    )
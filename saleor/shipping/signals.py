@@ -0,0 +1,12 @@
+from .rate_table import invalidate_shipping_rate_tables
+
+
+def invalidate_shipping_rate_tables_on_change(sender, instance, **kwargs):
+    invalidate_shipping_rate_tables()
+
+
+def invalidate_shipping_rate_tables_on_relation_change(
+    sender, instance, action, **kwargs
+):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_shipping_rate_tables()
@@ -0,0 +1,273 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from measurement.measures import Weight
+from prices import Money
+
+from ...checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ...checkout.utils import get_valid_internal_shipping_methods_for_checkout
+from ...plugins.manager import get_plugins_manager
+from .. import PostalCodeRuleInclusionType, ShippingMethodType
+from ..models import ShippingMethod, ShippingMethodChannelListing
+from ..postal_codes import filter_shipping_methods_by_postal_code_rules
+from ..rate_table import get_applicable_shipping_methods, get_shipping_rate_table
+
+
+@pytest.fixture
+def shipping_methods_for_rate_table(
+    shipping_zone, channel_USD, product, _clear_shipping_rate_tables
+):
+    price_method = shipping_zone.shipping_methods.get()
+    weight_method = shipping_zone.shipping_methods.create(
+        name="Heavy",
+        minimum_order_weight=Weight(kg=1),
+        maximum_order_weight=Weight(kg=10),
+        type=ShippingMethodType.WEIGHT_BASED,
+    )
+    limited_method = shipping_zone.shipping_methods.create(
+        name="Limited", type=ShippingMethodType.PRICE_BASED
+    )
+    limited_method.excluded_products.add(product)
+    limited_method.postal_code_rules.create(
+        start="53-000", end="53-999", inclusion_type=PostalCodeRuleInclusionType.EXCLUDE
+    )
+    ShippingMethodChannelListing.objects.create(
+        shipping_method=weight_method,
+        channel=channel_USD,
+        currency=channel_USD.currency_code,
+        price_amount=5,
+    )
+    ShippingMethodChannelListing.objects.create(
+        shipping_method=limited_method,
+        channel=channel_USD,
+        currency=channel_USD.currency_code,
+        minimum_order_price_amount=1,
+        maximum_order_price_amount=10,
+        price_amount=1,
+    )
+    return [price_method, weight_method, limited_method]
+
+
+def _get_applicable_shipping_methods_with_queries(
+    channel, price, weight, shipping_address, product_ids
+):
+    methods = ShippingMethod.objects.applicable_shipping_methods(
+        price=price,
+        channel_id=channel.pk,
+        weight=weight,
+        country_code=shipping_address.country.code,
+        product_ids=product_ids,
+    ).prefetch_related("postal_code_rules")
+    return list(filter_shipping_methods_by_postal_code_rules(methods, shipping_address))
+
+
+@pytest.mark.parametrize(
+    ("amount", "weight", "postal_code", "exclude_product"),
+    [
+        (5, Weight(kg=5), "00-001", False),
+        (5, Weight(kg=5), "53-601", False),
+        (5, Weight(kg=5), "00-001", True),
+        (20, Weight(kg=5), "00-001", False),
+        (5, Weight(kg=20), "00-001", False),
+        (0, Weight(kg=0), "00-001", False),
+    ],
+)
+def test_rate_table_matches_queries(
+    amount,
+    weight,
+    postal_code,
+    exclude_product,
+    shipping_methods_for_rate_table,
+    channel_USD,
+    address,
+    product,
+):
+    # given
+    address.postal_code = postal_code
+    price = Money(amount, channel_USD.currency_code)
+    product_ids = {product.pk} if exclude_product else set()
+    expected = _get_applicable_shipping_methods_with_queries(
+        channel_USD, price, weight, address, product_ids
+    )
+
+    # when
+    methods = get_applicable_shipping_methods(
+        channel_USD.pk,
+        price=price,
+        weight=weight,
+        shipping_address=address,
+        product_ids=product_ids,
+    )
+
+    # then
+    assert {method.pk for method in methods} == {method.pk for method in expected}
+
+
+def test_rate_table_other_country_and_currency(
+    shipping_methods_for_rate_table, channel_USD, address
+):
+    # given
+    get_shipping_rate_table(channel_USD.pk)
+
+    # when
+    other_currency_methods = get_applicable_shipping_methods(
+        channel_USD.pk,
+        price=Money(5, "PLN"),
+        weight=Weight(kg=5),
+        shipping_address=address,
+    )
+    other_channel_methods = get_applicable_shipping_methods(
+        channel_USD.pk + 1,
+        price=Money(5, channel_USD.currency_code),
+        weight=Weight(kg=5),
+        shipping_address=address,
+    )
+
+    # then
+    assert other_currency_methods == []
+    assert other_channel_methods == []
+
+
+def test_rate_table_evaluated_without_queries(
+    shipping_methods_for_rate_table, channel_USD, address, django_assert_num_queries
+):
+    # given
+    price = Money(5, channel_USD.currency_code)
+    weight = Weight(kg=5)
+    with CaptureQueriesContext(connection) as queries_context:
+        expected = _get_applicable_shipping_methods_with_queries(
+            channel_USD, price, weight, address, set()
+        )
+    get_shipping_rate_table(channel_USD.pk)
+
+    # when
+    with django_assert_num_queries(0):
+        methods = get_applicable_shipping_methods(
+            channel_USD.pk, price=price, weight=weight, shipping_address=address
+        )
+        [method.tax_class for method in methods]
+
+    # then
+    assert len(queries_context.captured_queries) > 0
+    assert [method.pk for method in methods] == [method.pk for method in expected]
+
+
+def test_rate_table_ordered_by_price(shipping_methods_for_rate_table, channel_USD):
+    # when
+    table = get_shipping_rate_table(channel_USD.pk)
+
+    # then
+    prices = [rate.listing.price_amount for rate in table.rates_by_country["PL"]]
+    assert prices == sorted(prices)
+
+
+def test_rate_table_invalidated_on_listing_change(
+    shipping_methods_for_rate_table, channel_USD, address
+):
+    # given
+    price = Money(5, channel_USD.currency_code)
+    weight = Weight(kg=5)
+    price_method = shipping_methods_for_rate_table[0]
+    methods = get_applicable_shipping_methods(
+        channel_USD.pk, price=price, weight=weight, shipping_address=address
+    )
+    assert price_method in methods
+
+    # when
+    listing = price_method.channel_listings.get()
+    listing.minimum_order_price_amount = 100
+    listing.save(update_fields=["minimum_order_price_amount"])
+
+    # then
+    methods = get_applicable_shipping_methods(
+        channel_USD.pk, price=price, weight=weight, shipping_address=address
+    )
+    assert price_method not in methods
+
+
+def test_rate_table_invalidated_on_excluded_products_change(
+    shipping_methods_for_rate_table, channel_USD, address, product
+):
+    # given
+    price = Money(5, channel_USD.currency_code)
+    weight = Weight(kg=5)
+    price_method = shipping_methods_for_rate_table[0]
+    get_shipping_rate_table(channel_USD.pk)
+
+    # when
+    price_method.excluded_products.add(product)
+
+    # then
+    methods = get_applicable_shipping_methods(
+        channel_USD.pk,
+        price=price,
+        weight=weight,
+        shipping_address=address,
+        product_ids=[product.pk],
+    )
+    assert price_method not in methods
+
+
+def test_rate_table_invalidated_on_zone_channels_change(
+    shipping_methods_for_rate_table, shipping_zone, channel_USD
+):
+    # given
+    assert get_shipping_rate_table(channel_USD.pk).rates_by_country
+
+    # when
+    shipping_zone.channels.remove(channel_USD)
+
+    # then
+    assert get_shipping_rate_table(channel_USD.pk).rates_by_country == {}
+
+
+def test_rate_table_rebuilt_after_timeout(
+    shipping_methods_for_rate_table, channel_USD, settings
+):
+    # given
+    settings.SHIPPING_RATE_TABLE_TIMEOUT = timedelta(minutes=5)
+    table = get_shipping_rate_table(channel_USD.pk)
+
+    # when
+    with patch(
+        "saleor.shipping.rate_table.monotonic",
+        return_value=table.created_at + 301,
+    ):
+        rebuilt_table = get_shipping_rate_table(channel_USD.pk)
+
+    # then
+    assert rebuilt_table is not table
+    assert get_shipping_rate_table(channel_USD.pk) is rebuilt_table
+
+
+def test_checkout_shipping_methods_from_rate_table(
+    checkout_with_item, address, shipping_methods_for_rate_table, settings
+):
+    # given
+    checkout = checkout_with_item
+    checkout.shipping_address = address
+    checkout.save(update_fields=["shipping_address"])
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout)
+    shipping_channel_listings = list(checkout.channel.shipping_method_listings.all())
+    checkout_info = fetch_checkout_info(
+        checkout, lines, manager, shipping_channel_listings
+    )
+    subtotal = Money(5, checkout.currency)
+    settings.SHIPPING_RATE_TABLE_ENABLED = False
+    expected = get_valid_internal_shipping_methods_for_checkout(
+        checkout_info, lines, subtotal, shipping_channel_listings
+    )
+
+    # when
+    settings.SHIPPING_RATE_TABLE_ENABLED = True
+    shipping_methods = get_valid_internal_shipping_methods_for_checkout(
+        checkout_info, lines, subtotal, shipping_channel_listings
+    )
+
+    # then
+    assert shipping_methods
+    assert shipping_methods == expected
@@ -27,6 +27,7 @@ from freezegun import freeze_time
 from PIL import Image
 from prices import Money, TaxedMoney, fixed_discount
 
+from ..account.jwt_user_cache import JWT_USER_CACHE_VERSION_KEY
 from ..account.models import Address, Group, StaffNotificationRecipient, User
 from ..app.models import App, AppExtension, AppInstallation
 from ..app.types import AppExtensionMount, AppType
@@ -40,14 +41,20 @@ from ..attribute.models import (
 from ..attribute.utils import associate_attribute_values_to_instance
 from ..checkout import base_calculations
 from ..checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ..checkout.line_snapshot_cache import (
+    CATALOGUE_SNAPSHOT_VERSION_KEY,
+    PROMOTION_SNAPSHOT_VERSION_KEY,
+)
 from ..checkout.models import Checkout, CheckoutLine, CheckoutMetadata
 from ..checkout.utils import add_variant_to_checkout, add_voucher_to_checkout
 from ..core import EventDeliveryStatus, JobStatus
+from ..core.jwt import clear_jwt_decode_cache
 from ..core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ..core.payments import PaymentInterface
 from ..core.postgres import FlatConcatSearchVector
 from ..core.taxes import zero_money
 from ..core.units import MeasurementUnits
+from ..core.utils.cache import bump_cache_version
 from ..core.utils.editorjs import clean_editor_js
 from ..csv.events import ExportEvents
 from ..csv.models import ExportEvent, ExportFile
@@ -109,6 +116,7 @@ from ..payment.transaction_item_calculations import recalculate_transaction_amou
 from ..payment.utils import create_manual_adjustment_events
 from ..permission.enums import get_permissions
 from ..permission.models import Permission
+from ..plugins.configuration_cache import PLUGIN_CONFIGURATION_CACHE_VERSION_KEY
 from ..plugins.manager import get_plugins_manager
 from ..plugins.webhook.tests.subscription_webhooks import subscription_queries
 from ..product import ProductMediaTypes, ProductTypeKind
@@ -140,6 +148,7 @@ from ..shipping.models import (
     ShippingMethodType,
     ShippingZone,
 )
+from ..shipping.rate_table import SHIPPING_RATE_TABLE_VERSION_KEY
 from ..shipping.utils import convert_to_shipping_method_data
 from ..site.models import SiteSettings
 from ..tax.utils import calculate_tax_rate, get_tax_class_kwargs_for_order_line
@@ -370,6 +379,34 @@ def setup_dummy_gateways(settings):
     return settings
 
 
+@pytest.fixture(autouse=True)
+def _clear_plugin_configuration_cache():
+    # Configurations cached by the previous test are not removed with its database
+    # rollback.
+    bump_cache_version(PLUGIN_CONFIGURATION_CACHE_VERSION_KEY)
+
+
+@pytest.fixture
+def _clear_shipping_rate_tables():
+    bump_cache_version(SHIPPING_RATE_TABLE_VERSION_KEY)
+
+
+@pytest.fixture
+def _clear_checkout_line_snapshots():
+    bump_cache_version(CATALOGUE_SNAPSHOT_VERSION_KEY)
+    bump_cache_version(PROMOTION_SNAPSHOT_VERSION_KEY)
+
+
+@pytest.fixture
+def _clear_jwt_user_cache():
+    bump_cache_version(JWT_USER_CACHE_VERSION_KEY)
+
+
+@pytest.fixture(autouse=True)
+def _clear_jwt_decode_cache():
+    clear_jwt_decode_cache()
+
+
 @pytest.fixture
 def _sample_gateway(settings):
     settings.PLUGINS += [
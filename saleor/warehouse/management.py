@@ -24,13 +24,13 @@ from ..plugins.manager import PluginsManager
 from ..product.models import ProductVariant, ProductVariantChannelListing
 from .models import (
     Allocation,
-    ChannelWarehouse,
     PreorderAllocation,
     PreorderReservation,
     Reservation,
     Stock,
     Warehouse,
 )
+from .utils import get_channel_warehouse_ranks
 
 if TYPE_CHECKING:
     from ..channel.models import Channel
@@ -88,7 +88,10 @@ def allocate_stocks(
         .order_by("pk")
         .values("id", "product_variant", "pk", "quantity", "warehouse_id")
     )
-    stocks_id = (stock.pop("id") for stock in stocks)
+    # The ids are used by both the reservation and the allocation queries, so they
+    # can't be consumed by the first of them.
+    stocks_id = [stock.pop("id") for stock in stocks]
+    stocks_snapshot = {stock["pk"]: dict(stock) for stock in stocks}
 
     quantity_reservation_for_stocks: dict = _prepare_stock_to_reserved_quantity_map(
         checkout_lines, check_reservations, stocks_id
@@ -139,26 +142,49 @@ def allocate_stocks(
         raise InsufficientStock(insufficient_stock)
 
     if allocations:
-        stocks_to_update = []
-        for alloc in Allocation.objects.bulk_create(allocations):
-            stock = alloc.stock
-            stock.quantity_allocated = (
-                F("quantity_allocated") + alloc.quantity_allocated
-            )
-            stocks_to_update.append(stock)
-        Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
-
+        Allocation.objects.bulk_create(allocations)
+        quantity_allocated_per_stock: dict[int, int] = defaultdict(int)
         for allocation in allocations:
-            allocated_stock = (
-                Allocation.objects.filter(stock_id=allocation.stock_id).aggregate(
-                    Sum("quantity_allocated")
-                )["quantity_allocated__sum"]
-                or 0
+            quantity_allocated_per_stock[allocation.stock_id] += (
+                allocation.quantity_allocated
             )
-            if not max(allocation.stock.quantity - allocated_stock, 0):
-                transaction.on_commit(
-                    lambda: manager.product_variant_out_of_stock(allocation.stock)
+        Stock.objects.bulk_update(
+            [
+                Stock(
+                    pk=stock_pk, quantity_allocated=F("quantity_allocated") + quantity
                 )
+                for stock_pk, quantity in quantity_allocated_per_stock.items()
+            ],
+            ["quantity_allocated"],
+        )
+
+        # The stocks are locked, so the availability after the allocation can be
+        # computed from the snapshot taken above, without querying allocations again.
+        out_of_stock = []
+        for stock_pk, quantity in quantity_allocated_per_stock.items():
+            stock_data = stocks_snapshot[stock_pk]
+            quantity_allocated = quantity_allocation_for_stocks[stock_pk] + quantity
+            if stock_data["quantity"] - quantity_allocated <= 0:
+                out_of_stock.append(
+                    Stock(
+                        pk=stock_pk,
+                        product_variant_id=stock_data["product_variant"],
+                        warehouse_id=stock_data["warehouse_id"],
+                        quantity=stock_data["quantity"],
+                        quantity_allocated=quantity_allocated,
+                    )
+                )
+        if out_of_stock:
+            transaction.on_commit(
+                lambda: send_product_variant_out_of_stock_events(out_of_stock, manager)
+            )
+
+
+def send_product_variant_out_of_stock_events(
+    stocks: Iterable[Stock], manager: PluginsManager
+):
+    for stock in stocks:
+        manager.product_variant_out_of_stock(stock)
 
 
 def _prepare_stock_to_reserved_quantity_map(
@@ -193,11 +219,6 @@ def sort_stocks(
     quantity_allocation_for_stocks: dict[int, int],
     collection_point_pk: Optional[UUID] = None,
 ):
-    warehouse_ids = [stock_data["warehouse_id"] for stock_data in stocks]
-    channel_warehouse_ids = ChannelWarehouse.objects.filter(
-        channel_id=channel.id, warehouse_id__in=warehouse_ids
-    ).values_list("warehouse_id", flat=True)
-
     def sort_stocks_by_highest_stocks(stock_data):
         """Sort the stocks by the highest quantity available."""
         # in case of click and collect order we should allocate stocks from
@@ -210,15 +231,22 @@ def sort_stocks(
 
     def sort_stocks_by_warehouse_sorting_order(stock_data):
         """Sort the stocks based on the warehouse within channel order."""
-        # get the sort order for stocks warehouses within the channel
-        sorted_warehouse_list = list(channel_warehouse_ids)
-
         warehouse_id = stock_data.pop("warehouse_id")
         # in case of click and collect order we should allocate stocks from
         # collection point warehouse at the first place
         if warehouse_id == collection_point_pk:
             return -math.inf
-        return sorted_warehouse_list.index(warehouse_id)
+        return warehouse_ranks[warehouse_id]
+
+    if allocation_strategy == AllocationStrategy.PRIORITIZE_SORTING_ORDER:
+        warehouse_ranks = get_channel_warehouse_ranks(
+            channel.id,
+            [
+                stock_data["warehouse_id"]
+                for stock_data in stocks
+                if stock_data["warehouse_id"] != collection_point_pk
+            ],
+        )
 
     allocation_strategy_to_sort_method_and_reverse_option = {
         AllocationStrategy.PRIORITIZE_HIGH_STOCK: (sort_stocks_by_highest_stocks, True),
@@ -173,6 +173,34 @@ class WarehouseQueryset(models.QuerySet["Warehouse"]):
         )
 
 
+class ChannelWarehouseQueryset(models.QuerySet["ChannelWarehouse"]):
+    """Invalidate the cached warehouse ordering on changes that skip `save`."""
+
+    def bulk_create(self, *args, **kwargs):
+        from .utils import invalidate_channel_warehouse_ranks
+
+        result = super().bulk_create(*args, **kwargs)
+        invalidate_channel_warehouse_ranks()
+        return result
+
+    def update(self, **kwargs):
+        from .utils import invalidate_channel_warehouse_ranks
+
+        result = super().update(**kwargs)
+        invalidate_channel_warehouse_ranks()
+        return result
+
+    def delete(self):
+        from .utils import invalidate_channel_warehouse_ranks
+
+        result = super().delete()
+        invalidate_channel_warehouse_ranks()
+        return result
+
+
+ChannelWarehouseManager = models.Manager.from_queryset(ChannelWarehouseQueryset)
+
+
 class ChannelWarehouse(SortableModel):
     channel = models.ForeignKey(
         Channel, related_name="channelwarehouse", on_delete=models.CASCADE
@@ -181,6 +209,8 @@ class ChannelWarehouse(SortableModel):
         "Warehouse", related_name="channelwarehouse", on_delete=models.CASCADE
     )
 
+    objects = ChannelWarehouseManager()
+
     class Meta:
         unique_together = (("channel", "warehouse"),)
         ordering = ("sort_order", "pk")
@@ -188,6 +218,19 @@ class ChannelWarehouse(SortableModel):
     def get_ordering_queryset(self):
         return self.channel.channelwarehouse.all()
 
+    def save(self, *args, **kwargs):
+        from .utils import invalidate_channel_warehouse_ranks
+
+        super().save(*args, **kwargs)
+        invalidate_channel_warehouse_ranks()
+
+    def delete(self, *args, **kwargs):
+        from .utils import invalidate_channel_warehouse_ranks
+
+        result = super().delete(*args, **kwargs)
+        invalidate_channel_warehouse_ranks()
+        return result
+
 
 WarehouseManager = models.Manager.from_queryset(WarehouseQueryset)
 
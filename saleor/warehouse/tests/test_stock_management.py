@@ -19,8 +19,10 @@ from ..management import (
     decrease_stock,
     increase_allocations,
     increase_stock,
+    sort_stocks,
 )
 from ..models import Allocation, ChannelWarehouse, PreorderAllocation
+from ..utils import get_channel_warehouse_ranks
 
 COUNTRY_CODE = "US"
 
@@ -45,6 +47,53 @@ def test_allocate_stocks(order_line, stock, channel_USD):
     assert allocation.quantity_allocated == stock.quantity_allocated == 50
 
 
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_out_of_stock_webhook_triggered(
+    product_variant_out_of_stock_webhook_mock, order_line, stock, channel_USD
+):
+    # given
+    stock.quantity = 50
+    stock.save(update_fields=["quantity"])
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+    flush_post_commit_hooks()
+
+    # then
+    product_variant_out_of_stock_webhook_mock.assert_called_once()
+    out_of_stock = product_variant_out_of_stock_webhook_mock.call_args.args[0]
+    assert out_of_stock.pk == stock.pk
+    assert out_of_stock.quantity_allocated == 50
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_out_of_stock_webhook_not_triggered_when_available(
+    product_variant_out_of_stock_webhook_mock, order_line, stock, channel_USD
+):
+    # given
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+    flush_post_commit_hooks()
+
+    # then
+    product_variant_out_of_stock_webhook_mock.assert_not_called()
+
+
 def test_allocate_stocks_multiple_lines_the_highest_stock_strategy(
     order_line, order, product, stock, channel_USD
 ):
@@ -192,6 +241,84 @@ def test_allocate_stock_many_stocks_prioritize_sorting_order_strategy(
     )
 
 
+def test_get_channel_warehouse_ranks_cached(
+    variant_with_many_stocks, channel_USD, django_assert_num_queries
+):
+    # given
+    warehouse_ids = [
+        stock.warehouse_id for stock in variant_with_many_stocks.stocks.all()
+    ]
+    ranks = get_channel_warehouse_ranks(channel_USD.id, warehouse_ids)
+
+    # when
+    with django_assert_num_queries(0):
+        cached_ranks = get_channel_warehouse_ranks(channel_USD.id, warehouse_ids)
+
+    # then
+    assert cached_ranks == ranks
+    assert sorted(ranks.values()) == list(range(len(ranks)))
+
+
+def test_get_channel_warehouse_ranks_invalidated_on_reorder(
+    variant_with_many_stocks, channel_USD
+):
+    # given
+    stock_1, stock_2 = variant_with_many_stocks.stocks.all()
+    channel_warehouse_1 = stock_1.warehouse.channelwarehouse.first()
+    channel_warehouse_2 = stock_2.warehouse.channelwarehouse.first()
+    channel_warehouse_1.sort_order = 0
+    channel_warehouse_2.sort_order = 1
+    ChannelWarehouse.objects.bulk_update(
+        [channel_warehouse_1, channel_warehouse_2], ["sort_order"]
+    )
+    ranks = get_channel_warehouse_ranks(channel_USD.id)
+    assert ranks[stock_1.warehouse_id] < ranks[stock_2.warehouse_id]
+
+    # when
+    channel_warehouse_1.sort_order = 1
+    channel_warehouse_2.sort_order = 0
+    ChannelWarehouse.objects.bulk_update(
+        [channel_warehouse_1, channel_warehouse_2], ["sort_order"]
+    )
+
+    # then
+    ranks = get_channel_warehouse_ranks(channel_USD.id)
+    assert ranks[stock_1.warehouse_id] > ranks[stock_2.warehouse_id]
+
+
+def test_sort_stocks_prioritize_sorting_order_large_cart(
+    variant_with_many_stocks, channel_USD, django_assert_num_queries
+):
+    # given
+    stocks = list(variant_with_many_stocks.stocks.all())
+    ranks = get_channel_warehouse_ranks(channel_USD.id)
+    stocks_data = [
+        {
+            "pk": stock.pk,
+            "product_variant": stock.product_variant_id,
+            "quantity": stock.quantity,
+            "warehouse_id": stock.warehouse_id,
+        }
+        for _ in range(500)
+        for stock in stocks
+    ]
+
+    # when
+    with django_assert_num_queries(0):
+        sorted_stocks = sort_stocks(
+            AllocationStrategy.PRIORITIZE_SORTING_ORDER,
+            stocks_data,
+            channel_USD,
+            {},
+        )
+
+    # then
+    expected_order = [
+        stock.pk for stock in sorted(stocks, key=lambda s: ranks[s.warehouse_id])
+    ]
+    assert [stock["pk"] for stock in sorted_stocks[::500]] == expected_order
+
+
 def test_allocate_stock_prioritize_sorting_order_strategy_with_collection_point(
     order_line, variant_with_many_stocks, channel_USD, warehouse_for_cc
 ):
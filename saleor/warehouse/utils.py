@@ -0,0 +1,50 @@
+from typing import Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..core.utils.cache import bump_cache_version_on_commit, get_cache_version
+from .models import ChannelWarehouse
+
+CHANNEL_WAREHOUSE_RANKS_VERSION_KEY = "channel_warehouse_ranks_version"
+CHANNEL_WAREHOUSE_RANKS_KEY = "channel_warehouse_ranks:{version}:{channel_id}"
+
+
+def invalidate_channel_warehouse_ranks():
+    """Invalidate the cached warehouse ordering of all channels."""
+    bump_cache_version_on_commit(CHANNEL_WAREHOUSE_RANKS_VERSION_KEY)
+
+
+def get_channel_warehouse_ranks(
+    channel_id: int, warehouse_ids: Optional[list[UUID]] = None
+) -> dict[UUID, int]:
+    """Return the positions of warehouses within the channel's warehouse ordering.
+
+    The ranks are cached per channel. When any of the given `warehouse_ids` is
+    missing in the cached ranks, they are recomputed from the database.
+    """
+    key = CHANNEL_WAREHOUSE_RANKS_KEY.format(
+        version=get_cache_version(CHANNEL_WAREHOUSE_RANKS_VERSION_KEY),
+        channel_id=channel_id,
+    )
+    ranks = cache.get(key)
+    if isinstance(ranks, dict) and all(
+        warehouse_id in ranks for warehouse_id in warehouse_ids or []
+    ):
+        return ranks
+
+    ranks = {
+        warehouse_id: rank
+        for rank, warehouse_id in enumerate(
+            ChannelWarehouse.objects.filter(channel_id=channel_id)
+            .order_by("sort_order", "pk")
+            .values_list("warehouse_id", flat=True)
+        )
+    }
+    cache.set(
+        key,
+        ranks,
+        timeout=settings.CHANNEL_WAREHOUSE_RANKS_CACHE_TIMEOUT.total_seconds(),
+    )
+    return ranks
@@ -0,0 +1,37 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WebhookAppConfig(AppConfig):
+    name = "saleor.webhook"
+
+    def ready(self):
+        from ..app.models import App
+        from .models import Webhook, WebhookEvent
+        from .signals import (
+            cache_subscription_document_on_webhook_save,
+            invalidate_webhook_routing_table_on_change,
+            invalidate_webhook_routing_table_on_permissions_change,
+        )
+
+        for model in (Webhook, WebhookEvent, App):
+            post_save.connect(
+                invalidate_webhook_routing_table_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_webhook_routing_table_on_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_webhook_routing_table_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_webhook_routing_table_on_{model.__name__}_delete",
+            )
+        m2m_changed.connect(
+            invalidate_webhook_routing_table_on_permissions_change,
+            sender=App.permissions.through,
+            dispatch_uid="invalidate_webhook_routing_table_on_app_permissions_change",
+        )
+        post_save.connect(
+            cache_subscription_document_on_webhook_save,
+            sender=Webhook,
+            dispatch_uid="cache_subscription_document_on_webhook_save",
+        )
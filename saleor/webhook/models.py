@@ -12,6 +12,24 @@ class WebhookURLField(models.URLField):
     ]
 
 
+class WebhookRoutingQueryset(models.QuerySet):
+    """Invalidate the webhook routing table on changes that skip model signals."""
+
+    def bulk_create(self, *args, **kwargs):
+        from .utils import invalidate_webhook_routing_table
+
+        result = super().bulk_create(*args, **kwargs)
+        invalidate_webhook_routing_table()
+        return result
+
+    def update(self, **kwargs):
+        from .utils import invalidate_webhook_routing_table
+
+        result = super().update(**kwargs)
+        invalidate_webhook_routing_table()
+        return result
+
+
 class Webhook(models.Model):
     name = models.CharField(max_length=255, null=True, blank=True)
     app = models.ForeignKey(App, related_name="webhooks", on_delete=models.CASCADE)
@@ -27,6 +45,8 @@ class Webhook(models.Model):
         validators=[custom_headers_validator],
     )
 
+    objects = models.Manager.from_queryset(WebhookRoutingQueryset)()
+
     class Meta:
         ordering = ("pk",)
 
@@ -40,5 +60,7 @@ class WebhookEvent(models.Model):
     )
     event_type = models.CharField("Event type", max_length=128, db_index=True)
 
+    objects = models.Manager.from_queryset(WebhookRoutingQueryset)()
+
     def __repr__(self):
         return self.event_type
@@ -6,7 +6,6 @@ from graphql import (
     GraphQLInterfaceType,
     GraphQLObjectType,
     GraphQLSchema,
-    get_default_backend,
     get_named_type,
 )
 from graphql.language.ast import (
@@ -21,7 +20,7 @@ from graphql.validation import validate
 from graphql.validation.rules.base import ValidationRule
 from graphql.validation.validation import ValidationContext
 
-from ...graphql.api import schema
+from ...graphql.webhook.subscription_payload import get_subscription_document
 from .sensitive_data import ALLOWED_HEADERS, SENSITIVE_HEADERS, SensitiveFieldsMap
 
 if TYPE_CHECKING:
@@ -201,8 +200,7 @@ def anonymize_event_payload(
 ) -> Any:
     if not subscription_query:
         return payload
-    graphql_backend = get_default_backend()
-    document = graphql_backend.document_from_string(schema, subscription_query)
+    document = get_subscription_document(subscription_query)
     if _contain_sensitive_field(document, sensitive_fields):
         return MASK
     return payload
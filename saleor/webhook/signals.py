@@ -0,0 +1,34 @@
+from graphql.error import GraphQLError
+
+from .utils import invalidate_webhook_routing_table
+
+
+def invalidate_webhook_routing_table_on_change(sender, instance, **kwargs):
+    invalidate_webhook_routing_table()
+
+
+def invalidate_webhook_routing_table_on_permissions_change(
+    sender, instance, action, **kwargs
+):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_webhook_routing_table()
+
+
+def cache_subscription_document_on_webhook_save(sender, instance, **kwargs):
+    """Parse and validate the subscription query when the webhook is saved.
+
+    The document is stored in the shared document cache, so workers sending the
+    webhook's payloads don't have to parse the query again.
+    """
+    from ..graphql.webhook.subscription_payload import get_subscription_document
+
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and "subscription_query" not in update_fields:
+        return
+    if not instance.subscription_query:
+        return
+    try:
+        get_subscription_document(instance.subscription_query)
+    except GraphQLError:
+        # Invalid queries are reported when the payload is generated.
+        pass
@@ -9,7 +9,11 @@ from ..observability.exceptions import (
     TruncationError,
 )
 from ..observability.payload_schema import ObservabilityEventTypes
-from ..utils import get_webhooks_for_event
+from ..utils import (
+    get_webhook_routing_table,
+    get_webhooks_for_event,
+    has_webhooks_for_event,
+)
 
 
 @pytest.fixture
@@ -114,6 +118,72 @@ def test_get_webhook_for_event_not_returning_any_webhook_for_sync_event_types(
     assert set(webhooks) == {sync_webhook}
 
 
+def test_get_webhooks_for_event_no_subscribers_skips_db(
+    db, async_type, django_assert_num_queries
+):
+    # given
+    get_webhook_routing_table()
+
+    # when
+    with django_assert_num_queries(0):
+        webhooks = list(get_webhooks_for_event(async_type))
+
+    # then
+    assert webhooks == []
+
+
+def test_webhook_routing_table_invalidated_on_webhook_create(
+    db, async_app_factory, async_type
+):
+    # given
+    assert not has_webhooks_for_event(async_type)
+
+    # when
+    _, webhook = async_app_factory()
+
+    # then
+    assert has_webhooks_for_event(async_type)
+    assert set(get_webhooks_for_event(async_type)) == {webhook}
+
+
+def test_webhook_routing_table_invalidated_on_webhook_deactivate(
+    async_app_factory, async_type
+):
+    # given
+    _, webhook = async_app_factory()
+    assert has_webhooks_for_event(async_type)
+
+    # when
+    Webhook.objects.filter(pk=webhook.pk).update(is_active=False)
+
+    # then
+    assert not has_webhooks_for_event(async_type)
+
+
+def test_webhook_routing_table_invalidated_on_app_permissions_change(
+    async_app_factory, async_type, permission_manage_orders
+):
+    # given
+    app, _ = async_app_factory()
+    assert has_webhooks_for_event(async_type)
+
+    # when
+    app.permissions.remove(permission_manage_orders)
+
+    # then
+    assert not has_webhooks_for_event(async_type)
+
+
+def test_has_webhooks_for_event_filters_apps(async_app_factory, async_type):
+    # given
+    app, _ = async_app_factory()
+
+    # when & then
+    assert has_webhooks_for_event(async_type, apps_ids=[app.pk])
+    assert not has_webhooks_for_event(async_type, apps_ids=[app.pk + 1])
+    assert not has_webhooks_for_event(async_type, apps_identifier=["other-app"])
+
+
 @pytest.mark.parametrize(
     ("error", "event_type"),
     [
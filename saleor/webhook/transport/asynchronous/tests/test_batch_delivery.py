@@ -0,0 +1,139 @@
+from unittest.mock import patch
+
+import pytest
+
+from .....core import EventDeliveryStatus
+from .....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
+from .....webhook.event_types import WebhookEventAsyncType
+from ...utils import WebhookResponse
+from ..transport import (
+    send_webhook_requests_async_batch,
+    split_deliveries_into_lanes,
+    trigger_webhooks_async,
+)
+
+
+@pytest.fixture
+def event_deliveries(event_payload, webhook):
+    return EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=WebhookEventAsyncType.ORDER_CREATED,
+                payload=event_payload,
+                webhook=webhook,
+            )
+            for _ in range(3)
+        ]
+    )
+
+
+def test_split_deliveries_into_lanes(event_deliveries):
+    # when
+    lanes = split_deliveries_into_lanes(event_deliveries, 2)
+
+    # then
+    assert [len(lane) for lane in lanes] == [2, 1]
+    assert {delivery for lane in lanes for delivery in lane} == set(event_deliveries)
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "send_webhook_requests_async_batch.delay"
+)
+@patch("saleor.webhook.transport.asynchronous.transport.send_webhook_request_async")
+def test_trigger_webhooks_async_in_batches(
+    mocked_send_webhook_request_async, mocked_batch_delay, webhook, settings
+):
+    # given
+    settings.WEBHOOK_BATCH_DELIVERY_ENABLED = True
+    settings.WEBHOOK_BATCH_SIZE = 2
+    webhooks = [webhook] * 3
+
+    # when
+    trigger_webhooks_async(
+        '{"key": "value"}', WebhookEventAsyncType.ORDER_CREATED, webhooks
+    )
+
+    # then
+    mocked_send_webhook_request_async.delay.assert_not_called()
+    assert [len(call.args[0]) for call in mocked_batch_delay.mock_calls] == [2, 1]
+
+
+@patch("saleor.webhook.transport.asynchronous.transport.HTTPClient.get_session")
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_requests_async_batch_success(
+    mocked_send_webhook, mocked_get_session, event_deliveries
+):
+    # given
+    mocked_send_webhook.return_value = WebhookResponse(content="ok")
+
+    # when
+    send_webhook_requests_async_batch([delivery.id for delivery in event_deliveries])
+
+    # then
+    assert mocked_send_webhook.call_count == 3
+    assert mocked_get_session.call_count == 1
+    assert not EventDelivery.objects.exists()
+    assert not EventPayload.objects.exists()
+
+
+@patch("saleor.webhook.transport.asynchronous.transport.send_webhook_request_async")
+@patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "send_webhook_requests_concurrently"
+)
+def test_send_webhook_requests_async_batch_failures(
+    mocked_send_concurrently, mocked_send_webhook_request_async, event_deliveries
+):
+    # given
+    retryable, not_retryable, successful = event_deliveries
+    mocked_send_concurrently.side_effect = lambda deliveries, domain: list(
+        zip(
+            deliveries,
+            [
+                WebhookResponse(
+                    content="error",
+                    response_status_code=500,
+                    status=EventDeliveryStatus.FAILED,
+                ),
+                WebhookResponse(
+                    content="not found",
+                    response_status_code=404,
+                    status=EventDeliveryStatus.FAILED,
+                ),
+                WebhookResponse(content="ok"),
+            ],
+        )
+    )
+
+    # when
+    send_webhook_requests_async_batch([retryable.id, not_retryable.id, successful.id])
+
+    # then
+    statuses = dict(EventDelivery.objects.values_list("id", "status"))
+    sent_deliveries = mocked_send_concurrently.call_args.args[0]
+    assert statuses == {
+        sent_deliveries[0].id: EventDeliveryStatus.PENDING,
+        sent_deliveries[1].id: EventDeliveryStatus.FAILED,
+    }
+    mocked_send_webhook_request_async.apply_async.assert_called_once_with(
+        (sent_deliveries[0].id,), countdown=10
+    )
+    assert EventDeliveryAttempt.objects.count() == 2
+
+
+def test_send_webhook_requests_async_batch_inactive_webhook(event_deliveries, webhook):
+    # given
+    webhook.is_active = False
+    webhook.save(update_fields=["is_active"])
+
+    # when
+    send_webhook_requests_async_batch([delivery.id for delivery in event_deliveries])
+
+    # then
+    assert set(EventDelivery.objects.values_list("status", flat=True)) == {
+        EventDeliveryStatus.FAILED
+    }
+    assert not EventDeliveryAttempt.objects.exists()
@@ -1,12 +1,21 @@
 import json
 from unittest import mock
 
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
-from .....graphql.webhook.subscription_payload import generate_payload_from_subscription
+from .....app.models import App
+from .....graphql.webhook.subscription_payload import (
+    generate_payloads_from_subscription,
+)
 from .....webhook.event_types import WebhookEventAsyncType
 from .....webhook.models import Webhook
-from ..transport import create_deliveries_for_subscriptions, get_pre_save_payload_key
+from ..transport import (
+    create_deliveries_for_multiple_subscription_objects,
+    create_deliveries_for_subscriptions,
+    get_pre_save_payload_key,
+)
 
 SUBSCRIPTION_QUERY = """
     subscription {
@@ -110,11 +119,12 @@ def test_create_deliveries_no_payload_changes_limiting_disabled(webhook_app, var
 
 @override_settings(ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS=True)
 @mock.patch(
-    "saleor.webhook.transport.asynchronous.transport.generate_payload_from_subscription",
-    wraps=generate_payload_from_subscription,
+    "saleor.webhook.transport.asynchronous.transport."
+    "generate_payloads_from_subscription",
+    wraps=generate_payloads_from_subscription,
 )
 def test_create_deliveries_reuse_request_for_webhooks(
-    mock_generate_payload_from_subscription, webhook_app, variant
+    mock_generate_payloads_from_subscription, webhook_app, variant
 ):
     # given
     event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
@@ -128,7 +138,7 @@ def test_create_deliveries_reuse_request_for_webhooks(
     webhook_2 = Webhook.objects.create(
         name="Webhook 2",
         app=webhook_app,
-        subscription_query=SUBSCRIPTION_QUERY,
+        subscription_query=SUBSCRIPTION_QUERY.replace("name", "name sku"),
     )
     webhook_2.events.create(event_type=event_type)
 
@@ -148,9 +158,155 @@ def test_create_deliveries_reuse_request_for_webhooks(
 
     # then
     assert len(event_deliveries) == 2
-    assert mock_generate_payload_from_subscription.call_count == 2
+    assert mock_generate_payloads_from_subscription.call_count == 2
 
-    request_1 = mock_generate_payload_from_subscription.call_args_list[0][1]["request"]
-    request_2 = mock_generate_payload_from_subscription.call_args_list[1][1]["request"]
+    request_1 = mock_generate_payloads_from_subscription.call_args_list[0][1]["request"]
+    request_2 = mock_generate_payloads_from_subscription.call_args_list[1][1]["request"]
     assert request_1 is request_2
     assert request_1.dataloaders is request_2.dataloaders
+
+
+@override_settings(ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS=True)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "generate_payloads_from_subscription",
+    wraps=generate_payloads_from_subscription,
+)
+def test_create_deliveries_for_multiple_subscription_objects(
+    mock_generate_payloads_from_subscription, webhook_app, product_variant_list
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
+    webhook = Webhook.objects.create(
+        name="Webhook",
+        app=webhook_app,
+        subscription_query=SUBSCRIPTION_QUERY,
+    )
+    webhook.events.create(event_type=event_type)
+
+    unchanged_variant = product_variant_list[0]
+    key = get_pre_save_payload_key(webhook, unchanged_variant)
+    pre_save_payloads = {key: {"productVariant": {"name": unchanged_variant.name}}}
+
+    # when
+    event_deliveries = create_deliveries_for_multiple_subscription_objects(
+        event_type=event_type,
+        subscribable_objects=product_variant_list,
+        webhooks=[webhook],
+        pre_save_payloads=pre_save_payloads,
+    )
+
+    # then
+    mock_generate_payloads_from_subscription.assert_called_once()
+    assert len(event_deliveries) == len(product_variant_list) - 1
+    assert [json.loads(delivery.payload.payload) for delivery in event_deliveries] == [
+        {"productVariant": {"name": variant.name}}
+        for variant in product_variant_list[1:]
+    ]
+
+
+def test_create_deliveries_for_multiple_subscription_objects_batches_queries(
+    webhook_app, product_list
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
+    webhook = Webhook.objects.create(
+        name="Webhook",
+        app=webhook_app,
+        subscription_query="""
+            subscription {
+                event {
+                    ... on ProductVariantUpdated {
+                        productVariant {
+                            product {
+                                name
+                                category {
+                                    name
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        """,
+    )
+    webhook.events.create(event_type=event_type)
+    variants = [product.variants.first() for product in product_list]
+
+    def count_queries(subscribable_objects):
+        with CaptureQueriesContext(connection) as queries:
+            event_deliveries = create_deliveries_for_multiple_subscription_objects(
+                event_type=event_type,
+                subscribable_objects=subscribable_objects,
+                webhooks=[webhook],
+            )
+        assert len(event_deliveries) == len(subscribable_objects)
+        return len(queries)
+
+    # when
+    queries_for_one_variant = count_queries(variants[:1])
+    queries_for_all_variants = count_queries(variants)
+
+    # then
+    assert len(variants) > 1
+    assert queries_for_all_variants == queries_for_one_variant
+
+
+def test_create_deliveries_share_payload_for_identical_subscriptions(
+    webhook_app, variant
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
+    other_app = App.objects.create(name="Other app", is_active=True)
+    other_app.permissions.set(webhook_app.permissions.all())
+    webhooks = []
+    for app, query in [
+        (webhook_app, SUBSCRIPTION_QUERY),
+        (other_app, SUBSCRIPTION_QUERY.replace("    ", "  ")),
+    ]:
+        webhook = Webhook.objects.create(
+            name=f"Webhook {app.name}", app=app, subscription_query=query
+        )
+        webhook.events.create(event_type=event_type)
+        webhooks.append(webhook)
+
+    # when
+    event_deliveries = create_deliveries_for_subscriptions(
+        event_type=event_type,
+        subscribable_object=variant,
+        webhooks=webhooks,
+    )
+
+    # then
+    assert len(event_deliveries) == 2
+    assert event_deliveries[0].payload_id == event_deliveries[1].payload_id
+    assert json.loads(event_deliveries[0].payload.payload) == {
+        "productVariant": {"name": variant.name}
+    }
+
+
+def test_create_deliveries_separate_payloads_for_different_permissions(
+    webhook_app, permission_manage_orders, variant
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
+    other_app = App.objects.create(name="Other app", is_active=True)
+    other_app.permissions.set([permission_manage_orders])
+    webhooks = []
+    for app in [webhook_app, other_app]:
+        webhook = Webhook.objects.create(
+            name=f"Webhook {app.name}", app=app, subscription_query=SUBSCRIPTION_QUERY
+        )
+        webhook.events.create(event_type=event_type)
+        webhooks.append(webhook)
+
+    # when
+    event_deliveries = create_deliveries_for_subscriptions(
+        event_type=event_type,
+        subscribable_object=variant,
+        webhooks=webhooks,
+    )
+
+    # then
+    assert len(event_deliveries) == 2
+    assert event_deliveries[0].payload_id != event_deliveries[1].payload_id
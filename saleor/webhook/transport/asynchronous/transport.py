@@ -1,30 +1,36 @@
 import datetime
 import json
 import logging
+from collections import defaultdict
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlparse
 
 from celery import group
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.utils import timezone
 
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
 from ....core.db.connection import allow_writer
-from ....core.models import EventDelivery, EventPayload
+from ....core.http_client import HTTPClient
+from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ....core.tracing import webhooks_opentracing_trace
 from ....core.utils import get_domain
 from ....graphql.core.dataloaders import DataLoader
 from ....graphql.webhook.subscription_payload import (
-    generate_payload_from_subscription,
+    generate_payloads_from_subscription,
     get_pre_save_payload_key,
+    group_webhooks_by_payload,
     initialize_request,
 )
 from ....graphql.webhook.subscription_types import WEBHOOK_TYPES_MAP
 from ... import observability
 from ...event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ...observability import WebhookData
+from .. import circuit_breaker
 from ..utils import (
     WebhookResponse,
     WebhookSchemes,
@@ -68,16 +74,50 @@ def create_deliveries_for_subscriptions(
     :return: List of event deliveries to send via webhook tasks.
     :param allow_replica: use replica database.
     """
+    return create_deliveries_for_multiple_subscription_objects(
+        event_type,
+        [subscribable_object],
+        webhooks,
+        requestor=requestor,
+        allow_replica=allow_replica,
+        pre_save_payloads=pre_save_payloads,
+        request_time=request_time,
+    )
+
+
+def create_deliveries_for_multiple_subscription_objects(
+    event_type,
+    subscribable_objects,
+    webhooks,
+    requestor=None,
+    allow_replica=False,
+    pre_save_payloads: Optional[dict] = None,
+    request_time: Optional[datetime.datetime] = None,
+) -> list[EventDelivery]:
+    """Create event deliveries for many subscribable objects of the same event.
+
+    The subscription query of each webhook is executed once for all objects, so
+    dataloaders fetch the data of all objects in shared batches.
+
+    :param event_type: event type which should be triggered.
+    :param subscribable_objects: subscribable objects to process via subscription
+    query.
+    :param webhooks: sequence of async webhooks.
+    :param requestor: used in subscription webhooks to generate meta data for payload.
+    :return: List of event deliveries to send via webhook tasks.
+    :param allow_replica: use replica database.
+    """
     if event_type not in WEBHOOK_TYPES_MAP:
         logger.info(
             "Skipping subscription webhook. Event %s is not subscribable.", event_type
         )
         return []
 
+    subscribable_objects = list(subscribable_objects)
     event_payloads = []
     event_deliveries = []
 
-    # Dataloaders are shared between calls to generate_payload_from_subscription to
+    # Dataloaders are shared between calls to generate_payloads_from_subscription to
     # reuse their cache. This avoids unnecessary DB queries when different webhooks
     # need to resolve the same data.
     dataloaders: dict[str, type[DataLoader]] = {}
@@ -91,46 +131,54 @@ def create_deliveries_for_subscriptions(
         dataloaders=dataloaders,
     )
 
-    for webhook in webhooks:
-        data = generate_payload_from_subscription(
+    # Webhooks that would receive identical payloads share a single execution of
+    # the subscription query and a single payload row.
+    for webhooks_group in group_webhooks_by_payload(webhooks):
+        payloads = generate_payloads_from_subscription(
             event_type=event_type,
-            subscribable_object=subscribable_object,
-            subscription_query=webhook.subscription_query,
+            subscribable_objects=subscribable_objects,
+            subscription_query=webhooks_group[0].subscription_query,
             request=request,
-            app=webhook.app,
+            app=webhooks_group[0].app,
         )
 
-        if not data:
-            logger.info(
-                "No payload was generated with subscription for event: %s", event_type
-            )
-            continue
-
-        if (
-            settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS
-            and pre_save_payloads
-        ):
-            key = get_pre_save_payload_key(webhook, subscribable_object)
-            pre_save_payload = pre_save_payloads.get(key)
-            if pre_save_payload and pre_save_payload == data:
+        for subscribable_object, data in zip(subscribable_objects, payloads):
+            if not data:
                 logger.info(
-                    "[Webhook ID:%r] No data changes for event %r, skip delivery to %r",
-                    webhook.id,
+                    "No payload was generated with subscription for event: %s",
                     event_type,
-                    webhook.target_url,
                 )
                 continue
 
-        event_payload = EventPayload(payload=json.dumps({**data}))
-        event_payloads.append(event_payload)
-        event_deliveries.append(
-            EventDelivery(
-                status=EventDeliveryStatus.PENDING,
-                event_type=event_type,
-                payload=event_payload,
-                webhook=webhook,
-            )
-        )
+            event_payload = None
+            for webhook in webhooks_group:
+                if (
+                    settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS
+                    and pre_save_payloads
+                ):
+                    key = get_pre_save_payload_key(webhook, subscribable_object)
+                    pre_save_payload = pre_save_payloads.get(key)
+                    if pre_save_payload and pre_save_payload == data:
+                        logger.info(
+                            "[Webhook ID:%r] No data changes for event %r, skip "
+                            "delivery to %r",
+                            webhook.id,
+                            event_type,
+                            webhook.target_url,
+                        )
+                        continue
+
+                if event_payload is None:
+                    event_payload = EventPayload(payload=json.dumps({**data}))
+                    event_payloads.append(event_payload)
+                event_deliveries.append(
+                    EventDelivery(
+                        status=EventDeliveryStatus.PENDING,
+                        event_type=event_type,
+                        payload=event_payload,
+                        webhook=webhook,
+                    )
+                )
 
     with allow_writer():
         EventPayload.objects.bulk_create(event_payloads)
@@ -217,22 +265,145 @@ def trigger_webhooks_async(
             )
         )
 
+    send_webhook_requests_async(deliveries)
+
+
+def trigger_webhooks_async_for_multiple_objects(
+    event_type,
+    webhooks,
+    subscribable_objects,
+    requestor=None,
+    legacy_data_generator=None,
+    allow_replica=False,
+    pre_save_payloads=None,
+    request_time=None,
+):
+    """Trigger async webhooks of the same event for many objects.
+
+    Subscription queries are executed once per webhook for all objects, so their
+    dataloaders fetch the data of all objects in shared batches.
+
+    :param event_type: used in both webhook types as event type.
+    :param webhooks: used in both webhook types, queryset of async webhooks.
+    :param subscribable_objects: objects for which the event is triggered.
+    :param requestor: used in subscription webhooks to generate metadata for payload.
+    :param legacy_data_generator: called with each of the objects to generate its
+        payload for regular webhooks.
+    :param allow_replica: use a replica database.
+    """
+    subscribable_objects = list(subscribable_objects)
+    regular_webhooks, subscription_webhooks = group_webhooks_by_subscription(webhooks)
+    deliveries = []
+    if regular_webhooks:
+        if legacy_data_generator is None:
+            raise NotImplementedError("No payload was provided for regular webhooks.")
+
+        with allow_writer():
+            for subscribable_object in subscribable_objects:
+                payload = EventPayload.objects.create(
+                    payload=legacy_data_generator(subscribable_object)
+                )
+                deliveries.extend(
+                    create_event_delivery_list_for_webhooks(
+                        webhooks=regular_webhooks,
+                        event_payload=payload,
+                        event_type=event_type,
+                    )
+                )
+    if subscription_webhooks:
+        deliveries.extend(
+            create_deliveries_for_multiple_subscription_objects(
+                event_type=event_type,
+                subscribable_objects=subscribable_objects,
+                webhooks=subscription_webhooks,
+                requestor=requestor,
+                allow_replica=allow_replica,
+                pre_save_payloads=pre_save_payloads,
+                request_time=request_time,
+            )
+        )
+
+    send_webhook_requests_async(deliveries)
+
+
+def send_webhook_requests_async(deliveries: list[EventDelivery]):
+    if settings.WEBHOOK_BATCH_DELIVERY_ENABLED:
+        delivery_ids = [delivery.id for delivery in deliveries]
+        batch_size = settings.WEBHOOK_BATCH_SIZE
+        for index in range(0, len(delivery_ids), batch_size):
+            send_webhook_requests_async_batch.delay(
+                delivery_ids[index : index + batch_size]
+            )
+        return
+
     for delivery in deliveries:
         send_webhook_request_async.delay(delivery.id)
 
 
+def park_webhook_delivery(delivery: EventDelivery, parked_count: int = 0):
+    """Reschedule the delivery without sending it, as the circuit to it is open."""
+    target_url = delivery.webhook.target_url
+    if parked_count >= settings.WEBHOOK_CIRCUIT_BREAKER_MAX_PARKED:
+        delivery_update(delivery, EventDeliveryStatus.FAILED)
+        task_logger.info(
+            "[Webhook ID: %r] Circuit to %r is still open: exceeded park limit. "
+            "Delivery ID: %r",
+            delivery.webhook.id,
+            target_url,
+            delivery.id,
+        )
+        return
+    circuit_breaker.park_delivery(target_url)
+    send_webhook_request_async.apply_async(
+        (delivery.id,),
+        {"parked_count": parked_count + 1},
+        countdown=circuit_breaker.get_park_countdown(target_url),
+    )
+
+
+def park_deliveries_with_open_circuit(
+    deliveries: list[EventDelivery],
+) -> list[EventDelivery]:
+    """Park deliveries to targets with open circuits and return the remaining ones.
+
+    When the circuit to a target is half-open, only the first delivery to it is
+    returned as the probe.
+    """
+    states: dict[str, str] = {}
+    deliveries_to_send = []
+    for delivery in deliveries:
+        target_url = delivery.webhook.target_url
+        host = circuit_breaker.get_circuit_breaker_host(target_url)
+        if host not in states:
+            states[host] = circuit_breaker.acquire_circuit(target_url)
+        elif states[host] == circuit_breaker.CircuitState.HALF_OPEN:
+            states[host] = circuit_breaker.CircuitState.OPEN
+        if states[host] == circuit_breaker.CircuitState.OPEN:
+            park_webhook_delivery(delivery)
+        else:
+            deliveries_to_send.append(delivery)
+    return deliveries_to_send
+
+
 @app.task(
     queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
     bind=True,
     retry_backoff=10,
     retry_kwargs={"max_retries": 5},
 )
-def send_webhook_request_async(self, event_delivery_id):
+def send_webhook_request_async(self, event_delivery_id, parked_count=0):
     delivery = get_delivery_for_webhook(event_delivery_id)
     if not delivery:
         return None
 
     webhook = delivery.webhook
+    if parked_count:
+        circuit_breaker.unpark_delivery(webhook.target_url)
+    circuit_state = circuit_breaker.acquire_circuit(webhook.target_url)
+    if circuit_state == circuit_breaker.CircuitState.OPEN:
+        park_webhook_delivery(delivery, parked_count)
+        return None
+
     domain = get_domain()
     attempt = create_attempt(delivery, self.request.id)
     delivery_status = EventDeliveryStatus.SUCCESS
@@ -251,6 +422,7 @@ def send_webhook_request_async(self, event_delivery_id):
                 data,
                 webhook.custom_headers,
             )
+        circuit_breaker.record_response(webhook.target_url, response)
 
         attempt_update(attempt, response)
         if response.status == EventDeliveryStatus.FAILED:
@@ -273,6 +445,206 @@ def send_webhook_request_async(self, event_delivery_id):
     clear_successful_delivery(delivery)
 
 
+def split_deliveries_into_lanes(
+    deliveries: list[EventDelivery], max_concurrency_per_target: int
+) -> list[list[EventDelivery]]:
+    """Group deliveries by the target URL and split each group into lanes.
+
+    Deliveries from a single lane are sent one after another over the same
+    connection, so the number of lanes of a target limits the number of concurrent
+    requests sent to it.
+    """
+    deliveries_by_target: dict[str, list[EventDelivery]] = defaultdict(list)
+    for delivery in deliveries:
+        deliveries_by_target[delivery.webhook.target_url].append(delivery)
+
+    lanes = []
+    for target_deliveries in deliveries_by_target.values():
+        lanes_count = max(1, min(max_concurrency_per_target, len(target_deliveries)))
+        lanes.extend(
+            target_deliveries[index::lanes_count] for index in range(lanes_count)
+        )
+    return lanes
+
+
+def send_webhook_requests_in_lane(
+    deliveries: list[EventDelivery], domain: str
+) -> list[tuple[EventDelivery, WebhookResponse]]:
+    results = []
+    with HTTPClient.get_session() as session:
+        for delivery in deliveries:
+            webhook = delivery.webhook
+            try:
+                if not delivery.payload:
+                    raise ValueError(
+                        f"Event delivery id: %{delivery.id}r has no payload."
+                    )
+                with webhooks_opentracing_trace(
+                    delivery.event_type, domain, app=webhook.app
+                ):
+                    response = send_webhook_using_scheme_method(
+                        webhook.target_url,
+                        domain,
+                        webhook.secret_key,
+                        delivery.event_type,
+                        delivery.payload.payload,
+                        webhook.custom_headers,
+                        session=session,
+                    )
+            except ValueError as e:
+                response = WebhookResponse(
+                    content=str(e), status=EventDeliveryStatus.FAILED
+                )
+            results.append((delivery, response))
+    return results
+
+
+def send_webhook_requests_concurrently(
+    deliveries: list[EventDelivery], domain: str
+) -> list[tuple[EventDelivery, WebhookResponse]]:
+    """Send webhook requests concurrently, limiting the concurrency per target URL.
+
+    Only the requests are sent from the worker threads; all database operations
+    are made by the caller.
+    """
+    lanes = split_deliveries_into_lanes(
+        deliveries, settings.WEBHOOK_BATCH_MAX_CONCURRENCY_PER_TARGET
+    )
+    if not lanes:
+        return []
+    results = []
+    max_workers = min(settings.WEBHOOK_BATCH_MAX_WORKERS, len(lanes))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for lane_results in executor.map(
+            lambda lane: send_webhook_requests_in_lane(lane, domain), lanes
+        ):
+            results.extend(lane_results)
+    return results
+
+
+def is_webhook_response_retryable(response: WebhookResponse) -> bool:
+    # do not retry for 30x and 40x status codes
+    status_code = response.response_status_code
+    return not (status_code and 300 <= status_code < 500)
+
+
+@app.task(queue=settings.WEBHOOK_CELERY_QUEUE_NAME, bind=True)
+@allow_writer()
+def send_webhook_requests_async_batch(self, event_delivery_ids):
+    """Send pending event deliveries in a single task.
+
+    Deliveries are sent concurrently, grouped by their target URLs, and their
+    attempts and statuses are saved in bulk. Deliveries that failed with a
+    retryable error are handed over to `send_webhook_request_async`, which retries
+    them with its backoff policy.
+    """
+    deliveries = list(
+        EventDelivery.objects.select_related("payload", "webhook__app").filter(
+            id__in=event_delivery_ids, status=EventDeliveryStatus.PENDING
+        )
+    )
+    inactive_deliveries = [d for d in deliveries if not d.webhook.is_active]
+    if inactive_deliveries:
+        EventDelivery.objects.filter(
+            id__in=[delivery.id for delivery in inactive_deliveries]
+        ).update(status=EventDeliveryStatus.FAILED)
+        logger.info(
+            "Event delivery ids: %r webhooks are disabled.",
+            [delivery.id for delivery in inactive_deliveries],
+        )
+    deliveries = [d for d in deliveries if d.webhook.is_active]
+    deliveries = park_deliveries_with_open_circuit(deliveries)
+    if not deliveries:
+        return
+
+    attempts = {
+        attempt.delivery_id: attempt
+        for attempt in EventDeliveryAttempt.objects.bulk_create(
+            [
+                EventDeliveryAttempt(
+                    delivery=delivery,
+                    task_id=self.request.id,
+                    status=EventDeliveryStatus.PENDING,
+                )
+                for delivery in deliveries
+            ]
+        )
+    }
+
+    results = send_webhook_requests_concurrently(deliveries, get_domain())
+
+    retry_countdown = send_webhook_request_async.retry_backoff
+    next_retry = timezone.now() + datetime.timedelta(seconds=retry_countdown)
+    for delivery, response in results:
+        circuit_breaker.record_response(delivery.webhook.target_url, response)
+        attempt = attempts[delivery.id]
+        attempt.duration = response.duration
+        attempt.response = response.content
+        attempt.response_headers = json.dumps(response.response_headers)
+        attempt.response_status_code = response.response_status_code
+        attempt.request_headers = json.dumps(response.request_headers)
+        attempt.status = response.status
+        if response.status == EventDeliveryStatus.SUCCESS:
+            delivery.status = EventDeliveryStatus.SUCCESS
+            task_logger.info(
+                "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+                delivery.webhook.id,
+                delivery.webhook.target_url,
+                delivery.event_type,
+                delivery.id,
+            )
+        elif delivery.payload and is_webhook_response_retryable(response):
+            # Keep the delivery pending; it's retried by the single delivery task.
+            send_webhook_request_async.apply_async(
+                (delivery.id,), countdown=retry_countdown
+            )
+        else:
+            delivery.status = EventDeliveryStatus.FAILED
+            task_logger.info(
+                "[Webhook ID: %r] Failed request to %r: %r for event: %r."
+                " Delivery ID: %r",
+                delivery.webhook.id,
+                delivery.webhook.target_url,
+                response.content,
+                delivery.event_type,
+                delivery.id,
+            )
+
+    EventDeliveryAttempt.objects.bulk_update(
+        attempts.values(),
+        [
+            "duration",
+            "response",
+            "response_headers",
+            "response_status_code",
+            "request_headers",
+            "status",
+        ],
+    )
+    EventDelivery.objects.bulk_update(deliveries, ["status"])
+
+    for delivery, _response in results:
+        attempt = attempts[delivery.id]
+        if delivery.status == EventDeliveryStatus.PENDING:
+            observability.report_event_delivery_attempt(attempt, next_retry)
+        else:
+            observability.report_event_delivery_attempt(attempt)
+
+    successful_deliveries = [
+        delivery
+        for delivery in deliveries
+        if delivery.status == EventDeliveryStatus.SUCCESS
+    ]
+    if successful_deliveries:
+        EventDelivery.objects.filter(
+            id__in=[delivery.id for delivery in successful_deliveries]
+        ).delete()
+        EventPayload.objects.filter(
+            pk__in={delivery.payload_id for delivery in successful_deliveries},
+            deliveries__isnull=True,
+        ).delete()
+
+
 def send_observability_events(webhooks: list[WebhookData], events: list[bytes]):
     event_type = WebhookEventAsyncType.OBSERVABILITY
     for webhook in webhooks:
@@ -0,0 +1,189 @@
+"""Circuit breaker for async webhook deliveries, keyed by the target host.
+
+The breaker opens after `WEBHOOK_CIRCUIT_BREAKER_FAILURE_THRESHOLD` consecutive
+failed requests to the host. While it's open, deliveries to the host are parked,
+which means they are rescheduled without sending any request. When the cooldown
+passes, the breaker is half-open and lets a single probe request through; the
+breaker closes when the probe succeeds, otherwise it opens again with a doubled
+cooldown, up to `WEBHOOK_CIRCUIT_BREAKER_MAX_COOLDOWN`.
+
+The state is kept in the shared cache, so all workers see the same breakers.
+"""
+
+import logging
+from urllib.parse import urlparse
+
+import opentracing
+from django.conf import settings
+from django.core.cache import cache
+
+from ...core import EventDeliveryStatus
+from .utils import WebhookResponse
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_BREAKER_KEY_PREFIX = "webhook_circuit_breaker"
+
+
+class CircuitState:
+    CLOSED = "closed"
+    OPEN = "open"
+    # The breaker is half-open and the caller is allowed to send the probe request.
+    HALF_OPEN = "half_open"
+
+
+def get_circuit_breaker_host(target_url: str) -> str:
+    # Credentials of AWS SQS targets are part of the URL, so only the host and the
+    # port are used to identify the target.
+    parts = urlparse(target_url)
+    host = (parts.hostname or "").lower()
+    return f"{host}:{parts.port}" if parts.port else host
+
+
+def _get_key(host: str, name: str) -> str:
+    return f"{CIRCUIT_BREAKER_KEY_PREFIX}:{name}:{host}"
+
+
+def _get_int(key: str) -> int:
+    value = cache.get(key)
+    return value if isinstance(value, int) else 0
+
+
+def _incr(key: str, delta: int = 1) -> int:
+    cache.add(key, 0, timeout=None)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        # The key expired or was evicted between `add` and `incr`.
+        cache.add(key, delta, timeout=None)
+        return delta
+
+
+def _get_cooldown(trips: int) -> float:
+    cooldown = settings.WEBHOOK_CIRCUIT_BREAKER_COOLDOWN * 2 ** max(trips - 1, 0)
+    return min(cooldown, settings.WEBHOOK_CIRCUIT_BREAKER_MAX_COOLDOWN)
+
+
+def get_circuit_state(target_url: str) -> str:
+    """Return the state of the breaker without claiming the probe request."""
+    if not settings.WEBHOOK_CIRCUIT_BREAKER_ENABLED:
+        return CircuitState.CLOSED
+    host = get_circuit_breaker_host(target_url)
+    if not _get_int(_get_key(host, "trips")):
+        return CircuitState.CLOSED
+    if cache.get(_get_key(host, "cooldown")) or cache.get(_get_key(host, "probe")):
+        return CircuitState.OPEN
+    return CircuitState.HALF_OPEN
+
+
+def acquire_circuit(target_url: str) -> str:
+    """Check whether a request to the target can be sent.
+
+    Return `CircuitState.OPEN` when the delivery should be parked,
+    `CircuitState.HALF_OPEN` when the caller is the one to send the probe request,
+    and `CircuitState.CLOSED` otherwise.
+    """
+    if not settings.WEBHOOK_CIRCUIT_BREAKER_ENABLED:
+        return CircuitState.CLOSED
+    host = get_circuit_breaker_host(target_url)
+    if not _get_int(_get_key(host, "trips")):
+        return CircuitState.CLOSED
+    if cache.get(_get_key(host, "cooldown")):
+        return CircuitState.OPEN
+    # Only one worker can send the probe; it holds the probe key until the probe
+    # result is recorded or the request times out.
+    probe_timeout = sum(settings.WEBHOOK_TIMEOUT)
+    if cache.add(_get_key(host, "probe"), 1, timeout=probe_timeout):
+        return CircuitState.HALF_OPEN
+    return CircuitState.OPEN
+
+
+def is_target_failure(response: WebhookResponse) -> bool:
+    """Return True if the response indicates that the target is unavailable.
+
+    Timeouts, connection errors and 5xx responses count as failures; other
+    responses, including 4xx, prove that the target is up.
+    """
+    status_code = response.response_status_code
+    return status_code is None or status_code >= 500
+
+
+def record_response(target_url: str, response: WebhookResponse):
+    if not settings.WEBHOOK_CIRCUIT_BREAKER_ENABLED:
+        return
+    if response.status != EventDeliveryStatus.FAILED or not is_target_failure(response):
+        record_success(target_url)
+    else:
+        record_failure(target_url)
+
+
+def record_success(target_url: str):
+    host = get_circuit_breaker_host(target_url)
+    if not cache.get(_get_key(host, "failures")) and not cache.get(
+        _get_key(host, "trips")
+    ):
+        return
+    cache.delete_many(
+        [
+            _get_key(host, "failures"),
+            _get_key(host, "trips"),
+            _get_key(host, "cooldown"),
+            _get_key(host, "probe"),
+        ]
+    )
+    logger.info("Webhook circuit breaker for %r closed.", host)
+
+
+def record_failure(target_url: str):
+    host = get_circuit_breaker_host(target_url)
+    failures = _incr(_get_key(host, "failures"))
+    is_probe = cache.get(_get_key(host, "probe")) is not None
+    if not is_probe:
+        if failures < settings.WEBHOOK_CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+            return
+        if cache.get(_get_key(host, "cooldown")):
+            # Requests sent before the breaker opened don't extend the cooldown.
+            return
+    trips = _incr(_get_key(host, "trips"))
+    cooldown = _get_cooldown(trips)
+    cache.set(_get_key(host, "cooldown"), 1, timeout=cooldown)
+    cache.delete(_get_key(host, "probe"))
+    logger.info(
+        "Webhook circuit breaker for %r opened for %ss after %s failures.",
+        host,
+        cooldown,
+        failures,
+    )
+
+
+def get_park_countdown(target_url: str) -> float:
+    """Return the delay after which a parked delivery should be sent again."""
+    host = get_circuit_breaker_host(target_url)
+    return _get_cooldown(_get_int(_get_key(host, "trips")))
+
+
+def park_delivery(target_url: str):
+    host = get_circuit_breaker_host(target_url)
+    parked = _incr(_get_key(host, "parked"))
+    span = opentracing.global_tracer().active_span
+    if span:
+        span.set_tag("webhooks.circuit_breaker.host", host)
+        span.set_tag("webhooks.circuit_breaker.parked", parked)
+
+
+def unpark_delivery(target_url: str):
+    host = get_circuit_breaker_host(target_url)
+    if _get_int(_get_key(host, "parked")) > 0:
+        _incr(_get_key(host, "parked"), -1)
+
+
+def get_circuit_breaker_metrics(target_url: str) -> dict:
+    """Return the state of the breaker and the number of deliveries parked by it."""
+    host = get_circuit_breaker_host(target_url)
+    return {
+        "host": host,
+        "state": get_circuit_state(target_url),
+        "consecutive_failures": _get_int(_get_key(host, "failures")),
+        "trips": _get_int(_get_key(host, "trips")),
+        "parked": _get_int(_get_key(host, "parked")),
+    }
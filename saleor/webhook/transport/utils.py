@@ -10,6 +10,7 @@ from typing import Any, Callable, Optional
 from urllib.parse import unquote, urlparse, urlunparse
 
 import boto3
+import requests
 from botocore.exceptions import ClientError
 from celery import Task
 from celery.exceptions import MaxRetriesExceededError, Retry
@@ -109,6 +110,7 @@ def send_webhook_using_http(
     event_type,
     timeout=settings.WEBHOOK_TIMEOUT,
     custom_headers: Optional[dict[str, str]] = None,
+    session: Optional[requests.Session] = None,
 ) -> WebhookResponse:
     """Send a webhook request using http / https protocol.
 
@@ -119,6 +121,8 @@ def send_webhook_using_http(
     :param event_type: Webhook event type.
     :param timeout: Request timeout.
     :param custom_headers: Custom headers which will be added to request headers.
+    :param session: Session used to send the request, to reuse its connections.
+        When not provided, a new connection is opened for the request.
 
     :return: WebhookResponse object.
     """
@@ -137,15 +141,17 @@ def send_webhook_using_http(
     if custom_headers:
         headers.update(custom_headers)
 
+    request_kwargs = {
+        "data": message,
+        "headers": headers,
+        "timeout": timeout,
+        "allow_redirects": False,
+    }
     try:
-        response = HTTPClient.send_request(
-            "POST",
-            target_url,
-            data=message,
-            headers=headers,
-            timeout=timeout,
-            allow_redirects=False,
-        )
+        if session is not None:
+            response = session.request("POST", target_url, **request_kwargs)
+        else:
+            response = HTTPClient.send_request("POST", target_url, **request_kwargs)
     except RequestException as e:
         if e.response:
             return WebhookResponse(
@@ -270,6 +276,7 @@ def send_webhook_using_scheme_method(
     event_type,
     data,
     custom_headers=None,
+    session=None,
 ) -> WebhookResponse:
     parts = urlparse(target_url)
     message = data if isinstance(data, bytes) else data.encode("utf-8")
@@ -290,6 +297,7 @@ def send_webhook_using_scheme_method(
             signature,
             event_type,
             custom_headers=custom_headers,
+            session=session,
         )
     raise ValueError(f"Unknown webhook scheme: {parts.scheme!r}")
 
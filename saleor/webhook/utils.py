@@ -1,3 +1,5 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional
 
 from django.conf import settings
@@ -5,12 +7,127 @@ from django.db.models import Q
 from django.db.models.expressions import Exists, OuterRef
 
 from ..app.models import App
+from ..core.db.connection import allow_writer
+from ..core.utils.cache import bump_cache_version_on_commit, get_cache_version
 from .event_types import WebhookEventAsyncType, WebhookEventSyncType
 from .models import Webhook, WebhookEvent
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
+WEBHOOK_ROUTING_TABLE_VERSION_KEY = "webhook_routing_table_version"
+
+
+@dataclass
+class WebhookRoute:
+    webhook_id: int
+    app_id: int
+    app_identifier: Optional[str]
+    app_removed: bool
+    app_permissions: set[str] = field(default_factory=set)
+
+
+# (version, {event_type: [WebhookRoute]}) of active webhooks of active apps
+_routing_table: Optional[tuple[int, dict[str, list[WebhookRoute]]]] = None
+
+
+def invalidate_webhook_routing_table():
+    """Invalidate the routing table in every process."""
+    global _routing_table
+
+    bump_cache_version_on_commit(WEBHOOK_ROUTING_TABLE_VERSION_KEY)
+    _routing_table = None
+
+
+def get_webhook_routing_table() -> dict[str, list[WebhookRoute]]:
+    """Return active webhooks grouped by the event type they are subscribed to.
+
+    The table is built with a single query and kept in memory until the version
+    stored in the shared cache changes.
+    """
+    global _routing_table
+
+    version = get_cache_version(WEBHOOK_ROUTING_TABLE_VERSION_KEY)
+    if _routing_table is not None and _routing_table[0] == version:
+        return _routing_table[1]
+
+    # The table is kept until the next change of webhooks, so it's built from the
+    # writer to not cache a state that the replica has not caught up with yet.
+    with allow_writer():
+        rows = list(
+            WebhookEvent.objects.filter(
+                webhook__is_active=True, webhook__app__is_active=True
+            ).values_list(
+                "event_type",
+                "webhook_id",
+                "webhook__app_id",
+                "webhook__app__identifier",
+                "webhook__app__removed_at",
+                "webhook__app__permissions__content_type__app_label",
+                "webhook__app__permissions__codename",
+            )
+        )
+
+    routes: dict[int, WebhookRoute] = {}
+    table: dict[str, list[WebhookRoute]] = defaultdict(list)
+    seen_events = set()
+    for (
+        event_type,
+        webhook_id,
+        app_id,
+        app_identifier,
+        app_removed_at,
+        permission_app_label,
+        permission_codename,
+    ) in rows:
+        route = routes.get(webhook_id)
+        if route is None:
+            route = routes[webhook_id] = WebhookRoute(
+                webhook_id=webhook_id,
+                app_id=app_id,
+                app_identifier=app_identifier,
+                app_removed=app_removed_at is not None,
+            )
+        if permission_codename:
+            route.app_permissions.add(f"{permission_app_label}.{permission_codename}")
+        if (event_type, webhook_id) not in seen_events:
+            seen_events.add((event_type, webhook_id))
+            table[event_type].append(route)
+
+    _routing_table = (version, dict(table))
+    return _routing_table[1]
+
+
+def has_webhooks_for_event(
+    event_type: str,
+    apps_ids: Optional["list[int]"] = None,
+    apps_identifier: Optional[list[str]] = None,
+) -> bool:
+    """Check in memory whether any active webhook is subscribed to the event."""
+    required_permission = WebhookEventAsyncType.PERMISSIONS.get(
+        event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
+    )
+    event_types = [event_type]
+    if event_type in WebhookEventAsyncType.ALL:
+        event_types.append(WebhookEventAsyncType.ANY)
+
+    table = get_webhook_routing_table()
+    for subscribed_event_type in event_types:
+        for route in table.get(subscribed_event_type, []):
+            if route.app_removed and event_type != WebhookEventAsyncType.APP_DELETED:
+                continue
+            if (
+                required_permission
+                and required_permission.value not in route.app_permissions
+            ):
+                continue
+            if apps_ids and route.app_id not in apps_ids:
+                continue
+            if apps_identifier and route.app_identifier not in apps_identifier:
+                continue
+            return True
+    return False
+
 
 def get_webhooks_for_event(
     event_type: str,
@@ -18,7 +135,16 @@ def get_webhooks_for_event(
     apps_ids: Optional["list[int]"] = None,
     apps_identifier: Optional[list[str]] = None,
 ) -> "QuerySet[Webhook]":
-    """Get active webhooks from the database for an event."""
+    """Get active webhooks from the database for an event.
+
+    When nobody listens to the event, an empty queryset is returned without
+    querying the database.
+    """
+    if not has_webhooks_for_event(event_type, apps_ids, apps_identifier):
+        if webhooks is None:
+            return Webhook.objects.none()
+        return webhooks.none()
+
     permissions = {}
     required_permission = WebhookEventAsyncType.PERMISSIONS.get(
         event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)